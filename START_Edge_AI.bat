@@ -39,6 +39,9 @@ if errorlevel 1 (
     exit /b 1
 )
 echo [완료] Python 패키지 설치 완료
+
+REM (선택) DuckDB 분석용 sqlite 확장 설치 - 실행 중에는 LOAD만 수행
+venv\Scripts\python.exe -c "from src.database.db_schema import install_analytics_extensions; install_analytics_extensions()"
 echo.
 
 REM Edge AI Backend 시작
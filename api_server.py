@@ -478,7 +478,8 @@ async def get_vfd_anomaly_history(
         status=status,
         start_date=start_dt,
         end_date=end_dt,
-        limit=limit
+        limit=limit,
+        columns=DatabaseManager.VFD_ANOMALY_COLUMNS
     )
 
     return {
@@ -6,7 +6,7 @@ PLC Simulator와 통신하여 센서 데이터 읽기 및 AI 계산 결과 쓰
 """
 
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # pymodbus 3.x
 from pymodbus.client import ModbusTcpClient
@@ -14,6 +14,45 @@ from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 import config
 
+# Modbus FC03 1회 요청당 최대 레지스터 수 (프로토콜 제한)
+MAX_REGISTERS_PER_READ = 125
+
+# 떨어진 블록 사이 빈 레지스터가 이 개수 이하면 한 번의 요청으로 합쳐 읽기
+READ_GAP_TOLERANCE = 16
+
+
+def plan_read_groups(
+    blocks: Dict[str, Tuple[int, int]],
+    max_gap: int = READ_GAP_TOLERANCE,
+    max_count: int = MAX_REGISTERS_PER_READ
+) -> List[Tuple[int, int]]:
+    """
+    읽을 레지스터 블록들을 연속 구간 요청 목록으로 묶기
+
+    Args:
+        blocks: {이름: (시작 주소, 개수)}
+        max_gap: 병합을 허용하는 빈 레지스터 수
+        max_count: 1회 요청 최대 레지스터 수
+
+    Returns:
+        [(시작 주소, 개수)] - 주소 오름차순
+    """
+    groups = []
+    for start, count in sorted(blocks.values()):
+        end = start + count
+        if groups:
+            group_start, group_end = groups[-1]
+            if start - group_end <= max_gap and max(end, group_end) - group_start <= max_count:
+                groups[-1] = (group_start, max(end, group_end))
+                continue
+        # 단일 블록이 한도를 넘으면 한도 단위로 분할
+        while end - start > max_count:
+            groups.append((start, start + max_count))
+            start += max_count
+        groups.append((start, end))
+
+    return [(start, end - start) for start, end in groups]
+
 
 class EdgeModbusClient:
     """Edge AI용 Modbus TCP 클라이언트"""
@@ -79,21 +118,7 @@ class EdgeModbusClient:
                 print(f"  오류 내용: {result}")
                 return None
 
-            # Raw 값을 실제 값으로 변환
-            sensors = {
-                "TX1": result.registers[0] / 10.0,   # CSW PP Disc Temp (°C)
-                "TX2": result.registers[1] / 10.0,   # No.1 CLR SW Out Temp (°C)
-                "TX3": result.registers[2] / 10.0,   # No.2 CLR SW Out Temp (°C)
-                "TX4": result.registers[3] / 10.0,   # CLR FW In Temp (°C)
-                "TX5": result.registers[4] / 10.0,   # CLR FW Out Temp (°C)
-                "TX6": result.registers[5] / 10.0,   # E/R Inside Temp (°C)
-                "TX7": result.registers[6] / 10.0,   # E/R Outside Temp (°C)
-                "PX1": result.registers[7] / 4608.0,  # CSW PP Disc Press (kg/cm²)
-                "PX2": result.registers[8] / 10.0,  # E/R Diff Press (Pa)
-                "PU1": result.registers[9] / 276.48,  # M/E Load (%)
-            }
-
-            return sensors
+            return self.parse_sensors(result.registers)
 
         except Exception as e:
             print(f"[Edge AI] [ERROR] 센서 읽기 오류: {e}")
@@ -121,6 +146,58 @@ class EdgeModbusClient:
             print(f"[Edge AI] [ERROR] 레지스터 읽기 오류 (addr={address}, count={count}): {e}")
             return None
 
+    def read_register_blocks(self, blocks: Dict[str, Tuple[int, int]]) -> Optional[Dict[str, Optional[List[int]]]]:
+        """
+        여러 레지스터 블록을 연속 구간으로 묶어 최소 요청 수로 읽기
+
+        Args:
+            blocks: {이름: (시작 주소, 개수)}
+
+        Returns:
+            {이름: 레지스터 리스트} - 해당 구간 읽기 실패 시 값은 None
+        """
+        if not self.connected:
+            return None
+
+        groups = []
+        for start, count in plan_read_groups(blocks):
+            groups.append((start, start + count, self.read_holding_registers(start, count)))
+
+        result = {}
+        for name, (start, count) in blocks.items():
+            values = []
+            address = start
+            end = start + count
+            for group_start, group_end, registers in groups:
+                if group_start <= address < group_end:
+                    if registers is None:
+                        values = None
+                        break
+                    stop = min(end, group_end)
+                    values.extend(registers[address - group_start:stop - group_start])
+                    address = stop
+                    if address >= end:
+                        break
+            result[name] = values
+
+        return result
+
+    @staticmethod
+    def parse_sensors(registers: List[int]) -> Dict[str, float]:
+        """센서 레지스터(10-19) Raw 값을 실제 값으로 변환"""
+        return {
+            "TX1": registers[0] / 10.0,   # CSW PP Disc Temp (°C)
+            "TX2": registers[1] / 10.0,   # No.1 CLR SW Out Temp (°C)
+            "TX3": registers[2] / 10.0,   # No.2 CLR SW Out Temp (°C)
+            "TX4": registers[3] / 10.0,   # CLR FW In Temp (°C)
+            "TX5": registers[4] / 10.0,   # CLR FW Out Temp (°C)
+            "TX6": registers[5] / 10.0,   # E/R Inside Temp (°C)
+            "TX7": registers[6] / 10.0,   # E/R Outside Temp (°C)
+            "PX1": registers[7] / 4608.0,  # CSW PP Disc Press (kg/cm²)
+            "PX2": registers[8] / 10.0,  # E/R Diff Press (Pa)
+            "PU1": registers[9] / 276.48,  # M/E Load (%)
+        }
+
     def write_holding_registers(self, address: int, values: List[int]) -> bool:
         """PLC에 Holding Register 쓰기 (범용 메서드)"""
         if not self.connected:
@@ -149,126 +226,145 @@ class EdgeModbusClient:
             return None
 
         try:
-            # 장비 상태 비트 읽기 (레지스터 4000-4001)
-            status_result = self.client.read_holding_registers(
-                address=config.MODBUS_REGISTERS["EQUIPMENT_STATUS_START"],
-                count=config.MODBUS_REGISTERS["EQUIPMENT_STATUS_COUNT"],
-                device_id=self.slave_id
-            )
-
-            if status_result.isError():
-                print(f"[Edge AI] [ERROR] 장비 상태 읽기 실패: {status_result}")
+            # 장비 상태 비트(4000-4001)와 VFD 데이터(160-359)를 묶음 요청으로 읽기
+            # (Modbus 1회 최대 125개 레지스터 제한에 맞춰 자동 분할)
+            vfd_count = len(config.EQUIPMENT_LIST) * config.MODBUS_REGISTERS["VFD_DATA_PER_EQUIPMENT"]
+            registers = self.read_register_blocks({
+                "status": (
+                    config.MODBUS_REGISTERS["EQUIPMENT_STATUS_START"],
+                    config.MODBUS_REGISTERS["EQUIPMENT_STATUS_COUNT"]
+                ),
+                "vfd": (config.MODBUS_REGISTERS["VFD_DATA_START"], vfd_count),
+            })
+
+            if registers["status"] is None:
+                print(f"[Edge AI] [ERROR] 장비 상태 읽기 실패")
                 return None
 
-            # VFD 데이터 읽기 (레지스터 160-359, 10개 장비 × 20 레지스터)
-            # Modbus는 한 번에 최대 125개 레지스터만 읽을 수 있으므로 두 번에 나눠 읽기
-            vfd_start = config.MODBUS_REGISTERS["VFD_DATA_START"]
-            regs_per_equip = config.MODBUS_REGISTERS["VFD_DATA_PER_EQUIPMENT"]
-
-            # 첫 번째 읽기: 장비 0-5 (SWP1-3, FWP1-3) = 120 레지스터
-            vfd_result1 = self.client.read_holding_registers(
-                address=vfd_start,
-                count=6 * regs_per_equip,  # 120 레지스터
-                device_id=self.slave_id
-            )
-
-            if vfd_result1.isError():
-                print(f"[Edge AI] [ERROR] VFD 데이터 읽기 실패 (파트1): {vfd_result1}")
+            if registers["vfd"] is None:
+                print(f"[Edge AI] [ERROR] VFD 데이터 읽기 실패")
                 return None
 
-            # 두 번째 읽기: 장비 6-9 (FAN1-4) = 80 레지스터
-            vfd_result2 = self.client.read_holding_registers(
-                address=vfd_start + 6 * regs_per_equip,
-                count=4 * regs_per_equip,  # 80 레지스터
-                device_id=self.slave_id
-            )
-
-            if vfd_result2.isError():
-                print(f"[Edge AI] [ERROR] VFD 데이터 읽기 실패 (파트2): {vfd_result2}")
-                return None
-
-            # 두 결과 합치기
-            vfd_registers = vfd_result1.registers + vfd_result2.registers
-
-            # 장비 데이터 파싱
-            equipment_list = []
-            status_word0 = status_result.registers[0]
-            status_word1 = status_result.registers[1]
-
-            for i, eq_name in enumerate(config.EQUIPMENT_LIST):
-                vfd_offset = i * config.MODBUS_REGISTERS["VFD_DATA_PER_EQUIPMENT"]
-                vfd_data = vfd_registers[vfd_offset:vfd_offset + 20]
-
-                # VFD 진단 데이터 파싱 (확장된 20개 레지스터)
-                # [0] frequency, [1] power, [2] avg_power
-                # [3] motor_current, [4] motor_thermal, [5] heatsink_temp
-                # [6] torque, [7] inverter_thermal, [8] system_temp
-                # [9-10] kwh_counter (32bit), [11] num_starts, [12] over_temps
-                # [13-15] phase_u/v/w_current, [16] warning_word, [17] dc_link_voltage
-                # [18-19] run_hours (32bit)
-
-                vfd_diagnosis = {
-                    "frequency": vfd_data[0] / 10.0,           # Hz
-                    "power": vfd_data[1],                       # kW
-                    "avg_power": vfd_data[2],                   # kW
-                    "motor_current": vfd_data[3] / 10.0,        # A
-                    "motor_thermal": vfd_data[4],               # %
-                    "heatsink_temp": vfd_data[5],               # °C
-                    "torque": vfd_data[6],                      # Nm
-                    "inverter_thermal": vfd_data[7],            # %
-                    "system_temp": vfd_data[8],                 # °C
-                    "kwh_counter": (vfd_data[10] << 16) | vfd_data[9],  # kWh
-                    "num_starts": vfd_data[11],                 # 회
-                    "over_temps": vfd_data[12],                 # 회
-                    "phase_u_current": vfd_data[13] / 10.0,     # A
-                    "phase_v_current": vfd_data[14] / 10.0,     # A
-                    "phase_w_current": vfd_data[15] / 10.0,     # A
-                    "warning_word": vfd_data[16],               # 비트 플래그
-                    "dc_link_voltage": vfd_data[17],            # V
-                    "run_hours": (vfd_data[19] << 16) | vfd_data[18],  # 시간
-                }
-
-                # 장비 상태 비트 추출
-                if i < 6:  # Pumps
-                    bit_offset = i * 3
-                    if i < 5:
-                        running = bool(status_word0 & (1 << bit_offset))
-                        ess_mode = bool(status_word0 & (1 << (bit_offset + 1)))
-                        abnormal = bool(status_word0 & (1 << (bit_offset + 2)))
-                    else:  # FWP3
-                        running = bool(status_word0 & (1 << 15))
-                        ess_mode = bool(status_word1 & (1 << 0))
-                        abnormal = bool(status_word1 & (1 << 1))
-
-                    equipment_list.append({
-                        "name": eq_name,
-                        "running": running,
-                        "ess_mode": ess_mode,
-                        "abnormal": abnormal,
-                        **vfd_diagnosis  # VFD 진단 데이터 포함
-                    })
-
-                else:  # Fans (FAN1-4)
-                    fan_idx = i - 6
-                    bit_offset = 2 + fan_idx * 3
-                    running_fwd = bool(status_word1 & (1 << bit_offset))
-                    running_bwd = bool(status_word1 & (1 << (bit_offset + 1)))
-                    abnormal = bool(status_word1 & (1 << (bit_offset + 2)))
-
-                    equipment_list.append({
-                        "name": eq_name,
-                        "running_fwd": running_fwd,
-                        "running_bwd": running_bwd,
-                        "abnormal": abnormal,
-                        **vfd_diagnosis  # VFD 진단 데이터 포함
-                    })
-
-            return equipment_list
+            return self.parse_equipment_status(registers["status"], registers["vfd"])
 
         except Exception as e:
             print(f"[Edge AI] [ERROR] 장비 데이터 읽기 오류: {e}")
             return None
 
+    @staticmethod
+    def parse_equipment_status(status_registers: List[int], vfd_registers: List[int]) -> List[Dict]:
+        """장비 상태 비트(2개)와 VFD 데이터(장비당 20개) 레지스터를 장비별 딕셔너리로 변환"""
+        equipment_list = []
+        status_word0 = status_registers[0]
+        status_word1 = status_registers[1]
+
+        for i, eq_name in enumerate(config.EQUIPMENT_LIST):
+            vfd_offset = i * config.MODBUS_REGISTERS["VFD_DATA_PER_EQUIPMENT"]
+            vfd_data = vfd_registers[vfd_offset:vfd_offset + 20]
+
+            # VFD 진단 데이터 파싱 (확장된 20개 레지스터)
+            # [0] frequency, [1] power, [2] avg_power
+            # [3] motor_current, [4] motor_thermal, [5] heatsink_temp
+            # [6] torque, [7] inverter_thermal, [8] system_temp
+            # [9-10] kwh_counter (32bit), [11] num_starts, [12] over_temps
+            # [13-15] phase_u/v/w_current, [16] warning_word, [17] dc_link_voltage
+            # [18-19] run_hours (32bit)
+
+            vfd_diagnosis = {
+                "frequency": vfd_data[0] / 10.0,           # Hz
+                "power": vfd_data[1],                       # kW
+                "avg_power": vfd_data[2],                   # kW
+                "motor_current": vfd_data[3] / 10.0,        # A
+                "motor_thermal": vfd_data[4],               # %
+                "heatsink_temp": vfd_data[5],               # °C
+                "torque": vfd_data[6],                      # Nm
+                "inverter_thermal": vfd_data[7],            # %
+                "system_temp": vfd_data[8],                 # °C
+                "kwh_counter": (vfd_data[10] << 16) | vfd_data[9],  # kWh
+                "num_starts": vfd_data[11],                 # 회
+                "over_temps": vfd_data[12],                 # 회
+                "phase_u_current": vfd_data[13] / 10.0,     # A
+                "phase_v_current": vfd_data[14] / 10.0,     # A
+                "phase_w_current": vfd_data[15] / 10.0,     # A
+                "warning_word": vfd_data[16],               # 비트 플래그
+                "dc_link_voltage": vfd_data[17],            # V
+                "run_hours": (vfd_data[19] << 16) | vfd_data[18],  # 시간
+            }
+
+            # 장비 상태 비트 추출
+            if i < 6:  # Pumps
+                bit_offset = i * 3
+                if i < 5:
+                    running = bool(status_word0 & (1 << bit_offset))
+                    ess_mode = bool(status_word0 & (1 << (bit_offset + 1)))
+                    abnormal = bool(status_word0 & (1 << (bit_offset + 2)))
+                else:  # FWP3
+                    running = bool(status_word0 & (1 << 15))
+                    ess_mode = bool(status_word1 & (1 << 0))
+                    abnormal = bool(status_word1 & (1 << 1))
+
+                equipment_list.append({
+                    "name": eq_name,
+                    "running": running,
+                    "ess_mode": ess_mode,
+                    "abnormal": abnormal,
+                    **vfd_diagnosis  # VFD 진단 데이터 포함
+                })
+
+            else:  # Fans (FAN1-4)
+                fan_idx = i - 6
+                bit_offset = 2 + fan_idx * 3
+                running_fwd = bool(status_word1 & (1 << bit_offset))
+                running_bwd = bool(status_word1 & (1 << (bit_offset + 1)))
+                abnormal = bool(status_word1 & (1 << (bit_offset + 2)))
+
+                equipment_list.append({
+                    "name": eq_name,
+                    "running_fwd": running_fwd,
+                    "running_bwd": running_bwd,
+                    "abnormal": abnormal,
+                    **vfd_diagnosis  # VFD 진단 데이터 포함
+                })
+
+        return equipment_list
+
+    def read_plc_snapshot(self) -> Optional[Dict]:
+        """
+        센서 / 장비 상태 / VFD 데이터 / AI 목표 주파수를 묶음 요청으로 한 번에 읽기
+
+        Returns:
+            {
+                'sensors': 센서 딕셔너리,
+                'equipment': 장비 리스트,
+                'target_frequencies_raw': AI 목표 주파수 (Hz × 10) 10개
+            }
+            - 구간 읽기 실패 시 해당 항목은 None
+        """
+        if not self.connected:
+            return None
+
+        vfd_count = len(config.EQUIPMENT_LIST) * config.MODBUS_REGISTERS["VFD_DATA_PER_EQUIPMENT"]
+        registers = self.read_register_blocks({
+            "sensors": (config.MODBUS_REGISTERS["SENSORS_START"], config.MODBUS_REGISTERS["SENSORS_COUNT"]),
+            "status": (
+                config.MODBUS_REGISTERS["EQUIPMENT_STATUS_START"],
+                config.MODBUS_REGISTERS["EQUIPMENT_STATUS_COUNT"]
+            ),
+            "vfd": (config.MODBUS_REGISTERS["VFD_DATA_START"], vfd_count),
+            "target_freq": (config.MODBUS_REGISTERS["AI_TARGET_FREQ_START"], 10),
+        })
+
+        sensors = registers["sensors"]
+        equipment = None
+        if registers["status"] is not None and registers["vfd"] is not None:
+            equipment = self.parse_equipment_status(registers["status"], registers["vfd"])
+
+        return {
+            'sensors': self.parse_sensors(sensors) if sensors is not None else None,
+            'equipment': equipment,
+            'target_frequencies_raw': registers["target_freq"]
+        }
+
     def write_ai_target_frequency(self, target_frequencies: List[float]) -> bool:
         """AI 목표 주파수를 PLC에 쓰기 (레지스터 5000-5009)"""
         if not self.connected:
@@ -456,29 +552,18 @@ class EdgeModbusClient:
             return None
 
         try:
-            # 건강도 점수 읽기 (레지스터 5200-5209)
-            scores_result = self.client.read_holding_registers(
-                address=config.MODBUS_REGISTERS["AI_VFD_DIAGNOSIS_START"],
-                count=10,
-                device_id=self.slave_id
-            )
-
-            if scores_result.isError():
-                return None
-
-            # 중증도 레벨 읽기 (레지스터 5210-5219)
-            levels_result = self.client.read_holding_registers(
-                address=config.MODBUS_REGISTERS["AI_VFD_SEVERITY_START"],
-                count=10,
-                device_id=self.slave_id
-            )
+            # 건강도 점수(5200-5209) + 중증도 레벨(5210-5219) - 인접 구간이므로 1회 요청으로 읽기
+            registers = self.read_register_blocks({
+                "scores": (config.MODBUS_REGISTERS["AI_VFD_DIAGNOSIS_START"], 10),
+                "levels": (config.MODBUS_REGISTERS["AI_VFD_SEVERITY_START"], 10),
+            })
 
-            if levels_result.isError():
+            if registers["scores"] is None or registers["levels"] is None:
                 return None
 
             return {
-                'health_scores': list(scores_result.registers),
-                'severity_levels': list(levels_result.registers)
+                'health_scores': registers["scores"],
+                'severity_levels': registers["levels"]
             }
 
         except Exception as e:
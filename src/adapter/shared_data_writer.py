@@ -3,17 +3,41 @@
 EDGE AI 분석 결과를 공유 JSON 파일에 저장하여 HMI와 데이터 교환
 """
 
+import hashlib
 import json
 import logging
+import os
 from typing import Dict, Any
 from pathlib import Path
 from datetime import datetime
 from src.diagnostics.vfd_monitor import VFDDiagnostic
 from src.diagnostics.vfd_predictive_diagnosis import VFDPrediction
 
+# orjson (선택 사항 - JSON 직렬화 가속, 미설치 시 표준 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: Any, indent: bool = True, sort_keys: bool = False) -> bytes:
+    """JSON 직렬화 (UTF-8 bytes, orjson 설치 시 orjson 사용)"""
+    if ORJSON_AVAILABLE:
+        # numpy 스칼라(예측값 np.float64 등)와 float 하위 타입도 표준 json처럼 숫자로 저장
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, default=float, option=option)
+    return json.dumps(
+        data, ensure_ascii=False, indent=2 if indent else None, sort_keys=sort_keys
+    ).encode('utf-8')
+
+
 class SharedDataWriter:
     """공유 데이터 파일 Writer (EDGE → HMI)"""
 
@@ -28,6 +52,8 @@ class SharedDataWriter:
         self.shared_dir.mkdir(parents=True, exist_ok=True)
 
         self.vfd_diagnostics_file = self.shared_dir / "vfd_diagnostics.json"
+        # 마지막으로 저장한 VFD 진단 내용 해시 (변경 없으면 쓰기 생략)
+        self._last_vfd_diagnostics_hash = None
 
         logger.info(f"✅ 공유 데이터 Writer 초기화: {self.shared_dir}")
 
@@ -113,10 +139,18 @@ class SharedDataWriter:
 
             data["vfd_diagnostics"][vfd_id] = vfd_data
 
-        # JSON 파일로 저장
         try:
-            with open(self.vfd_diagnostics_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 진단 내용이 마지막 저장과 같으면 쓰기 생략 (최상위 timestamp 제외)
+            content_hash = hashlib.blake2b(
+                _dumps(data["vfd_diagnostics"], indent=False, sort_keys=True), digest_size=16
+            ).digest()
+            if content_hash == self._last_vfd_diagnostics_hash:
+                logger.debug("VFD 진단 데이터 변경 없음 - 저장 생략")
+                return
+
+            # JSON 파일로 저장
+            self._write_json_atomic(self.vfd_diagnostics_file, data)
+            self._last_vfd_diagnostics_hash = content_hash
 
             logger.debug(f"✅ VFD 진단 데이터 저장 완료: {len(diagnostics)}개 VFD")
 
@@ -134,13 +168,26 @@ class SharedDataWriter:
         status_file = self.shared_dir / f"{key}.json"
 
         try:
-            with open(status_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "timestamp": datetime.now().isoformat(),
-                    "value": value
-                }, f, ensure_ascii=False, indent=2)
+            self._write_json_atomic(status_file, {
+                "timestamp": datetime.now().isoformat(),
+                "value": value
+            })
 
             logger.debug(f"✅ 상태 데이터 저장: {key}")
 
         except Exception as e:
             logger.error(f"❌ 상태 데이터 저장 실패 ({key}): {e}")
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Dict):
+        """
+        임시 파일에 쓴 뒤 교체 (HMI가 쓰는 도중의 불완전한 파일을 읽지 않도록)
+
+        Args:
+            path: 대상 파일 경로
+            data: 저장할 데이터
+        """
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(data))
+        os.replace(tmp_path, path)
@@ -11,15 +11,40 @@ import json
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from contextlib import contextmanager
 
+from src.database.db_schema import AnalyticsReader
+
+# DuckDB (선택 사항 - 분석 쿼리 가속)
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
 class DatabaseManager:
     """Edge Computer 데이터베이스 관리자"""
 
+    # vfd_anomaly_history 조회 가능 컬럼 (SELECT 절 화이트리스트)
+    VFD_ANOMALY_COLUMNS = (
+        'anomaly_id', 'equipment_id', 'occurred_at',
+        'severity_level', 'severity_name', 'health_score', 'total_severity_score',
+        'motor_thermal', 'heatsink_temp', 'inverter_thermal', 'motor_current',
+        'current_imbalance', 'warning_word', 'over_temps', 'recommendations',
+        'status', 'acknowledged_at', 'acknowledged_by', 'cleared_at', 'cleared_by',
+        'duration_minutes', 'created_at'
+    )
+
+    # 기본 조회 컬럼 (대시보드 히스토리 테이블 표시용)
+    DEFAULT_VFD_ANOMALY_COLUMNS = (
+        'anomaly_id', 'equipment_id', 'occurred_at', 'severity_level', 'severity_name',
+        'health_score', 'status', 'duration_minutes', 'recommendations'
+    )
+
     def __init__(self, db_dir: str = "data"):
         """
         초기화
@@ -32,6 +57,9 @@ class DatabaseManager:
 
         self.db_path = self.db_dir / "edge_computer.db"
 
+        # DuckDB 분석 연결 (최초 사용 시 생성, 미설치/실패 시 SQLite로 집계)
+        self._analytics = AnalyticsReader(str(self.db_path))
+
         # 테이블 초기화
         self._init_database()
 
@@ -231,10 +259,11 @@ class DatabaseManager:
             """)
 
             # 11. VFD 이상 징후 히스토리 테이블 (센서 알람과 별도 관리)
+            # anomaly_id 단일 키 조회 → WITHOUT ROWID로 인덱스/테이블 B-tree 통합
+            # (기존 DB는 그대로 유지, 신규 DB에만 적용)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS vfd_anomaly_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    anomaly_id TEXT UNIQUE NOT NULL,
+                    anomaly_id TEXT PRIMARY KEY NOT NULL,
                     equipment_id TEXT NOT NULL,
                     occurred_at DATETIME NOT NULL,
                     severity_level INTEGER NOT NULL,
@@ -256,7 +285,7 @@ class DatabaseManager:
                     cleared_by TEXT,
                     duration_minutes INTEGER,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
+                ) WITHOUT ROWID
             """)
 
             # 10. 사용자 테이블
@@ -824,8 +853,8 @@ class DatabaseManager:
         warning_word: int = None,
         over_temps: int = None,
         recommendations: str = None
-    ) -> int:
-        """VFD 이상 징후 저장"""
+    ) -> str:
+        """VFD 이상 징후 저장 (anomaly_id 반환)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -842,7 +871,7 @@ class DatabaseManager:
                 over_temps, recommendations
             ))
             logger.info(f"VFD 이상 징후 저장: {anomaly_id} ({equipment_id})")
-            return cursor.lastrowid
+            return anomaly_id
 
     def acknowledge_vfd_anomaly(self, anomaly_id: str, user: str = "Operator"):
         """VFD 이상 징후 확인 처리"""
@@ -861,22 +890,13 @@ class DatabaseManager:
             cursor = conn.cursor()
             now = datetime.now()
 
-            # 발생 시간 조회 후 지속 시간 계산
-            cursor.execute(
-                "SELECT occurred_at FROM vfd_anomaly_history WHERE anomaly_id = ?",
-                (anomaly_id,)
-            )
-            row = cursor.fetchone()
-            duration = None
-            if row:
-                occurred_at = datetime.fromisoformat(row['occurred_at'])
-                duration = int((now - occurred_at).total_seconds() / 60)
-
+            # 단일 UPDATE (발생 시간 기준 지속 시간은 SQLite에서 계산)
             cursor.execute("""
                 UPDATE vfd_anomaly_history
-                SET status = 'CLEARED', cleared_at = ?, cleared_by = ?, duration_minutes = ?
+                SET status = 'CLEARED', cleared_at = ?, cleared_by = ?,
+                    duration_minutes = (strftime('%s', ?) - strftime('%s', occurred_at)) / 60
                 WHERE anomaly_id = ? AND status IN ('ACTIVE', 'ACKNOWLEDGED')
-            """, (now, user, duration, anomaly_id))
+            """, (now, user, now, anomaly_id))
             logger.info(f"VFD 이상 징후 해제: {anomaly_id}")
 
     def auto_clear_vfd_anomaly(self, anomaly_id: str):
@@ -885,21 +905,12 @@ class DatabaseManager:
             cursor = conn.cursor()
             now = datetime.now()
 
-            cursor.execute(
-                "SELECT occurred_at FROM vfd_anomaly_history WHERE anomaly_id = ?",
-                (anomaly_id,)
-            )
-            row = cursor.fetchone()
-            duration = None
-            if row:
-                occurred_at = datetime.fromisoformat(row['occurred_at'])
-                duration = int((now - occurred_at).total_seconds() / 60)
-
             cursor.execute("""
                 UPDATE vfd_anomaly_history
-                SET status = 'AUTO_CLEARED', cleared_at = ?, cleared_by = 'System', duration_minutes = ?
+                SET status = 'AUTO_CLEARED', cleared_at = ?, cleared_by = 'System',
+                    duration_minutes = (strftime('%s', ?) - strftime('%s', occurred_at)) / 60
                 WHERE anomaly_id = ? AND status IN ('ACTIVE', 'ACKNOWLEDGED')
-            """, (now, duration, anomaly_id))
+            """, (now, now, anomaly_id))
             logger.info(f"VFD 이상 징후 자동 해제: {anomaly_id}")
 
     def get_vfd_anomaly_history(
@@ -908,13 +919,23 @@ class DatabaseManager:
         status: str = None,
         start_date: datetime = None,
         end_date: datetime = None,
-        limit: int = 100
+        limit: int = 100,
+        columns: Sequence[str] = DEFAULT_VFD_ANOMALY_COLUMNS
     ) -> List[Dict]:
-        """VFD 이상 징후 히스토리 조회"""
+        """
+        VFD 이상 징후 히스토리 조회
+
+        Args:
+            columns: 조회할 컬럼 (VFD_ANOMALY_COLUMNS 중 선택)
+        """
+        invalid = [c for c in columns if c not in self.VFD_ANOMALY_COLUMNS]
+        if invalid or not columns:
+            raise ValueError(f"조회할 수 없는 컬럼: {invalid or columns}")
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            query = "SELECT * FROM vfd_anomaly_history WHERE 1=1"
+            query = f"SELECT {', '.join(columns)} FROM vfd_anomaly_history WHERE 1=1"
             params = []
 
             if equipment_id:
@@ -947,61 +968,77 @@ class DatabaseManager:
             return [dict(row) for row in cursor.fetchall()]
 
     def get_vfd_anomaly_statistics(self, days: int = 30) -> Dict:
-        """VFD 이상 징후 통계"""
+        """VFD 이상 징후 통계 (DuckDB 사용 가능 시 분석 연결, 쿼리 실패 시 SQLite로 재시도)"""
         start_date = datetime.now() - timedelta(days=days)
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # 전체 이상 징후 수
-            cursor.execute("""
-                SELECT COUNT(*) FROM vfd_anomaly_history WHERE occurred_at >= ?
-            """, (start_date,))
-            total = cursor.fetchone()[0]
-
-            # 활성 이상 징후 수
-            cursor.execute("""
-                SELECT COUNT(*) FROM vfd_anomaly_history
-                WHERE status IN ('ACTIVE', 'ACKNOWLEDGED')
-            """)
-            active = cursor.fetchone()[0]
+        cursor = self._analytics.cursor()
+        if cursor is not None:
+            try:
+                return self._query_vfd_anomaly_statistics(
+                    cursor, "app.vfd_anomaly_history", start_date, days
+                )
+            except duckdb.Error as e:
+                logger.warning(f"⚠️ DuckDB 집계 실패 - SQLite로 재시도: {e}")
+            finally:
+                cursor.close()
 
-            # 중증도별 통계
-            cursor.execute("""
-                SELECT severity_level, COUNT(*) as count
-                FROM vfd_anomaly_history
-                WHERE occurred_at >= ?
-                GROUP BY severity_level
-            """, (start_date,))
-            by_severity = {row['severity_level']: row['count'] for row in cursor.fetchall()}
-
-            # 장비별 통계
-            cursor.execute("""
-                SELECT equipment_id, COUNT(*) as count
-                FROM vfd_anomaly_history
-                WHERE occurred_at >= ?
-                GROUP BY equipment_id
-                ORDER BY count DESC
-            """, (start_date,))
-            by_equipment = {row['equipment_id']: row['count'] for row in cursor.fetchall()}
-
-            # 평균 지속 시간
-            cursor.execute("""
-                SELECT AVG(duration_minutes) as avg_duration
-                FROM vfd_anomaly_history
-                WHERE duration_minutes IS NOT NULL AND occurred_at >= ?
-            """, (start_date,))
-            row = cursor.fetchone()
-            avg_duration = row['avg_duration'] if row and row['avg_duration'] else 0
+        with self.get_connection() as conn:
+            return self._query_vfd_anomaly_statistics(
+                conn.cursor(), "vfd_anomaly_history", start_date, days
+            )
 
-            return {
-                "period_days": days,
-                "total_anomalies": total,
-                "active_anomalies": active,
-                "by_severity": by_severity,
-                "by_equipment": by_equipment,
-                "avg_duration_minutes": round(avg_duration, 1)
-            }
+    @staticmethod
+    def _query_vfd_anomaly_statistics(cursor, table: str, start_date: datetime, days: int) -> Dict:
+        """VFD 이상 징후 통계 집계 (DuckDB/SQLite 공통, 결과 행은 위치로 접근)"""
+        # 전체 이상 징후 수
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM {table} WHERE occurred_at >= ?
+        """, (start_date,))
+        total = cursor.fetchone()[0]
+
+        # 활성 이상 징후 수
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM {table}
+            WHERE status IN ('ACTIVE', 'ACKNOWLEDGED')
+        """)
+        active = cursor.fetchone()[0]
+
+        # 중증도별 통계
+        cursor.execute(f"""
+            SELECT severity_level, COUNT(*) as count
+            FROM {table}
+            WHERE occurred_at >= ?
+            GROUP BY severity_level
+        """, (start_date,))
+        by_severity = {row[0]: row[1] for row in cursor.fetchall()}
+
+        # 장비별 통계
+        cursor.execute(f"""
+            SELECT equipment_id, COUNT(*) as count
+            FROM {table}
+            WHERE occurred_at >= ?
+            GROUP BY equipment_id
+            ORDER BY count DESC
+        """, (start_date,))
+        by_equipment = {row[0]: row[1] for row in cursor.fetchall()}
+
+        # 평균 지속 시간
+        cursor.execute(f"""
+            SELECT AVG(duration_minutes) as avg_duration
+            FROM {table}
+            WHERE duration_minutes IS NOT NULL AND occurred_at >= ?
+        """, (start_date,))
+        row = cursor.fetchone()
+        avg_duration = row[0] if row and row[0] else 0
+
+        return {
+            "period_days": days,
+            "total_anomalies": total,
+            "active_anomalies": active,
+            "by_severity": by_severity,
+            "by_equipment": by_equipment,
+            "avg_duration_minutes": round(avg_duration, 1)
+        }
 
     # ==================== ESS 누적 데이터 ====================
 
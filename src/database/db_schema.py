@@ -4,14 +4,144 @@ SQLite 데이터베이스 스키마 정의
 """
 
 import sqlite3
+import logging
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 import os
+import threading
+
+import numpy as np
+
+# DuckDB (선택 사항 - 분석 쿼리 가속)
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def install_analytics_extensions() -> bool:
+    """
+    DuckDB sqlite 확장 설치 (설치 단계에서 1회 실행)
+
+    실행 중에는 LOAD만 수행하므로 네트워크 다운로드가 필요한 INSTALL은
+    배포/설치 스크립트에서 미리 실행한다.
+
+    Returns:
+        설치 성공 여부 (DuckDB 미설치 시 False)
+    """
+    if not DUCKDB_AVAILABLE:
+        return False
+
+    try:
+        duckdb.connect(':memory:').execute("INSTALL sqlite")
+    except duckdb.Error as e:
+        logger.warning(f"⚠️ DuckDB sqlite 확장 설치 실패 - SQLite로 집계: {e}")
+        return False
+    return True
+
+
+class AnalyticsReader:
+    """
+    DuckDB 분석 연결 (SQLite 파일을 app 스키마로 읽기 전용 ATTACH)
+
+    최초 사용 시 1회 생성하며, DuckDB 미설치/연결 실패 시 cursor()는 None을 반환한다.
+    sqlite 확장은 설치 단계(install_analytics_extensions)에서 설치되어 있어야 하며,
+    여기서는 LOAD만 한다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._connection = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def cursor(self):
+        """
+        분석용 cursor 획득
+
+        Returns:
+            DuckDB cursor (스레드별), 미설치/실패 시 None
+        """
+        if not DUCKDB_AVAILABLE or self._failed:
+            return None
+
+        if self._connection is None:
+            with self._lock:
+                if self._failed:
+                    return None
+                if self._connection is None:
+                    try:
+                        connection = duckdb.connect(
+                            ':memory:', config={'autoinstall_known_extensions': False}
+                        )
+                        connection.execute("LOAD sqlite")
+                        db_path = os.path.abspath(self.db_path).replace("'", "''")
+                        connection.execute(f"ATTACH '{db_path}' AS app (TYPE SQLITE, READ_ONLY)")
+                    except duckdb.Error as e:
+                        logger.warning(f"⚠️ DuckDB 분석 연결 실패 - SQLite로 집계: {e}")
+                        self._failed = True
+                        return None
+                    self._connection = connection
+
+        return self._connection.cursor()
 
 
 class DatabaseManager:
     """데이터베이스 관리자"""
 
+    # 조회 가능한 컬럼 (SELECT 절 화이트리스트)
+    SENSOR_DATA_COLUMNS = (
+        'id', 'timestamp', 'T1', 'T2', 'T3', 'T4', 'T5', 'T6', 'T7', 'PX1',
+        'engine_load', 'latitude', 'longitude', 'speed', 'heading', 'created_at'
+    )
+    PERFORMANCE_METRICS_COLUMNS = (
+        'id', 'timestamp', 'period',
+        'energy_savings_avg', 'energy_savings_sw_pump',
+        'energy_savings_fw_pump', 'energy_savings_er_fan',
+        't5_accuracy', 't6_accuracy',
+        'safety_compliance', 'uptime_rate', 'created_at'
+    )
+    VFD_ANOMALY_COLUMNS = (
+        'anomaly_id', 'equipment_id', 'occurred_at',
+        'severity_level', 'severity_name', 'health_score', 'total_severity_score',
+        'motor_thermal', 'heatsink_temp', 'inverter_thermal', 'motor_current',
+        'current_imbalance', 'warning_word', 'over_temps', 'recommendations',
+        'status', 'acknowledged_at', 'acknowledged_by', 'cleared_at', 'cleared_by',
+        'duration_minutes', 'created_at'
+    )
+
+    # 기본 조회 컬럼 (보고서에서 실제 사용하는 컬럼만)
+    DEFAULT_SENSOR_COLUMNS = ('timestamp', 'T5', 'T6', 'engine_load')
+    DEFAULT_PERFORMANCE_COLUMNS = (
+        'timestamp', 'period', 'energy_savings_avg', 'safety_compliance', 'uptime_rate'
+    )
+    DEFAULT_VFD_ANOMALY_COLUMNS = (
+        'anomaly_id', 'equipment_id', 'occurred_at', 'severity_level', 'severity_name',
+        'health_score', 'status', 'duration_minutes', 'recommendations'
+    )
+
+    # datetime64로 변환할 컬럼 (컬럼 단위 조회용)
+    DATETIME_COLUMNS = ('timestamp', 'created_at')
+
+    # 시간 단위 롤업 대상 컬럼 (각각 _avg/_min/_max 저장)
+    HOURLY_ROLLUP_COLUMNS = (
+        'T1', 'T2', 'T3', 'T4', 'T5', 'T6', 'T7', 'PX1',
+        'engine_load', 'latitude', 'longitude', 'speed'
+    )
+
+    # 원본 1분 단위 센서 데이터 보관 기간 (일)
+    RAW_SENSOR_RETENTION_DAYS = 180
+
+    # 롤업 시 마지막 집계 시간 이전으로 재집계할 구간 (시간) - 늦게 도착한 행 반영
+    HOURLY_ROLLUP_LOOKBACK_HOURS = 24
+
+    # 온라인 백업: 단계당 복사 페이지 수 / 단계 간 대기 시간(초)
+    BACKUP_PAGES_PER_STEP = 256
+    BACKUP_STEP_SLEEP = 0.001
+
     def __init__(self, db_path: str = "data/ess_system.db"):
         """
         초기화
@@ -21,6 +151,9 @@ class DatabaseManager:
         """
         self.db_path = db_path
 
+        # DuckDB 분석 연결 (최초 사용 시 생성)
+        self._analytics = AnalyticsReader(db_path)
+
         # 데이터 디렉토리 생성
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
@@ -33,6 +166,26 @@ class DatabaseManager:
         conn.row_factory = sqlite3.Row  # dict-like access
         return conn
 
+    def get_analytics_connection(self):
+        """
+        DuckDB 분석 연결 획득
+
+        SQLite 파일을 읽기 전용으로 ATTACH하여 집계 쿼리를 컬럼 단위로 실행한다.
+        쓰기는 계속 SQLite 연결로만 수행한다.
+
+        Returns:
+            DuckDB 연결 (스레드별 cursor), 미설치/실패 시 None
+        """
+        return self._analytics.cursor()
+
+    @staticmethod
+    def _select_columns(columns: Sequence[str], allowed: Sequence[str]) -> str:
+        """SELECT 절 컬럼 목록 생성 (화이트리스트 검증)"""
+        invalid = [c for c in columns if c not in allowed]
+        if invalid or not columns:
+            raise ValueError(f"조회할 수 없는 컬럼: {invalid or columns}")
+        return ', '.join(columns)
+
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         conn = self.get_connection()
@@ -66,6 +219,19 @@ class DatabaseManager:
         ON sensor_data(timestamp)
         """)
 
+        # 1-1. sensor_data_hourly 테이블 (시간 단위 롤업, 장기 보관)
+        rollup_columns = ",\n            ".join(
+            f"{c}_avg REAL, {c}_min REAL, {c}_max REAL"
+            for c in self.HOURLY_ROLLUP_COLUMNS
+        )
+        cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS sensor_data_hourly (
+            hour DATETIME PRIMARY KEY,  -- 'YYYY-MM-DD HH:00:00'
+            {rollup_columns},
+            sample_count INTEGER NOT NULL
+        )
+        """)
+
         # 2. control_data 테이블 (제어 명령 이력)
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS control_data (
@@ -188,10 +354,11 @@ class DatabaseManager:
         """)
 
         # 8. vfd_anomaly_history 테이블 (VFD 이상 징후 히스토리 - 알람과 별도 관리)
+        # anomaly_id 단일 키 조회 → WITHOUT ROWID로 인덱스/테이블 B-tree 통합
+        # (기존 DB는 그대로 유지, 신규 DB에만 적용)
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS vfd_anomaly_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            anomaly_id TEXT UNIQUE NOT NULL,
+            anomaly_id TEXT PRIMARY KEY NOT NULL,
             equipment_id TEXT NOT NULL,
             occurred_at DATETIME NOT NULL,
             severity_level INTEGER NOT NULL,
@@ -213,7 +380,7 @@ class DatabaseManager:
             cleared_by TEXT,
             duration_minutes INTEGER,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
+        ) WITHOUT ROWID
         """)
 
         cursor.execute("""
@@ -359,14 +526,25 @@ class DatabaseManager:
         self,
         start_time: datetime,
         end_time: datetime,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        columns: Sequence[str] = DEFAULT_SENSOR_COLUMNS
     ) -> List[Dict[str, Any]]:
-        """센서 데이터 조회"""
+        """
+        센서 데이터 조회
+
+        Args:
+            start_time: 시작 시간
+            end_time: 종료 시간
+            limit: 최대 조회 개수
+            columns: 조회할 컬럼 (SENSOR_DATA_COLUMNS 중 선택)
+        """
+        select_list = self._select_columns(columns, self.SENSOR_DATA_COLUMNS)
+
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        query = """
-        SELECT * FROM sensor_data
+        query = f"""
+        SELECT {select_list} FROM sensor_data
         WHERE timestamp BETWEEN ? AND ?
         ORDER BY timestamp DESC
         """
@@ -381,25 +559,74 @@ class DatabaseManager:
 
         return [dict(row) for row in rows]
 
+    def get_sensor_data_columns(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        limit: Optional[int] = None,
+        columns: Sequence[str] = DEFAULT_SENSOR_COLUMNS
+    ) -> Dict[str, np.ndarray]:
+        """
+        센서 데이터 컬럼 단위 조회 (NumPy/pandas 분석용)
+
+        행마다 dict를 만들지 않고 컬럼별 배열을 바로 구성한다.
+        pd.DataFrame(result)로 그대로 변환 가능.
+
+        Returns:
+            {컬럼명: np.ndarray} - 시간 컬럼은 datetime64[s], 나머지는 float64 (NULL → NaN)
+        """
+        select_list = self._select_columns(columns, self.SENSOR_DATA_COLUMNS)
+
+        conn = self.get_connection()
+        conn.row_factory = None  # 튜플 그대로 수신 (Row 객체 생성 생략)
+
+        query = f"""
+        SELECT {select_list} FROM sensor_data
+        WHERE timestamp BETWEEN ? AND ?
+        ORDER BY timestamp DESC
+        """
+        params = [start_time, end_time]
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        rows = conn.execute(query, params).fetchall()
+        conn.close()
+
+        series = zip(*rows) if rows else [()] * len(columns)
+
+        result = {}
+        for name, values in zip(columns, series):
+            if name in self.DATETIME_COLUMNS:
+                result[name] = np.array(values, dtype='datetime64[us]').astype('datetime64[s]')
+            else:
+                result[name] = np.array(values, dtype=np.float64)
+
+        return result
+
     def get_performance_metrics(
         self,
         period: str,
         start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None,
+        columns: Sequence[str] = DEFAULT_PERFORMANCE_COLUMNS
     ) -> List[Dict[str, Any]]:
         """성과 지표 조회"""
+        select_list = self._select_columns(columns, self.PERFORMANCE_METRICS_COLUMNS)
+
         conn = self.get_connection()
         cursor = conn.cursor()
 
         if start_time and end_time:
-            cursor.execute("""
-            SELECT * FROM performance_metrics
+            cursor.execute(f"""
+            SELECT {select_list} FROM performance_metrics
             WHERE period = ? AND timestamp BETWEEN ? AND ?
             ORDER BY timestamp DESC
             """, (period, start_time, end_time))
         else:
-            cursor.execute("""
-            SELECT * FROM performance_metrics
+            cursor.execute(f"""
+            SELECT {select_list} FROM performance_metrics
             WHERE period = ?
             ORDER BY timestamp DESC
             LIMIT 30
@@ -410,54 +637,85 @@ class DatabaseManager:
 
         return [dict(row) for row in rows]
 
+    def rollup_sensor_data_hourly(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        sensor_data → sensor_data_hourly 증분 롤업
+
+        마지막으로 집계된 시간의 HOURLY_ROLLUP_LOOKBACK_HOURS 전부터 완료된 시간 구간까지
+        다시 집계한다 (INSERT OR REPLACE이므로 재집계는 멱등, 늦게 도착한 행도 반영).
+
+        Returns:
+            집계된 시간 구간 수 (재집계 포함)
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT MAX(hour) FROM sensor_data_hourly")
+        last_hour = cursor.fetchone()[0]
+
+        # 현재 진행 중인 시간은 제외 (완료된 구간만 집계)
+        current_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+
+        aggregates = ", ".join(
+            f"AVG({c}), MIN({c}), MAX({c})" for c in self.HOURLY_ROLLUP_COLUMNS
+        )
+        query = f"""
+        INSERT OR REPLACE INTO sensor_data_hourly
+        SELECT strftime('%Y-%m-%d %H:00:00', timestamp) AS hour, {aggregates}, COUNT(*)
+        FROM sensor_data
+        WHERE timestamp < ?
+        """
+        params = [current_hour]
+
+        if last_hour:
+            query += " AND timestamp >= ?"
+            params.append(datetime.fromisoformat(last_hour) - timedelta(hours=self.HOURLY_ROLLUP_LOOKBACK_HOURS))
+
+        query += " GROUP BY hour"
+
+        cursor.execute(query, params)
+        rolled_up = cursor.rowcount
+
+        if own_conn:
+            conn.commit()
+            conn.close()
+
+        return rolled_up
+
     def cleanup_old_data(self):
         """
         데이터 순환 정책 적용
-        - 최근 6개월: 고해상도 보관 (1분 단위)
-        - 6개월-1년: 압축 저장 (10분 단위 평균)
-        - 1년 이상: 핵심 패턴만 추출 (1시간 단위 평균)
+        - 최근 6개월: 고해상도 보관 (1분 단위, sensor_data)
+        - 6개월 이상: 시간 단위 평균/최소/최대 (sensor_data_hourly)
+
+        원본 삭제 전에 sensor_data_hourly로 증분 롤업하므로
+        매 실행 시 최근 구간(HOURLY_ROLLUP_LOOKBACK_HOURS)과 새로 완료된 시간 구간만 집계한다.
+
+        Returns:
+            (롤업된 시간 구간 수, 삭제된 원본 행 수)
         """
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        now = datetime.now()
-
-        # 6개월 전
-        six_months_ago = now - timedelta(days=180)
+        raw_cutoff = datetime.now() - timedelta(days=self.RAW_SENSOR_RETENTION_DAYS)
 
-        # 1년 전
-        one_year_ago = now - timedelta(days=365)
+        rolled_up = self.rollup_sensor_data_hourly(conn)
 
-        # 1년 이상 된 데이터 삭제 (핵심 패턴만 보관)
+        # 롤업이 끝난 구간의 원본 삭제
         cursor.execute("""
         DELETE FROM sensor_data
         WHERE timestamp < ?
-        AND id NOT IN (
-            SELECT MIN(id) FROM sensor_data
-            WHERE timestamp < ?
-            GROUP BY strftime('%Y-%m-%d %H', timestamp)
-        )
-        """, (one_year_ago, one_year_ago))
+        AND timestamp < (SELECT datetime(MAX(hour), '+1 hour') FROM sensor_data_hourly)
+        """, (raw_cutoff,))
 
-        deleted_old = cursor.rowcount
-
-        # 6개월-1년 데이터 압축 (10분 단위만 보관)
-        cursor.execute("""
-        DELETE FROM sensor_data
-        WHERE timestamp BETWEEN ? AND ?
-        AND id NOT IN (
-            SELECT MIN(id) FROM sensor_data
-            WHERE timestamp BETWEEN ? AND ?
-            GROUP BY strftime('%Y-%m-%d %H:%M', timestamp) / 10
-        )
-        """, (one_year_ago, six_months_ago, one_year_ago, six_months_ago))
-
-        deleted_compressed = cursor.rowcount
+        deleted_raw = cursor.rowcount
 
         conn.commit()
         conn.close()
 
-        return deleted_old, deleted_compressed
+        return rolled_up, deleted_raw
 
     def backup_database(self, backup_path: Optional[str] = None):
         """
@@ -474,11 +732,18 @@ class DatabaseManager:
                 f"ess_system_{datetime.now().strftime('%Y%m%d')}.db"
             )
 
-        # SQLite 백업
+        # SQLite 온라인 백업 (페이지 단위 분할 복사로 쓰기 스레드 블로킹 최소화)
         source = self.get_connection()
         destination = sqlite3.connect(backup_path)
 
-        source.backup(destination)
+        source.backup(
+            destination,
+            pages=self.BACKUP_PAGES_PER_STEP,
+            sleep=self.BACKUP_STEP_SLEEP
+        )
+
+        # WAL 파일 비대화 방지 (WAL 모드가 아니면 무시됨)
+        source.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
         source.close()
         destination.close()
@@ -496,19 +761,18 @@ class DatabaseManager:
         if not os.path.exists(backup_dir):
             return 0
 
-        now = datetime.now()
+        now = datetime.now().timestamp()
         deleted_count = 0
 
-        for filename in os.listdir(backup_dir):
-            if not filename.endswith('.db'):
-                continue
-
-            filepath = os.path.join(backup_dir, filename)
-            file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+        # scandir: DirEntry가 stat 결과를 캐시하므로 파일당 syscall 절감
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.db'):
+                    continue
 
-            if (now - file_time).days > days:
-                os.remove(filepath)
-                deleted_count += 1
+                if (now - entry.stat().st_mtime) // 86400 > days:
+                    os.remove(entry.path)
+                    deleted_count += 1
 
         return deleted_count
 
@@ -618,26 +882,17 @@ class DatabaseManager:
         """VFD 이상 징후 해제 처리"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        now = datetime.now()
 
-        # 발생 시간을 가져와서 지속 시간 계산
-        cursor.execute("""
-        SELECT occurred_at FROM vfd_anomaly_history WHERE anomaly_id = ?
-        """, (anomaly_id,))
-        row = cursor.fetchone()
-
-        duration_minutes = None
-        if row:
-            occurred_at = datetime.fromisoformat(row[0]) if isinstance(row[0], str) else row[0]
-            duration_minutes = int((datetime.now() - occurred_at).total_seconds() / 60)
-
+        # 단일 UPDATE (지속 시간은 SQLite에서 계산)
         cursor.execute("""
         UPDATE vfd_anomaly_history
         SET status = 'CLEARED',
             cleared_at = ?,
             cleared_by = ?,
-            duration_minutes = ?
+            duration_minutes = (strftime('%s', ?) - strftime('%s', occurred_at)) / 60
         WHERE anomaly_id = ? AND status IN ('ACTIVE', 'ACKNOWLEDGED')
-        """, (datetime.now(), user, duration_minutes, anomaly_id))
+        """, (now, user, now, anomaly_id))
 
         affected = cursor.rowcount
         conn.commit()
@@ -652,35 +907,27 @@ class DatabaseManager:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        now = datetime.now()
 
-        # 해당 장비의 ACTIVE 또는 ACKNOWLEDGED 상태인 이상 징후 조회
+        # 해당 장비의 가장 최근 ACTIVE/ACKNOWLEDGED 이상 징후를 단일 UPDATE로 해제
         cursor.execute("""
-        SELECT anomaly_id, occurred_at FROM vfd_anomaly_history
-        WHERE equipment_id = ? AND status IN ('ACTIVE', 'ACKNOWLEDGED')
-        ORDER BY occurred_at DESC LIMIT 1
-        """, (equipment_id,))
-        row = cursor.fetchone()
-
-        if row:
-            anomaly_id = row[0]
-            occurred_at = datetime.fromisoformat(row[1]) if isinstance(row[1], str) else row[1]
-            duration_minutes = int((datetime.now() - occurred_at).total_seconds() / 60)
-
-            cursor.execute("""
-            UPDATE vfd_anomaly_history
-            SET status = 'AUTO_CLEARED',
-                cleared_at = ?,
-                cleared_by = 'SYSTEM',
-                duration_minutes = ?
-            WHERE anomaly_id = ?
-            """, (datetime.now(), duration_minutes, anomaly_id))
-
-            conn.commit()
-            conn.close()
-            return True
+        UPDATE vfd_anomaly_history
+        SET status = 'AUTO_CLEARED',
+            cleared_at = ?,
+            cleared_by = 'SYSTEM',
+            duration_minutes = (strftime('%s', ?) - strftime('%s', occurred_at)) / 60
+        WHERE anomaly_id = (
+            SELECT anomaly_id FROM vfd_anomaly_history
+            WHERE equipment_id = ? AND status IN ('ACTIVE', 'ACKNOWLEDGED')
+            ORDER BY occurred_at DESC LIMIT 1
+        )
+        """, (now, now, equipment_id))
 
+        affected = cursor.rowcount
+        conn.commit()
         conn.close()
-        return False
+
+        return affected > 0
 
     def get_vfd_anomaly_history(
         self,
@@ -689,7 +936,8 @@ class DatabaseManager:
         severity_level: Optional[int] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        columns: Sequence[str] = DEFAULT_VFD_ANOMALY_COLUMNS
     ) -> List[Dict[str, Any]]:
         """
         VFD 이상 징후 히스토리 조회
@@ -701,14 +949,17 @@ class DatabaseManager:
             start_time: 시작 시간
             end_time: 종료 시간
             limit: 최대 조회 개수
+            columns: 조회할 컬럼 (VFD_ANOMALY_COLUMNS 중 선택)
 
         Returns:
             이상 징후 히스토리 리스트
         """
+        select_list = self._select_columns(columns, self.VFD_ANOMALY_COLUMNS)
+
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        query = "SELECT * FROM vfd_anomaly_history WHERE 1=1"
+        query = f"SELECT {select_list} FROM vfd_anomaly_history WHERE 1=1"
         params = []
 
         if equipment_id:
@@ -742,7 +993,7 @@ class DatabaseManager:
 
     def get_active_vfd_anomalies(self) -> List[Dict[str, Any]]:
         """현재 활성화된 VFD 이상 징후 조회"""
-        return self.get_vfd_anomaly_history(status='ACTIVE')
+        return self.get_vfd_anomaly_history(status='ACTIVE', columns=self.VFD_ANOMALY_COLUMNS)
 
     def get_vfd_anomaly_statistics(
         self,
@@ -761,9 +1012,34 @@ class DatabaseManager:
                 'active_count': 현재 활성 이상 징후 수
             }
         """
+        # DuckDB 사용 가능 시 분석 연결, 쿼리 실패 시 SQLite로 재시도
+        cursor = self.get_analytics_connection()
+        if cursor is not None:
+            try:
+                return self._query_vfd_anomaly_statistics(
+                    cursor, "app.vfd_anomaly_history", start_time, end_time
+                )
+            except duckdb.Error as e:
+                logger.warning(f"⚠️ DuckDB 집계 실패 - SQLite로 재시도: {e}")
+            finally:
+                cursor.close()
+
         conn = self.get_connection()
-        cursor = conn.cursor()
+        try:
+            return self._query_vfd_anomaly_statistics(
+                conn, "vfd_anomaly_history", start_time, end_time
+            )
+        finally:
+            conn.close()
 
+    @staticmethod
+    def _query_vfd_anomaly_statistics(
+        cursor,
+        table: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """VFD 이상 징후 통계 집계 (DuckDB/SQLite 공통)"""
         # 시간 범위 조건
         time_condition = ""
         params = []
@@ -772,39 +1048,38 @@ class DatabaseManager:
             params = [start_time, end_time]
 
         # 총 카운트
-        cursor.execute(f"SELECT COUNT(*) FROM vfd_anomaly_history {time_condition}", params)
-        total_count = cursor.fetchone()[0]
+        total_count = cursor.execute(
+            f"SELECT COUNT(*) FROM {table} {time_condition}", params
+        ).fetchone()[0]
 
         # 장비별 카운트
-        cursor.execute(f"""
+        rows = cursor.execute(f"""
         SELECT equipment_id, COUNT(*) as cnt
-        FROM vfd_anomaly_history {time_condition}
+        FROM {table} {time_condition}
         GROUP BY equipment_id
-        """, params)
-        by_equipment = {row[0]: row[1] for row in cursor.fetchall()}
+        """, params).fetchall()
+        by_equipment = {row[0]: row[1] for row in rows}
 
         # 중증도별 카운트
-        cursor.execute(f"""
-        SELECT severity_level, severity_name, COUNT(*) as cnt
-        FROM vfd_anomaly_history {time_condition}
+        rows = cursor.execute(f"""
+        SELECT severity_level, MAX(severity_name), COUNT(*) as cnt
+        FROM {table} {time_condition}
         GROUP BY severity_level
-        """, params)
-        by_severity = {f"Level {row[0]} ({row[1]})": row[2] for row in cursor.fetchall()}
+        """, params).fetchall()
+        by_severity = {f"Level {row[0]} ({row[1]})": row[2] for row in rows}
 
         # 평균 지속 시간
-        cursor.execute(f"""
+        avg_duration = cursor.execute(f"""
         SELECT AVG(duration_minutes)
-        FROM vfd_anomaly_history
+        FROM {table}
         WHERE duration_minutes IS NOT NULL
         {' AND occurred_at BETWEEN ? AND ?' if start_time and end_time else ''}
-        """, params if start_time and end_time else [])
-        avg_duration = cursor.fetchone()[0] or 0
+        """, params).fetchone()[0] or 0
 
         # 현재 활성 이상 징후 수
-        cursor.execute("SELECT COUNT(*) FROM vfd_anomaly_history WHERE status = 'ACTIVE'")
-        active_count = cursor.fetchone()[0]
-
-        conn.close()
+        active_count = cursor.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE status = 'ACTIVE'"
+        ).fetchone()[0]
 
         return {
             'total_count': total_count,
@@ -2,21 +2,45 @@
 VFD 이상 징후 감지 시스템 (Danfoss VFD 기준)
 10개 VFD 실시간 모니터링 및 상태 등급 판정
 """
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, reduce
+from itertools import chain
+from operator import attrgetter, or_
+from typing import Deque, Dict, List, Optional, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
+import heapq
+import sys
 import numpy as np
 
+# numba (선택) - 설치 시 심각도/패턴 커널을 JIT 컴파일
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
 
 class VFDStatus(Enum):
-    """VFD 상태 등급"""
+    """
+    VFD 상태 등급
+
+    값(문자열)은 DB/공유 JSON에 그대로 저장되므로 유지하고,
+    등급 비교는 멤버 동일성(is)으로 수행한다.
+    """
     NORMAL = "normal"  # 정상
     CAUTION = "caution"  # 주의
     WARNING = "warning"  # 경고
     CRITICAL = "critical"  # 위험
 
 
+# 등급 → 집계 인덱스 (정의 순서: NORMAL, CAUTION, WARNING, CRITICAL)
+_GRADE_INDEX = {grade: i for i, grade in enumerate(VFDStatus)}
+_GRADE_CRITICAL_INDEX = _GRADE_INDEX[VFDStatus.CRITICAL]
+
+
 class VFDType(Enum):
     """VFD 타입"""
     SW_PUMP = "sw_pump"
@@ -24,12 +48,257 @@ class VFDType(Enum):
     ER_FAN = "er_fan"
 
 
+# StatusBits 비트 위치 (DanfossStatusBits 필드 순서와 동일)
+BIT_TRIP = 1 << 0
+BIT_ERROR = 1 << 1
+BIT_WARNING = 1 << 2
+BIT_VOLTAGE_EXCEEDED = 1 << 3
+BIT_TORQUE_EXCEEDED = 1 << 4
+BIT_THERMAL_EXCEEDED = 1 << 5
+BIT_CONTROL_READY = 1 << 6
+BIT_DRIVE_READY = 1 << 7
+BIT_IN_OPERATION = 1 << 8
+BIT_SPEED_EQUALS_REFERENCE = 1 << 9
+BIT_BUS_CONTROL = 1 << 10
+STATUS_BIT_COUNT = 11
+
+
+def _severity_from_bits(bits: int) -> int:
+    """
+    StatusBits 심각도 점수 계산 (0-100, 높을수록 심각)
+
+    SEVERITY_SCORE_LUT 생성용
+    """
+    score = 0
+
+    if bits & BIT_TRIP:
+        score += 50
+    if bits & BIT_ERROR:
+        score += 30
+    if bits & BIT_WARNING:
+        score += 60
+    if bits & BIT_VOLTAGE_EXCEEDED:
+        score += 20
+    if bits & BIT_TORQUE_EXCEEDED:
+        score += 20
+    if bits & BIT_THERMAL_EXCEEDED:
+        score += 25
+
+    # 정상 상태 체크 (부정적)
+    if not bits & BIT_CONTROL_READY:
+        score += 10
+    if not bits & BIT_DRIVE_READY:
+        score += 10
+    if bits & BIT_IN_OPERATION and not bits & BIT_SPEED_EQUALS_REFERENCE:
+        score += 10
+
+    return min(100, score)
+
+
+# 비트 조합(2048개)별 심각도 점수 사전 계산
+SEVERITY_SCORE_LUT = np.array(
+    [_severity_from_bits(bits) for bits in range(1 << STATUS_BIT_COUNT)],
+    dtype=np.int8
+)
+
+# 이상 패턴 (순서 = anomaly_patterns 목록 순서, 인덱스 = 비트 위치)
+# 앞의 6개는 StatusBits 하위 6비트(trip ~ thermal_exceeded)와 비트 위치가 같음
+# 진단 결과의 anomaly_patterns는 이 인턴된 문자열 객체를 공유 (비교 시 동일성 우선 매칭)
+ANOMALY_PATTERNS = tuple(map(sys.intern, (
+    "VFD_TRIP", "VFD_ERROR", "VFD_WARNING",
+    "VOLTAGE_EXCEEDED", "TORQUE_EXCEEDED", "THERMAL_EXCEEDED",
+    "MOTOR_OVERTEMP", "MOTOR_TEMP_WARNING", "HEATSINK_OVERTEMP",
+    "VOLTAGE_LOW", "VOLTAGE_HIGH", "DC_BUS_ABNORMAL",
+    "CONTROL_NOT_READY", "DRIVE_NOT_READY", "SPEED_MISMATCH",
+    "TEMP_RISING_TREND", "FREQUENT_WARNINGS",
+)))
+ANOMALY_PATTERN_BITS = {name: 1 << i for i, name in enumerate(ANOMALY_PATTERNS)}
+
+PAT_VFD_TRIP = ANOMALY_PATTERN_BITS["VFD_TRIP"]
+PAT_VFD_WARNING = ANOMALY_PATTERN_BITS["VFD_WARNING"]
+PAT_TORQUE_EXCEEDED = ANOMALY_PATTERN_BITS["TORQUE_EXCEEDED"]
+PAT_THERMAL_EXCEEDED = ANOMALY_PATTERN_BITS["THERMAL_EXCEEDED"]
+PAT_MOTOR_OVERTEMP = ANOMALY_PATTERN_BITS["MOTOR_OVERTEMP"]
+PAT_MOTOR_TEMP_WARNING = ANOMALY_PATTERN_BITS["MOTOR_TEMP_WARNING"]
+PAT_HEATSINK_OVERTEMP = ANOMALY_PATTERN_BITS["HEATSINK_OVERTEMP"]
+PAT_VOLTAGE_LOW = ANOMALY_PATTERN_BITS["VOLTAGE_LOW"]
+PAT_VOLTAGE_HIGH = ANOMALY_PATTERN_BITS["VOLTAGE_HIGH"]
+PAT_DC_BUS_ABNORMAL = ANOMALY_PATTERN_BITS["DC_BUS_ABNORMAL"]
+PAT_CONTROL_NOT_READY = ANOMALY_PATTERN_BITS["CONTROL_NOT_READY"]
+PAT_DRIVE_NOT_READY = ANOMALY_PATTERN_BITS["DRIVE_NOT_READY"]
+PAT_SPEED_MISMATCH = ANOMALY_PATTERN_BITS["SPEED_MISMATCH"]
+PAT_TEMP_RISING_TREND = ANOMALY_PATTERN_BITS["TEMP_RISING_TREND"]
+PAT_FREQUENT_WARNINGS = ANOMALY_PATTERN_BITS["FREQUENT_WARNINGS"]
+
+STATUS_PATTERN_MASK = 0x3F  # StatusBits → 패턴 비트 직접 매핑 구간
+
+# 점수와 무관하게 CRITICAL로 판정하는 패턴
+CRITICAL_PATTERNS = frozenset(
+    sys.intern(name) for name in ("VFD_TRIP", "VFD_ERROR", "THERMAL_EXCEEDED", "MOTOR_OVERTEMP")
+)
+CRITICAL_PATTERN_MASK = sum(ANOMALY_PATTERN_BITS[name] for name in CRITICAL_PATTERNS)  # 비트 중복 없음
+
+NORMAL_RECOMMENDATION = "정상 운전 중"
+
+# 패턴별 권고사항 (해당 패턴 비트 중 하나라도 있으면 추가, 순서 유지)
+RECOMMENDATION_RULES = (
+    (PAT_VFD_TRIP, "VFD 트립 원인 확인 필요"),
+    (PAT_MOTOR_OVERTEMP | PAT_THERMAL_EXCEEDED, "모터 냉각 점검 및 부하 확인"),
+    (PAT_HEATSINK_OVERTEMP, "히트싱크 청소 및 냉각팬 점검"),
+    (PAT_VOLTAGE_HIGH | PAT_VOLTAGE_LOW, "전원 공급 상태 점검"),
+    (PAT_TORQUE_EXCEEDED, "기계 부하 과다, 점검 필요"),
+    (PAT_SPEED_MISMATCH, "VFD 파라미터 및 통신 확인"),
+    (PAT_TEMP_RISING_TREND, "온도 상승 추세 관찰 중, 주의"),
+)
+# 권고 문구가 있는 패턴 비트 전체
+RECOMMENDATION_RULE_MASK = reduce(or_, (rule_mask for rule_mask, _ in RECOMMENDATION_RULES), 0)
+CRITICAL_RECOMMENDATION = "⚠️ 즉시 점검 필요"
+
+
+@lru_cache(maxsize=1024)
+def _pattern_names(pattern_mask: int) -> tuple:
+    """패턴 비트마스크 → 패턴 이름 (ANOMALY_PATTERNS 순서)"""
+    return tuple(name for name, bit in ANOMALY_PATTERN_BITS.items() if pattern_mask & bit)
+
+
+# 통계적 이상 감지 윈도우 (최근 N개 샘플)
+TREND_WINDOW = 30
+
+# 추세 기울기 계산용 중심화 x (x = 0..N-1 고정이므로 최소제곱 기울기 = x_c·y / Σx_c²)
+_TREND_X_CENTERED = np.arange(TREND_WINDOW, dtype=np.float64) - (TREND_WINDOW - 1) / 2.0
+_TREND_X_NORM = float(_TREND_X_CENTERED @ _TREND_X_CENTERED)
+# 링 버퍼용 회전된 x: 다음 쓰기 위치가 k일 때 buf[j]의 x = _TREND_X_CENTERED[(j - k) % N]
+_TREND_X_ROLLED = np.stack([np.roll(_TREND_X_CENTERED, k) for k in range(TREND_WINDOW)])
+
+# 온도 추세 재계산 간격 (샘플 수, 사이에는 직전 결과 재사용)
+TREND_RECOMPUTE_INTERVAL = 5
+
+# 최근 TREND_WINDOW개 경고 비트 롤링 마스크 (bit 0 = 가장 최근 샘플)
+_TREND_WINDOW_MASK = (1 << TREND_WINDOW) - 1
+
+# DC 버스 전압 정상 범위 (540V ± 10%)
+DC_BUS_VOLTAGE_MIN = 486.0
+DC_BUS_VOLTAGE_MAX = 594.0
+
+
+def _status_kernel(
+    bits, motor_temp, heatsink_temp, output_voltage, dc_bus_voltage,
+    motor_limit, heatsink_limit, voltage_low, voltage_high
+):
+    """
+    심각도 점수 + 순간값 기반 이상 패턴 비트마스크 (통계 패턴 제외)
+
+    순수 수치 연산만 사용 (numba 설치 시 njit 컴파일)
+
+    Returns:
+        (severity_score, pattern_mask)
+    """
+    severity = int(SEVERITY_SCORE_LUT[bits])
+
+    # 정상 운전 빠른 경로: StatusBits 점수 0 (고장 비트 없음, 준비 완료, 속도 일치)
+    # + 모든 측정값이 정상 범위 (NaN은 비교가 False이므로 아래 일반 경로로 진행)
+    if (severity == 0
+            and motor_temp <= motor_limit - 10
+            and heatsink_temp <= heatsink_limit
+            and output_voltage >= voltage_low and output_voltage <= voltage_high
+            and dc_bus_voltage >= DC_BUS_VOLTAGE_MIN and dc_bus_voltage <= DC_BUS_VOLTAGE_MAX):
+        return 0, 0
+
+    # StatusBits 기반 (trip, error, warning, voltage/torque/thermal exceeded)
+    patterns = bits & STATUS_PATTERN_MASK
+
+    # 온도 기반
+    if motor_temp > motor_limit:
+        severity += 15
+        patterns |= PAT_MOTOR_OVERTEMP  # 현재 과열
+    elif motor_temp > motor_limit - 10:
+        patterns |= PAT_MOTOR_TEMP_WARNING  # 예방 경고 (70°C 이상)
+
+    if heatsink_temp > heatsink_limit:
+        severity += 10
+        patterns |= PAT_HEATSINK_OVERTEMP
+
+    # 전압 기반
+    if not (output_voltage >= voltage_low and output_voltage <= voltage_high):
+        severity += 15
+    if output_voltage < voltage_low:
+        patterns |= PAT_VOLTAGE_LOW
+    elif output_voltage > voltage_high:
+        patterns |= PAT_VOLTAGE_HIGH
+
+    # DC 버스 전압
+    if dc_bus_voltage < DC_BUS_VOLTAGE_MIN or dc_bus_voltage > DC_BUS_VOLTAGE_MAX:
+        patterns |= PAT_DC_BUS_ABNORMAL
+
+    # 준비 상태 체크
+    if (bits & BIT_CONTROL_READY) == 0:
+        patterns |= PAT_CONTROL_NOT_READY
+    if (bits & BIT_DRIVE_READY) == 0:
+        patterns |= PAT_DRIVE_NOT_READY
+
+    # 속도 불일치 (운전 중)
+    if (bits & BIT_IN_OPERATION) != 0 and (bits & BIT_SPEED_EQUALS_REFERENCE) == 0:
+        patterns |= PAT_SPEED_MISMATCH
+
+    return min(severity, 100), patterns
+
+
+def _status_kernel_batch(
+    bits, motor_temp, heatsink_temp, output_voltage, dc_bus_voltage,
+    motor_limit, heatsink_limit, voltage_low, voltage_high
+):
+    """_status_kernel 일괄 적용 (배열 입력 → 심각도, 패턴 배열)"""
+    n = bits.shape[0]
+    severity = np.empty(n, dtype=np.int64)
+    patterns = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        s, p = _status_kernel(
+            bits[i], motor_temp[i], heatsink_temp[i], output_voltage[i], dc_bus_voltage[i],
+            motor_limit, heatsink_limit, voltage_low, voltage_high
+        )
+        severity[i] = s
+        patterns[i] = p
+    return severity, patterns
+
+
+if NUMBA_AVAILABLE:
+    # NaN 비교 의미를 유지하기 위해 fastmath 미사용
+    # VFD 10대 규모에서는 스레드 기동 비용이 커서 parallel 미사용 (prange는 range로 동작)
+    _status_kernel = njit(cache=True)(_status_kernel)
+    _status_kernel_batch = njit(cache=True)(_status_kernel_batch)
+
+    # 임포트 시 1회 컴파일 (첫 진단 지연 방지)
+    _status_kernel(0, 0.0, 0.0, 0.0, 0.0, 80.0, 65.0, 380.0, 420.0)
+    _status_kernel_batch(
+        np.zeros(1, dtype=np.int64), np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1),
+        80.0, 65.0, 380.0, 420.0
+    )
+
+
+def _slotted(cls):
+    """
+    dataclass를 __slots__ 클래스로 재생성 (Python 3.10+ dataclass(slots=True) 대체)
+
+    폴링마다 대량 생성되는 객체의 인스턴스 __dict__를 제거해 메모리/속성 접근 비용 절감.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names:
+        cls_dict.pop(name, None)  # 기본값은 생성된 __init__에 이미 반영됨
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_slotted
 @dataclass
 class DanfossStatusBits:
     """
     Danfoss VFD StatusBits
 
     각 비트는 True/False로 표현
+    bits: 생성 시 11개 비트를 하나의 정수로 패킹 (BIT_* 상수 참조)
     """
     trip: bool  # VFD 트립 발생
     error: bool  # 오류 발생
@@ -43,38 +312,33 @@ class DanfossStatusBits:
     speed_equals_reference: bool  # 속도 일치
     bus_control: bool  # 버스 제어
 
+    bits: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.bits = (
+            (BIT_TRIP if self.trip else 0)
+            | (BIT_ERROR if self.error else 0)
+            | (BIT_WARNING if self.warning else 0)
+            | (BIT_VOLTAGE_EXCEEDED if self.voltage_exceeded else 0)
+            | (BIT_TORQUE_EXCEEDED if self.torque_exceeded else 0)
+            | (BIT_THERMAL_EXCEEDED if self.thermal_exceeded else 0)
+            | (BIT_CONTROL_READY if self.control_ready else 0)
+            | (BIT_DRIVE_READY if self.drive_ready else 0)
+            | (BIT_IN_OPERATION if self.in_operation else 0)
+            | (BIT_SPEED_EQUALS_REFERENCE if self.speed_equals_reference else 0)
+            | (BIT_BUS_CONTROL if self.bus_control else 0)
+        )
+
     def get_severity_score(self) -> int:
         """
         심각도 점수 계산 (0-100)
 
-        높을수록 심각
+        높을수록 심각 (SEVERITY_SCORE_LUT 조회)
         """
-        score = 0
-
-        if self.trip:
-            score += 50
-        if self.error:
-            score += 30
-        if self.warning:
-            score += 60
-        if self.voltage_exceeded:
-            score += 20
-        if self.torque_exceeded:
-            score += 20
-        if self.thermal_exceeded:
-            score += 25
-
-        # 정상 상태 체크 (부정적)
-        if not self.control_ready:
-            score += 10
-        if not self.drive_ready:
-            score += 10
-        if self.in_operation and not self.speed_equals_reference:
-            score += 10
-
-        return min(100, score)
+        return int(SEVERITY_SCORE_LUT[self.bits])
 
 
+@_slotted
 @dataclass
 class VFDInfo:
     """VFD 정보"""
@@ -84,6 +348,7 @@ class VFDInfo:
     modbus_address: int
 
 
+@_slotted
 @dataclass
 class VFDDiagnostic:
     """VFD 진단 결과"""
@@ -135,24 +400,30 @@ class VFDMonitor:
         # VFD 정보
         self.vfds: Dict[str, VFDInfo] = self._initialize_vfds()
 
-        # 진단 히스토리
-        self.diagnostic_history: Dict[str, List[VFDDiagnostic]] = {
-            vfd_id: [] for vfd_id in self.vfds.keys()
+        # 진단 히스토리 (VFD별 최근 1000개, 초과 시 오래된 항목 자동 제거)
+        self.diagnostic_history: Dict[str, Deque[VFDDiagnostic]] = {
+            vfd_id: deque(maxlen=1000) for vfd_id in self.vfds.keys()
         }
 
-        # 통계
-        self.cumulative_runtime: Dict[str, float] = {
-            vfd_id: 0.0 for vfd_id in self.vfds.keys()
-        }
-        self.trip_counts: Dict[str, int] = {
-            vfd_id: 0 for vfd_id in self.vfds.keys()
-        }
-        self.error_counts: Dict[str, int] = {
-            vfd_id: 0 for vfd_id in self.vfds.keys()
-        }
-        self.warning_counts: Dict[str, int] = {
-            vfd_id: 0 for vfd_id in self.vfds.keys()
-        }
+        # VFD별 최신 진단 결과 (최초 진단 순)
+        self.latest: Dict[str, VFDDiagnostic] = {}
+
+        # VFD별 고정 인덱스 (아래 통계/버퍼 배열의 행 번호)
+        self._vfd_index: Dict[str, int] = {vfd_id: i for i, vfd_id in enumerate(self.vfds)}
+        vfd_count = len(self.vfds)
+
+        # 통계 (VFD 인덱스 순 배열)
+        self._runtime_hours = np.zeros(vfd_count, dtype=np.float64)  # 누적 운전시간
+        self._trip_counts = np.zeros(vfd_count, dtype=np.uint32)
+        self._error_counts = np.zeros(vfd_count, dtype=np.uint32)
+        self._warning_counts = np.zeros(vfd_count, dtype=np.uint32)
+
+        # 통계적 이상 감지 상태 (VFD 인덱스 순)
+        self._warning_mask: List[int] = [0] * vfd_count  # 최근 TREND_WINDOW개 샘플의 경고 비트
+        self._motor_temp_buf = np.zeros((vfd_count, TREND_WINDOW), dtype=np.float64)  # 모터 온도 링 버퍼
+        self._sample_count: List[int] = [0] * vfd_count  # 링 버퍼 누적 기록 수
+        self._trend_cache: List[int] = [0] * vfd_count  # 직전 온도 추세 패턴 비트
+        self._trend_computed_at: List[int] = [-TREND_RECOMPUTE_INTERVAL] * vfd_count  # 계산 시점 sample_count
 
         # 임계값
         self.temp_threshold_motor = 80.0  # °C
@@ -162,7 +433,12 @@ class VFDMonitor:
         # 이상 징후 관리
         self.active_anomalies: Dict[str, VFDDiagnostic] = {}  # 현재 활성 이상 징후
         self.anomaly_history: List[VFDDiagnostic] = []  # 전체 이상 징후 히스토리
+        self._anomaly_history_by_vfd: Dict[str, Deque[VFDDiagnostic]] = {
+            vfd_id: deque() for vfd_id in self.vfds.keys()
+        }  # VFD별 이상 징후 히스토리 (해제 순)
         self.auto_clear_delay_minutes = 10  # 자동 해제 대기 시간 (분)
+        self.auto_clear_check_interval_seconds = 30  # 자동 해제 확인 주기 (초)
+        self._last_auto_clear_check = datetime.min
         self.cleared_anomalies: set = set()  # 해제된 VFD ID (정상 복귀 전까지 다시 등록 안함)
 
     def _initialize_vfds(self) -> Dict[str, VFDInfo]:
@@ -211,62 +487,161 @@ class VFDMonitor:
         dc_bus_voltage_v: float,
         motor_temp_c: float,
         heatsink_temp_c: float,
-        runtime_seconds: float = 0.0
+        runtime_seconds: float = 0.0,
+        now: Optional[datetime] = None
     ) -> VFDDiagnostic:
         """
         VFD 진단
 
+        Args:
+            now: 진단 시각 (None이면 현재 시각)
+
         Returns:
             VFDDiagnostic
         """
-        if vfd_id not in self.vfds:
+        idx = self._vfd_index.get(vfd_id)
+        if idx is None:
             raise ValueError(f"Unknown VFD: {vfd_id}")
+        now = now or datetime.now()
+
+        # 심각도 점수 (StatusBits + 온도/전압) 및 순간값 이상 패턴
+        severity_score, pattern_mask = _status_kernel(
+            status_bits.bits, float(motor_temp_c), float(heatsink_temp_c),
+            float(output_voltage_v), float(dc_bus_voltage_v),
+            self.temp_threshold_motor, self.temp_threshold_heatsink,
+            self.voltage_range[0], self.voltage_range[1]
+        )
 
-        # 이상 패턴 분석
-        anomaly_patterns = self._analyze_anomaly_patterns(
-            vfd_id, status_bits, motor_temp_c, heatsink_temp_c,
-            output_voltage_v, dc_bus_voltage_v
+        # 통계 업데이트
+        bits = status_bits.bits
+        if runtime_seconds > 0:
+            self._runtime_hours[idx] += runtime_seconds / 3600.0
+        if bits & BIT_TRIP:
+            self._trip_counts[idx] += 1
+        if bits & BIT_ERROR:
+            self._error_counts[idx] += 1
+        if bits & BIT_WARNING:
+            self._warning_counts[idx] += 1
+
+        return self._build_diagnostic(
+            vfd_id, idx, status_bits, frequency_hz, output_current_a,
+            output_voltage_v, dc_bus_voltage_v, motor_temp_c, heatsink_temp_c,
+            severity_score, pattern_mask, now
         )
 
-        # 심각도 점수
-        severity_score = status_bits.get_severity_score()
+    def diagnose_batch(
+        self,
+        vfd_ids: Sequence[str],
+        status_bits: Sequence[DanfossStatusBits],
+        frequency_hz: np.ndarray,
+        output_current_a: np.ndarray,
+        output_voltage_v: np.ndarray,
+        dc_bus_voltage_v: np.ndarray,
+        motor_temp_c: np.ndarray,
+        heatsink_temp_c: np.ndarray,
+        runtime_seconds: float = 0.0,
+        now: Optional[datetime] = None
+    ) -> Dict[str, VFDDiagnostic]:
+        """
+        VFD 일괄 진단 (폴링 주기당 1회 호출)
 
-        # 추가 심각도 (온도, 전압)
-        if motor_temp_c > self.temp_threshold_motor:
-            severity_score += 15
-        if heatsink_temp_c > self.temp_threshold_heatsink:
-            severity_score += 10
-        if not (self.voltage_range[0] <= output_voltage_v <= self.voltage_range[1]):
-            severity_score += 15
+        측정값은 vfd_ids 순서의 배열로 전달.
+        심각도 점수와 순간값 이상 패턴은 전체 VFD에 대해 한 번에 계산한다.
+        진단 시각(now)은 전체 VFD가 공유하며, 자동 해제 확인은 주기당 1회만 수행한다.
 
-        severity_score = min(100, severity_score)
+        Returns:
+            {vfd_id: VFDDiagnostic}
+        """
+        unknown = [vfd_id for vfd_id in vfd_ids if vfd_id not in self._vfd_index]
+        if unknown:
+            raise ValueError(f"Unknown VFD: {unknown}")
+        now = now or datetime.now()
+
+        count = len(vfd_ids)
+        idxs = np.fromiter((self._vfd_index[vfd_id] for vfd_id in vfd_ids), dtype=np.intp, count=count)
+        frequency_hz = np.asarray(frequency_hz, dtype=np.float64)
+        output_current_a = np.asarray(output_current_a, dtype=np.float64)
+        output_voltage_v = np.asarray(output_voltage_v, dtype=np.float64)
+        dc_bus_voltage_v = np.asarray(dc_bus_voltage_v, dtype=np.float64)
+        motor_temp_c = np.asarray(motor_temp_c, dtype=np.float64)
+        heatsink_temp_c = np.asarray(heatsink_temp_c, dtype=np.float64)
+
+        # 심각도 점수 및 순간값 이상 패턴 (일괄 커널)
+        bits = np.fromiter((sb.bits for sb in status_bits), dtype=np.int64, count=count)
+        severity_scores, pattern_masks = _status_kernel_batch(
+            bits, motor_temp_c, heatsink_temp_c, output_voltage_v, dc_bus_voltage_v,
+            self.temp_threshold_motor, self.temp_threshold_heatsink,
+            self.voltage_range[0], self.voltage_range[1]
+        )
+        severity_scores = severity_scores.tolist()
+        pattern_masks = pattern_masks.tolist()
 
-        # 상태 등급 판정
-        status_grade = self._determine_status_grade(severity_score, anomaly_patterns)
+        # 통계 업데이트 (배열 일괄)
+        if runtime_seconds > 0:
+            np.add.at(self._runtime_hours, idxs, runtime_seconds / 3600.0)
+        np.add.at(self._trip_counts, idxs, (bits & BIT_TRIP) != 0)
+        np.add.at(self._error_counts, idxs, (bits & BIT_ERROR) != 0)
+        np.add.at(self._warning_counts, idxs, (bits & BIT_WARNING) != 0)
+
+        results = {}
+        for i, (vfd_id, idx) in enumerate(zip(vfd_ids, idxs.tolist())):
+            results[vfd_id] = self._build_diagnostic(
+                vfd_id, idx, status_bits[i], float(frequency_hz[i]), float(output_current_a[i]),
+                float(output_voltage_v[i]), float(dc_bus_voltage_v[i]),
+                float(motor_temp_c[i]), float(heatsink_temp_c[i]),
+                severity_scores[i], pattern_masks[i], now, auto_clear=False
+            )
 
-        # severity와 anomaly_patterns 일관성 유지
-        # VFD_WARNING은 severity +60을 의미하므로, severity < 51이면 제거
-        if severity_score < 51 and "VFD_WARNING" in anomaly_patterns:
-            anomaly_patterns.remove("VFD_WARNING")
+        # 자동 해제 체크 (주기당 최대 1회)
+        self._maybe_check_auto_clear(now)
 
-        # 권고사항
-        recommendation = self._generate_recommendation(
-            status_grade, anomaly_patterns, status_bits
-        )
+        return results
 
-        # 통계 업데이트
-        if runtime_seconds > 0:
-            self.cumulative_runtime[vfd_id] += runtime_seconds / 3600.0
+    def _build_diagnostic(
+        self,
+        vfd_id: str,
+        idx: int,
+        status_bits: DanfossStatusBits,
+        frequency_hz: float,
+        output_current_a: float,
+        output_voltage_v: float,
+        dc_bus_voltage_v: float,
+        motor_temp_c: float,
+        heatsink_temp_c: float,
+        severity_score: int,
+        pattern_mask: int,
+        now: datetime,
+        auto_clear: bool = True
+    ) -> VFDDiagnostic:
+        """통계 업데이트 이후 단계 (통계 패턴, 등급, 권고, 히스토리)"""
+        # 순간값 기준 정상 (통계 패턴은 CRITICAL 패턴이 아니므로 등급은 항상 NORMAL)
+        instant_normal = severity_score == 0 and pattern_mask == 0
+
+        # 통계적 이상 패턴 추가 (히스토리 기반)
+        pattern_mask |= self._detect_statistical_anomalies(idx)
+
+        if instant_normal:
+            status_grade = VFDStatus.NORMAL
+            recommendation = NORMAL_RECOMMENDATION
+        else:
+            # 상태 등급 판정
+            status_grade = self._determine_status_grade(
+                severity_score, bool(pattern_mask & CRITICAL_PATTERN_MASK)
+            )
+
+            # severity와 anomaly_patterns 일관성 유지
+            # VFD_WARNING은 severity +60을 의미하므로, severity < 51이면 제거
+            if severity_score < 51:
+                pattern_mask &= ~PAT_VFD_WARNING
 
-        if status_bits.trip:
-            self.trip_counts[vfd_id] += 1
-        if status_bits.error:
-            self.error_counts[vfd_id] += 1
-        if status_bits.warning:
-            self.warning_counts[vfd_id] += 1
+            # 권고사항
+            recommendation = self._generate_recommendation(status_grade, pattern_mask)
+
+        # 패턴 이름 목록 (마스크별 캐시된 인턴 문자열 튜플에서 생성)
+        anomaly_patterns = list(_pattern_names(pattern_mask))
 
         diagnostic = VFDDiagnostic(
-            timestamp=datetime.now(),
+            timestamp=now,
             vfd_id=vfd_id,
             status_bits=status_bits,
             current_frequency_hz=frequency_hz,
@@ -279,114 +654,56 @@ class VFDMonitor:
             severity_score=severity_score,
             anomaly_patterns=anomaly_patterns,
             recommendation=recommendation,
-            cumulative_runtime_hours=self.cumulative_runtime[vfd_id],
-            trip_count=self.trip_counts[vfd_id],
-            error_count=self.error_counts[vfd_id],
-            warning_count=self.warning_counts[vfd_id]
+            cumulative_runtime_hours=float(self._runtime_hours[idx]),
+            trip_count=int(self._trip_counts[idx]),
+            error_count=int(self._error_counts[idx]),
+            warning_count=int(self._warning_counts[idx])
         )
 
         # 히스토리 저장 (최근 1000개)
         self.diagnostic_history[vfd_id].append(diagnostic)
-        if len(self.diagnostic_history[vfd_id]) > 1000:
-            self.diagnostic_history[vfd_id] = self.diagnostic_history[vfd_id][-1000:]
+        self.latest[vfd_id] = diagnostic
+        self._warning_mask[idx] = (
+            (self._warning_mask[idx] << 1) | (1 if status_bits.warning else 0)
+        ) & _TREND_WINDOW_MASK
+        self._motor_temp_buf[idx, self._sample_count[idx] % TREND_WINDOW] = motor_temp_c
+        self._sample_count[idx] += 1
 
         # 활성 이상 징후 업데이트
-        self.update_active_anomalies(vfd_id, diagnostic)
+        self.update_active_anomalies(vfd_id, diagnostic, now, auto_clear=auto_clear)
 
         return diagnostic
 
-    def _analyze_anomaly_patterns(
-        self,
-        vfd_id: str,
-        status_bits: DanfossStatusBits,
-        motor_temp: float,
-        heatsink_temp: float,
-        output_voltage: float,
-        dc_bus_voltage: float
-    ) -> List[str]:
-        """이상 패턴 분석"""
-        patterns = []
-
-        # StatusBits 기반
-        if status_bits.trip:
-            patterns.append("VFD_TRIP")
-        if status_bits.error:
-            patterns.append("VFD_ERROR")
-        if status_bits.warning:
-            patterns.append("VFD_WARNING")
-        if status_bits.voltage_exceeded:
-            patterns.append("VOLTAGE_EXCEEDED")
-        if status_bits.torque_exceeded:
-            patterns.append("TORQUE_EXCEEDED")
-        if status_bits.thermal_exceeded:
-            patterns.append("THERMAL_EXCEEDED")
-
-        # 온도 기반
-        if motor_temp > self.temp_threshold_motor:
-            patterns.append("MOTOR_OVERTEMP")  # 현재 과열
-        elif motor_temp > self.temp_threshold_motor - 10:
-            patterns.append("MOTOR_TEMP_WARNING")  # 예방 경고 (70°C 이상)
-
-        if heatsink_temp > self.temp_threshold_heatsink:
-            patterns.append("HEATSINK_OVERTEMP")
-
-        # 전압 기반
-        if output_voltage < self.voltage_range[0]:
-            patterns.append("VOLTAGE_LOW")
-        elif output_voltage > self.voltage_range[1]:
-            patterns.append("VOLTAGE_HIGH")
-
-        # DC 버스 전압 (정상: 540V ± 10%)
-        if dc_bus_voltage < 486 or dc_bus_voltage > 594:
-            patterns.append("DC_BUS_ABNORMAL")
-
-        # 준비 상태 체크
-        if not status_bits.control_ready:
-            patterns.append("CONTROL_NOT_READY")
-        if not status_bits.drive_ready:
-            patterns.append("DRIVE_NOT_READY")
-
-        # 속도 불일치 (운전 중)
-        if status_bits.in_operation and not status_bits.speed_equals_reference:
-            patterns.append("SPEED_MISMATCH")
-
-        # 통계적 이상 패턴 (히스토리 기반)
-        stat_patterns = self._detect_statistical_anomalies(vfd_id)
-        patterns.extend(stat_patterns)
-
-        return patterns
+    def _detect_statistical_anomalies(self, idx: int) -> int:
+        """통계적 이상 패턴 감지 (VFD 인덱스 기준, 패턴 비트마스크 반환)"""
+        patterns = 0
 
-    def _detect_statistical_anomalies(self, vfd_id: str) -> List[str]:
-        """통계적 이상 패턴 감지"""
-        patterns = []
-
-        history = self.diagnostic_history[vfd_id]
-        if len(history) < 30:
+        sample_count = self._sample_count[idx]
+        if sample_count < TREND_WINDOW:
             return patterns
 
-        # 최근 30개 데이터
-        recent = history[-30:]
-
-        # 온도 증가 추세
-        motor_temps = [d.motor_temperature_c for d in recent]
-        temp_trend = np.polyfit(range(len(motor_temps)), motor_temps, 1)[0]
-        if temp_trend > 0.5:  # 0.5°C/샘플 이상 증가
-            patterns.append("TEMP_RISING_TREND")
-
-        # 경고 빈도 증가
-        warning_rate = sum(1 for d in recent if d.status_bits.warning) / len(recent)
+        # 온도 증가 추세 (최근 30개 링 버퍼, 선형 회귀 기울기 닫힌 형태)
+        # 샘플 1개 추가로는 기울기가 거의 변하지 않으므로 TREND_RECOMPUTE_INTERVAL마다 재계산
+        if sample_count - self._trend_computed_at[idx] >= TREND_RECOMPUTE_INTERVAL:
+            x_rolled = _TREND_X_ROLLED[sample_count % TREND_WINDOW]
+            temp_trend = float(x_rolled @ self._motor_temp_buf[idx]) / _TREND_X_NORM
+            # 0.5°C/샘플 이상 증가
+            self._trend_cache[idx] = PAT_TEMP_RISING_TREND if temp_trend > 0.5 else 0
+            self._trend_computed_at[idx] = sample_count
+        patterns |= self._trend_cache[idx]
+
+        # 경고 빈도 증가 (롤링 비트마스크 popcount)
+        warning_rate = bin(self._warning_mask[idx]).count('1') / TREND_WINDOW
         if warning_rate > 0.3:  # 30% 이상
-            patterns.append("FREQUENT_WARNINGS")
+            patterns |= PAT_FREQUENT_WARNINGS
 
         return patterns
 
-    def _determine_status_grade(
-        self,
-        severity_score: int,
-        anomaly_patterns: List[str]
-    ) -> VFDStatus:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _determine_status_grade(severity_score: int, has_critical: bool) -> VFDStatus:
         """
-        상태 등급 판정
+        상태 등급 판정 (점수, 심각 패턴 여부 조합별 캐시)
 
         점수 기준:
         - 0-20: 정상
@@ -394,9 +711,8 @@ class VFDMonitor:
         - 51-75: 경고
         - 76-100: 위험
         """
-        # 심각한 패턴 체크
-        critical_patterns = {"VFD_TRIP", "VFD_ERROR", "THERMAL_EXCEEDED", "MOTOR_OVERTEMP"}
-        if any(p in critical_patterns for p in anomaly_patterns):
+        # 심각한 패턴 체크 (CRITICAL_PATTERN_MASK)
+        if has_critical:
             return VFDStatus.CRITICAL
 
         # 점수 기반
@@ -409,52 +725,32 @@ class VFDMonitor:
         else:
             return VFDStatus.NORMAL
 
-    def _generate_recommendation(
-        self,
-        status_grade: VFDStatus,
-        anomaly_patterns: List[str],
-        status_bits: DanfossStatusBits
-    ) -> str:
-        """권고사항 생성"""
-        if status_grade == VFDStatus.NORMAL:
-            return "정상 운전 중"
-
-        recommendations = []
-
-        if status_grade == VFDStatus.CRITICAL:
-            recommendations.append("⚠️ 즉시 점검 필요")
-
-        # 패턴별 권고
-        if "VFD_TRIP" in anomaly_patterns:
-            recommendations.append("VFD 트립 원인 확인 필요")
-        if "MOTOR_OVERTEMP" in anomaly_patterns or "THERMAL_EXCEEDED" in anomaly_patterns:
-            recommendations.append("모터 냉각 점검 및 부하 확인")
-        if "HEATSINK_OVERTEMP" in anomaly_patterns:
-            recommendations.append("히트싱크 청소 및 냉각팬 점검")
-        if "VOLTAGE_HIGH" in anomaly_patterns or "VOLTAGE_LOW" in anomaly_patterns:
-            recommendations.append("전원 공급 상태 점검")
-        if "TORQUE_EXCEEDED" in anomaly_patterns:
-            recommendations.append("기계 부하 과다, 점검 필요")
-        if "SPEED_MISMATCH" in anomaly_patterns:
-            recommendations.append("VFD 파라미터 및 통신 확인")
-        if "TEMP_RISING_TREND" in anomaly_patterns:
-            recommendations.append("온도 상승 추세 관찰 중, 주의")
-
-        if not recommendations:
-            if status_grade == VFDStatus.WARNING:
-                recommendations.append("정기 점검 권장")
-            elif status_grade == VFDStatus.CAUTION:
-                recommendations.append("관찰 필요")
-
-        return " | ".join(recommendations)
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _generate_recommendation(status_grade: VFDStatus, pattern_mask: int) -> str:
+        """권고사항 생성 (등급, 패턴 비트마스크 조합별 캐시)"""
+        if status_grade is VFDStatus.NORMAL:
+            return NORMAL_RECOMMENDATION
+
+        # 패턴별 권고 (중간 리스트 없이 join)
+        pattern_texts = (
+            text for rule_mask, text in RECOMMENDATION_RULES if pattern_mask & rule_mask
+        )
+
+        if status_grade is VFDStatus.CRITICAL:
+            return " | ".join(chain((CRITICAL_RECOMMENDATION,), pattern_texts))
+
+        if pattern_mask & RECOMMENDATION_RULE_MASK:
+            return " | ".join(pattern_texts)
+
+        # 해당 패턴 권고가 없으면 등급별 기본 문구
+        if status_grade is VFDStatus.WARNING:
+            return "정기 점검 권장"
+        return "관찰 필요"
 
     def get_all_vfd_status(self) -> Dict[str, VFDDiagnostic]:
         """전체 VFD 최신 상태"""
-        status = {}
-        for vfd_id in self.vfds.keys():
-            if self.diagnostic_history[vfd_id]:
-                status[vfd_id] = self.diagnostic_history[vfd_id][-1]
-        return status
+        return self.latest.copy()
 
     def acknowledge_anomaly(self, vfd_id: str) -> bool:
         """
@@ -469,17 +765,12 @@ class VFDMonitor:
         if vfd_id not in self.active_anomalies:
             return False
 
+        # active_anomalies는 diagnostic_history에 저장된 최신 진단과 같은 객체이므로
+        # 히스토리에도 그대로 반영됨
         anomaly = self.active_anomalies[vfd_id]
         anomaly.is_acknowledged = True
         anomaly.acknowledged_at = datetime.now()
 
-        # 히스토리에도 업데이트
-        for diag in self.diagnostic_history[vfd_id]:
-            if diag.timestamp == anomaly.timestamp:
-                diag.is_acknowledged = True
-                diag.acknowledged_at = anomaly.acknowledged_at
-                break
-
         return True
 
     def clear_anomaly(self, vfd_id: str) -> bool:
@@ -501,6 +792,7 @@ class VFDMonitor:
 
         # 히스토리에 저장
         self.anomaly_history.append(anomaly)
+        self._anomaly_history_by_vfd.setdefault(vfd_id, deque()).append(anomaly)
 
         # active_anomalies에서 제거
         del self.active_anomalies[vfd_id]
@@ -511,26 +803,31 @@ class VFDMonitor:
 
         return True
 
-    def check_auto_clear(self):
+    def check_auto_clear(self, now: Optional[datetime] = None):
         """
         자동 해제 조건 확인 및 처리
 
         조건:
         - 이상 비트가 해제된 후
         - 설정된 대기 시간(기본 10분) 경과
+
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
         """
-        current_time = datetime.now()
+        if not self.active_anomalies:
+            return
+
+        current_time = now or datetime.now()
         vfds_to_clear = []
 
         for vfd_id, anomaly in self.active_anomalies.items():
             # 가장 최근 진단 결과 확인
-            if not self.diagnostic_history[vfd_id]:
+            latest_diag = self.latest.get(vfd_id)
+            if latest_diag is None:
                 continue
 
-            latest_diag = self.diagnostic_history[vfd_id][-1]
-
             # 현재 정상 상태이고, 확인 완료 상태인 경우
-            if (latest_diag.status_grade == VFDStatus.NORMAL and
+            if (latest_diag.status_grade is VFDStatus.NORMAL and
                 anomaly.is_acknowledged and
                 anomaly.acknowledged_at):
 
@@ -543,16 +840,24 @@ class VFDMonitor:
         for vfd_id in vfds_to_clear:
             self.clear_anomaly(vfd_id)
 
-    def update_active_anomalies(self, vfd_id: str, diagnostic: VFDDiagnostic):
+    def update_active_anomalies(
+        self,
+        vfd_id: str,
+        diagnostic: VFDDiagnostic,
+        now: Optional[datetime] = None,
+        auto_clear: bool = True
+    ):
         """
         활성 이상 징후 업데이트
 
         Args:
             vfd_id: VFD ID
             diagnostic: 진단 결과
+            now: 기준 시각 (None이면 현재 시각)
+            auto_clear: 자동 해제 체크 수행 여부 (일괄 진단은 주기 끝에 1회 수행)
         """
         # 정상 상태로 돌아오면 cleared_anomalies에서 제거 (다음 이상 발생 시 다시 표시)
-        if diagnostic.status_grade == VFDStatus.NORMAL:
+        if diagnostic.status_grade is VFDStatus.NORMAL:
             if vfd_id in self.cleared_anomalies:
                 self.cleared_anomalies.discard(vfd_id)
             return
@@ -562,7 +867,7 @@ class VFDMonitor:
             return
 
         # 이상 상태인 경우 active_anomalies에 추가
-        if diagnostic.status_grade != VFDStatus.NORMAL:
+        if diagnostic.status_grade is not VFDStatus.NORMAL:
             if vfd_id not in self.active_anomalies:
                 # 새로운 이상 징후
                 self.active_anomalies[vfd_id] = diagnostic
@@ -574,7 +879,15 @@ class VFDMonitor:
                 self.active_anomalies[vfd_id] = diagnostic
 
         # 자동 해제 체크
-        self.check_auto_clear()
+        if auto_clear:
+            self._maybe_check_auto_clear(now or datetime.now())
+
+    def _maybe_check_auto_clear(self, now: datetime):
+        """자동 해제 체크 (auto_clear_check_interval_seconds 간격으로만 수행)"""
+        if (now - self._last_auto_clear_check).total_seconds() < self.auto_clear_check_interval_seconds:
+            return
+        self._last_auto_clear_check = now
+        self.check_auto_clear(now)
 
     def get_anomaly_status(self, vfd_id: str) -> Optional[VFDDiagnostic]:
         """
@@ -601,14 +914,13 @@ class VFDMonitor:
         """
         if vfd_id:
             # 특정 VFD의 히스토리
-            history = [diag for diag in self.anomaly_history if diag.vfd_id == vfd_id]
+            history = self._anomaly_history_by_vfd.get(vfd_id, ())
         else:
             # 전체 히스토리
             history = self.anomaly_history
 
-        # 최신순으로 정렬
-        history_sorted = sorted(history, key=lambda x: x.timestamp, reverse=True)
-        return history_sorted[:limit]
+        # 최신순 상위 limit개 (전체 정렬 없이 선택)
+        return heapq.nlargest(limit, history, key=attrgetter('timestamp'))
 
     def get_active_anomalies(self) -> Dict[str, VFDDiagnostic]:
         """
@@ -621,27 +933,28 @@ class VFDMonitor:
 
     def get_vfd_status_summary(self) -> Dict:
         """VFD 상태 요약"""
-        all_status = self.get_all_vfd_status()
+        all_status = self.latest
+
+        # 등급별 개수 (분기 없이 bincount)
+        grades = np.fromiter(
+            (_GRADE_INDEX[d.status_grade] for d in all_status.values()),
+            dtype=np.int8, count=len(all_status)
+        )
+        counts = np.bincount(grades, minlength=len(_GRADE_INDEX)).tolist()
 
         summary = {
             'total_vfds': len(self.vfds),
-            'normal': 0,
-            'caution': 0,
-            'warning': 0,
-            'critical': 0,
+            'normal': counts[_GRADE_INDEX[VFDStatus.NORMAL]],
+            'caution': counts[_GRADE_INDEX[VFDStatus.CAUTION]],
+            'warning': counts[_GRADE_INDEX[VFDStatus.WARNING]],
+            'critical': counts[_GRADE_CRITICAL_INDEX],
             'critical_vfds': []
         }
 
-        for vfd_id, diagnostic in all_status.items():
-            grade = diagnostic.status_grade
-            if grade == VFDStatus.NORMAL:
-                summary['normal'] += 1
-            elif grade == VFDStatus.CAUTION:
-                summary['caution'] += 1
-            elif grade == VFDStatus.WARNING:
-                summary['warning'] += 1
-            elif grade == VFDStatus.CRITICAL:
-                summary['critical'] += 1
-                summary['critical_vfds'].append(vfd_id)
+        if counts[_GRADE_CRITICAL_INDEX]:
+            summary['critical_vfds'] = [
+                vfd_id for vfd_id, d in all_status.items()
+                if d.status_grade is VFDStatus.CRITICAL
+            ]
 
         return summary
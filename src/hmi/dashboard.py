@@ -6,18 +6,21 @@ HMI_V1 스타일 적용 - 완전히 새로운 구조
 """
 
 import streamlit as st
-from streamlit_autorefresh import st_autorefresh
-import time
+from collections import deque
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 import sys
 import os
-import csv
-import io
 import importlib
+import operator
+import re
+import bisect
+import time
 
 # Add parent directory to path for imports
 root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -25,18 +28,335 @@ sys.path.insert(0, root_dir)
 
 from modbus_client import EdgeModbusClient
 import config
-importlib.reload(config)  # config 모듈 reload
+
+# 개발 모드: Streamlit 재실행 시 config / vfd_monitor 최신 코드 반영 (운영에서는 최초 1회 import)
+DEV_RELOAD = bool(os.environ.get("EDGE_DEV_RELOAD"))
+if DEV_RELOAD:
+    importlib.reload(config)  # config 모듈 reload
 
 # 시나리오 엔진 import
 from src.simulation.scenarios import SimulationScenarios, ScenarioType
 from src.control.integrated_controller import IntegratedController
+import src.diagnostics.vfd_monitor as vfd_monitor_module
+from src.hmi.savings_kernel import group_power_kernel, GROUP_FAN
+
+# 실시간 패널 갱신 주기 (초) - st.fragment 단위로 해당 패널만 재실행
+LIVE_REFRESH_SECONDS = 3
+
+# PLC 스냅샷 재사용 시간 (초) - 한 번의 재실행/동시 갱신되는 패널들이 Modbus 읽기 1회를 공유
+# 갱신 주기보다 짧아야 매 주기마다 새 데이터를 읽음
+PLC_SNAPSHOT_MAX_AGE = 1.0
+
+# 세션 이력 최대 보관 개수 (3초 주기 기준 약 3시간) - 초과 시 오래된 항목부터 자동 삭제
+SESSION_HISTORY_MAXLEN = 3600
+
+# VFD 이상 패턴 한글 매핑 (모듈 로드 시 1회 생성)
+_ANOMALY_PATTERN_NAMES: Dict[str, str] = {
+    "MOTOR_OVERTEMP": "⚠️ 모터 과열 (80°C 초과)",
+    "MOTOR_TEMP_WARNING": "📊 모터 온도 주의 (예측: 70°C 이상)",
+    "HEATSINK_OVERTEMP": "⚠️ 히트싱크 과열",
+    "VOLTAGE_LOW": "⚡ 출력 전압 저하",
+    "VOLTAGE_HIGH": "⚡ 출력 전압 과다",
+    "DC_BUS_ABNORMAL": "🔌 DC 버스 전압 이상",
+    "CURRENT_HIGH": "⚡ 전류 과다",
+    "VIBRATION_HIGH": "📳 진동 과다",
+    "THERMAL_EXCEEDED": "🔥 열 보호 작동",
+    "VFD_TRIP": "🛑 VFD 트립",
+    "VFD_ERROR": "❌ VFD 오류",
+    "TEMP_RISING": "📈 온도 상승 추세 (예측)",
+    "CURRENT_UNSTABLE": "⚡ 전류 불안정 (예측)",
+}
+
+# Plotly 다크 테마 공통 레이아웃 (fig.update_layout(**_CHART_THEME, ...))
+_CHART_THEME = MappingProxyType({
+    'template': "plotly_dark",
+    'paper_bgcolor': '#1e293b',
+    'plot_bgcolor': '#1e293b',
+})
+
+# 실시간 패널 차트 설정 - 갱신 주기마다 다시 그려져 확대/호버 상태가 유지되지 않으므로 정적 렌더링
+_LIVE_PLOT_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# 다크 테마 테이블 셀 템플릿 (% 포맷: 배경, 글자, 굵기, 값 / 헤더명)
+_TD_TMPL = (
+    '<td style="background-color:%s;color:%s;font-weight:%s;text-align:center;'
+    'padding:6px;font-size:11px;border-bottom:1px solid #334155">%s</td>'
+)
+_TH_TMPL = (
+    '<th style="background-color:#1e40af;color:white;font-weight:bold;text-align:center;'
+    'padding:8px;font-size:11px;border-bottom:2px solid #3b82f6">%s</th>'
+)
+
+# 에너지 절감 요약 카드 템플릿 (% 포맷: 제목, 값, 보조 값)
+_SUMMARY_CARD_TMPL = (
+    '<div class="card">'
+    '<h4 style="color: #94a3b8; margin-bottom: 0.5rem;">%s</h4>'
+    '<h2 style="color: #3b82f6; margin: 0;">%s</h2>'
+    '<p style="color: #10b981; margin-top: 0.5rem;">%s</p>'
+    '</div>'
+)
+
+# VFD 중증도 레벨별 카드 스타일 (색상, 상태, 아이콘) - 3 이상은 위험
+_SEVERITY_CARD_STYLES = {
+    0: ("#10b981", "정상", "🟢"),  # 녹색
+    1: ("#f59e0b", "주의", "🟡"),  # 노란색
+    2: ("#ff9800", "경고", "🟠"),  # 주황색
+}
+_SEVERITY_CARD_CRITICAL = ("#f44336", "위험", "🔴")  # 빨간색
+
+# VFD 중증도 레벨 → (이름, 상태 등급) - 그 외 레벨은 정상
+_SEVERITY_LABELS = {
+    0: ("정상", "normal"),
+    1: ("주의", "caution"),
+    2: ("경고", "warning"),
+    3: ("위험", "critical"),
+}
+
+# VFD 진단 표시용 PLC raw 필드 (한 번의 itemgetter 호출로 추출, 기본값 0)
+_VFD_RAW_FIELDS = (
+    'motor_thermal', 'heatsink_temp', 'inverter_thermal', 'motor_current', 'warning_word', 'over_temps',
+    'phase_u_current', 'phase_v_current', 'phase_w_current', 'frequency', 'dc_link_voltage', 'run_hours',
+    'num_starts', 'kwh_counter',
+)
+_VFD_RAW_DEFAULTS = MappingProxyType(dict.fromkeys(_VFD_RAW_FIELDS, 0))
+_get_vfd_raw_fields = operator.itemgetter(*_VFD_RAW_FIELDS)
+
+# 장비별 정격 전류 (A) - VFD 진단 파라미터 표시용
+_VFD_RATED_CURRENTS = {'SWP': 300.0, 'FWP': 370.0, 'FAN': 70.0}
+
+# VFD 중증도 레벨별 정비 메시지 / 우선순위 (레벨은 0-3으로 제한하여 조회)
+_SEVERITY_MAINTENANCE = (
+    ("정상 운전 중", "낮음"),
+    ("모니터링 강화", "낮음"),
+    ("정비 계획 수립", "중간"),
+    ("즉시 점검 필요", "높음"),
+)
+
+# VFD ID → 장비명 접두어 변환 (SW_PUMP_1 → SWP1, 정규식 1회 탐색)
+_VFD_ID_PREFIXES = {"SW_PUMP_": "SWP", "FW_PUMP_": "FWP", "ER_FAN_": "FAN"}
+_VFD_ID_PREFIX_RE = re.compile("|".join(_VFD_ID_PREFIXES))
+
+# 이상 징후 이력 상태 표시 (DB status → 표시 문자열, 그 외는 활성)
+_ANOMALY_STATUS_LABELS = {
+    'AUTO_CLEARED': "자동해제",
+    'CLEARED': "해제됨",
+    'ACKNOWLEDGED': "확인됨",
+}
+
+# 전체 센서 테이블 행 (키, 설명, 값 포맷)
+_SENSOR_TABLE_ROWS = (
+    ('TX1', 'CSW PP Disc Temp', "%.1f °C"),
+    ('TX2', 'No.1 CLR SW Out Temp', "%.1f °C"),
+    ('TX3', 'No.2 CLR SW Out Temp', "%.1f °C"),
+    ('TX4', 'CLR FW In Temp', "%.1f °C"),
+    ('TX5', 'CLR FW Out Temp', "%.1f °C"),
+    ('TX6', 'E/R Inside Temp', "%.1f °C"),
+    ('TX7', 'E/R Outside Temp', "%.1f °C"),
+    ('PX1', 'CSW PP Disc Press', "%.2f kg/cm²"),
+    ('PU1', 'M/E Load', "%.1f %%"),
+)
+
+# 이상 징후 목록 건강도 구간 (health_score 기준: 0-24 위험, 25-49 경고, 50-79 주의)
+_HEALTH_WARNING_THRESHOLDS = (25, 50)
+_HEALTH_WARNING_LEVELS = (("🔴", "위험"), ("🟠", "경고"), ("⚠️", "주의"))
+
+# 카드 그리드 여는 태그 (% 포맷: 열 개수, 세로 간격은 .card margin-bottom 사용)
+_CARD_GRID_TMPL = '<div style="display: grid; grid-template-columns: repeat(%d, minmax(0, 1fr)); column-gap: 1rem;">'
+_VFD_CARD_GRID_OPEN = _CARD_GRID_TMPL % 5
+_SUMMARY_CARD_GRID_OPEN = _CARD_GRID_TMPL % 4
+
+# 장비 그룹별 테이블 행 색상 (배경, 글자)
+_GROUP_COLORS = {
+    'SWP': ('#0f4c5c', '#5eead4'),  # 청록색 계열
+    'FWP': ('#4c1d95', '#c4b5fd'),  # 보라색 계열
+    'FAN': ('#7c2d12', '#fdba74'),  # 주황색 계열
+}
+_DEFAULT_GROUP_COLORS = ('#1e293b', '#e2e8f0')
+
+# 주파수 비교 테이블 컬럼 및 고정 HTML (헤더 포함, 모듈 로드 시 1회 생성)
+_FREQ_COLUMNS = ('장비명', '목표 주파수 (Hz)', '실제 주파수 (Hz)', '편차 (Hz)', '전력 (kW)', '상태')
+_FREQ_HEADER_HTML = '<thead><tr>' + ''.join(_TH_TMPL % col for col in _FREQ_COLUMNS) + '</tr></thead>'
+_FREQ_TABLE_OPEN = '<table style="width:100%;border-collapse:collapse;margin-bottom:10px">'
+_FREQ_TABLE_CLOSE = '</tbody></table>'
+
+# 장비별 상세 분석 테이블 컬럼 및 헤더 HTML (래퍼/꼬리는 주파수 비교 테이블과 공용)
+_DETAIL_COLUMNS = ('장비명', '운전 상태', '주파수 (Hz)', '실제 전력 (kW)', '60Hz 전력 (kW)', '절감 전력 (kW)', '절감률 (%)')
+_DETAIL_HEADER_HTML = '<thead><tr>' + ''.join(_TH_TMPL % col for col in _DETAIL_COLUMNS) + '</tr></thead>'
+
+# 기간별 절감 추이 임시 데이터 축 / 분포 계수 (절감 전력만 곱해 사용, 모듈 로드 시 1회 생성)
+_SAVINGS_HOURS = list(range(24))
+_SAVINGS_DAYS = list(range(1, 31))
+_SAVINGS_MONTHS = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
+_HOUR_SHAPE = 0.8 + 0.4 * np.abs((np.arange(24) - 12) / 12)
+_DAY_SHAPE = 0.9 + 0.2 * (np.arange(1, 31) % 7) / 7
+_MONTH_SHAPE = 0.85 + 0.3 * (np.arange(12) % 4) / 4
+
+# 센서 트렌드 임시 데이터 오프셋 (5분 간격 12점, 기준값에 더해 사용)
+_SENSOR_TREND_OFFSETS = ((np.arange(12) % 4) - 2) * 2.0
+
+# 표준 10대 구성의 장비별 그룹 인덱스 (0-2: SWP, 3-5: FWP, 6-9: FAN, 읽기 전용)
+_EQUIPMENT_GROUP = np.minimum(np.arange(10) // 3, GROUP_FAN)
+_EQUIPMENT_GROUP.flags.writeable = False
+
+# 장비 목록 구간 (config.EQUIPMENT_LIST 순서: SWP1-3, FWP1-3, FAN1-4)
+_PUMP_SLICE = slice(0, 6)
+_FAN_SLICE = slice(6, 10)
+
+
+# 시나리오 기본값 (모듈 로드 시 1회 생성, 읽기 전용)
+_DEFAULT_SCENARIO_TYPE = ScenarioType.NORMAL_OPERATION
+_DEFAULT_FREQS = MappingProxyType({
+    'sw_pump': 48.0,
+    'fw_pump': 48.0,
+    'er_fan': 48.0,
+    'er_fan_count': 3,  # E/R 팬 기본 3대
+    'time_at_max_freq': 0,  # 60Hz 유지 시간 (초)
+    'time_at_min_freq': 0   # 40Hz 유지 시간 (초)
+})
+
+
+# 지표 그리드 항목 템플릿 (% 포맷: 라벨, 값) - 스타일은 static/dashboard.css .metric-grid
+_METRIC_ITEM_TMPL = '<div><div class="metric-label">%s</div><div class="metric-value">%s</div></div>'
+
+
+def _metric_grid_html(metrics) -> str:
+    """(라벨, 값) 목록을 4열 지표 그리드 HTML로 변환"""
+    return '<div class="metric-grid">' + ''.join(_METRIC_ITEM_TMPL % item for item in metrics) + '</div>'
+
+
+def _build_auto_diag(vfd_id: str):
+    """
+    이상 징후 확인 시 active_anomalies에 없는 VFD용 진단 객체 생성
+
+    vfd_monitor_module 경유 참조 (DEV_RELOAD 시 reload된 클래스 사용)
+    """
+    status_bits = vfd_monitor_module.DanfossStatusBits(
+        trip=False, error=False, warning=True,
+        voltage_exceeded=False, torque_exceeded=False, thermal_exceeded=False,
+        control_ready=True, drive_ready=True, in_operation=True, speed_equals_reference=True, bus_control=True
+    )
+    return vfd_monitor_module.VFDDiagnostic(
+        timestamp=datetime.now(), vfd_id=vfd_id, status_bits=status_bits,
+        current_frequency_hz=0, output_current_a=0, output_voltage_v=380,
+        dc_bus_voltage_v=540, motor_temperature_c=50, heatsink_temperature_c=45,
+        status_grade=vfd_monitor_module.VFDStatus.CAUTION, severity_score=30, anomaly_patterns=["이상 징후"],
+        recommendation="점검 필요", cumulative_runtime_hours=0, trip_count=0, error_count=0, warning_count=0
+    )
+
+
+def _rated_capacity() -> Tuple[float, float, float]:
+    """정격 용량 (SWP, FWP, FAN) - 설정 화면에서 변경될 수 있으므로 호출마다 조회"""
+    motor_capacity = config.MOTOR_CAPACITY
+    return (motor_capacity['SWP'], motor_capacity['FWP'], motor_capacity['FAN'])
+
+
+def _history_factory(*keys):
+    """키별 deque(maxlen) 이력 딕셔너리 생성 함수 반환"""
+    return lambda: {key: deque(maxlen=SESSION_HISTORY_MAXLEN) for key in keys}
+
+
+# 알람 임계값 기본값 (설정 탭 최초 진입 시 세션별 복사본 생성)
+_DEFAULT_ALARM_THRESHOLDS = MappingProxyType({
+    # 온도 센서 (°C)
+    'TX1_high': 30.0,   # CSW PP Disc Temp
+    'TX2_high': 50.0,   # No.1 COOLER SW Out Temp
+    'TX3_high': 50.0,   # No.2 COOLER SW Out Temp
+    'TX4_high': 50.0,   # COOLER FW In Temp
+    'TX5_high': 40.0,   # COOLER FW Out Temp
+    'TX6_high': 50.0,   # E/R Inside Temp
+    'TX7_high': 40.0,   # E/R Outside Temp
+    # 압력 센서
+    'PX1_low': 1.5,     # CSW PP Disc Press 하한 (kg/cm²)
+    'PX1_high': 4.0,    # CSW PP Disc Press 상한 (kg/cm²)
+    # 부하
+    'PU1_high': 85.0,   # M/E Load 상한 (%)
+})
+
+# 알람 CSV 컬럼 (PLC 알람 로그 형식) / 범주형으로 보관할 컬럼
+_ALARM_CSV_COLUMNS = ['timestamp', 'sensor_id', 'alarm_type', 'sensor_value', 'threshold', 'status', 'ack_timestamp']
+_ALARM_CATEGORY_COLUMNS = ('sensor_id', 'alarm_type', 'status')
+
+# 알람 임계값 입력 사양 (키, 라벨, 최소, 최대, 단계, 위젯 키, PLC 배율, 전송 결과 표시 포맷)
+# 온도 → 압력/부하 순서가 PLC 레지스터 7000-7009 순서
+_TEMP_ALARM_SPECS = (
+    ('TX1_high', "TX1 (°C)", 20.0, 60.0, 1.0, "tx1_alarm", 10, "- TX1 상한: %s°C"),
+    ('TX2_high', "TX2 (°C)", 30.0, 70.0, 1.0, "tx2_alarm", 10, "- TX2 상한: %s°C"),
+    ('TX3_high', "TX3 (°C)", 30.0, 70.0, 1.0, "tx3_alarm", 10, "- TX3 상한: %s°C"),
+    ('TX4_high', "TX4 (°C)", 30.0, 70.0, 1.0, "tx4_alarm", 10, "- TX4 상한: %s°C"),
+    ('TX5_high', "TX5 (°C)", 30.0, 60.0, 1.0, "tx5_alarm", 10, "- TX5 상한: %s°C"),
+    ('TX6_high', "TX6 (°C)", 30.0, 80.0, 1.0, "tx6_alarm", 10, "- TX6 상한: %s°C"),
+    ('TX7_high', "TX7 (°C)", 20.0, 60.0, 1.0, "tx7_alarm", 10, "- TX7 상한: %s°C"),
+)
+_PROCESS_ALARM_SPECS = (
+    ('PX1_low', "PX1 하한 (kg/cm²)", 0.0, 5.0, 0.1, "px1_low_alarm", 100, "- PX1 하한: %s kg/cm²"),
+    ('PX1_high', "PX1 상한 (kg/cm²)", 0.0, 10.0, 0.1, "px1_high_alarm", 100, "- PX1 상한: %s kg/cm²"),
+    ('PU1_high', "PU1 상한 (%)", 50.0, 100.0, 1.0, "pu1_alarm", 10, "- PU1 상한: %s%%"),
+)
+_ALARM_THRESHOLD_SPECS = _TEMP_ALARM_SPECS + _PROCESS_ALARM_SPECS
+
+
+# 세션 상태 기본값 (값 또는 생성 함수 - 변경 가능한 객체는 세션마다 새로 생성)
+_SESSION_DEFAULTS = {
+    'selected_tab': 0,
+    'plc_connected': False,
+    'sensor_history': _history_factory('TX1', 'TX4', 'TX5', 'TX6', 'TX7', 'PU1', 'timestamps'),
+    'energy_history': _history_factory('total_savings', 'swp_savings', 'fwp_savings', 'fan_savings', 'timestamps'),
+    'alarm_log': lambda: deque(maxlen=SESSION_HISTORY_MAXLEN),
+    'event_log': lambda: deque(maxlen=SESSION_HISTORY_MAXLEN),
+    # 개발용: 학습 진행 데이터
+    'learning_progress': lambda: {
+        'temperature_prediction_accuracy': 82.5,
+        'optimization_accuracy': 79.3,
+        'average_energy_savings': 49.8,
+        'total_learning_hours': 192.5,
+        'last_learning_time': datetime.now() - timedelta(hours=2),
+        'months_running': 8
+    },
+    # 개발용: 시나리오 테스트 (EDGE_AI_REAL 시나리오 엔진 사용)
+    'scenario_engine': SimulationScenarios,
+    'scenario_history': _history_factory(
+        'timestamps',
+        'T1', 'T2', 'T3', 'T4', 'T5', 'T6', 'T7',
+        'PX1', 'engine_load',
+        'swp_freq', 'fwp_freq', 'fan_freq'
+    ),
+    # 시나리오 모드 관련 세션 상태
+    'use_scenario_data': False,
+    'current_scenario_type': _DEFAULT_SCENARIO_TYPE,
+    'current_frequencies': lambda: dict(_DEFAULT_FREQS),  # 제어 루프에서 갱신되므로 세션별 복사본
+    'selected_scenario_label': "기본 제어 검증",
+}
+
+
+# HMI_V1 스타일 CSS (static/dashboard.css - 정적 파일 서빙 시 브라우저가 캐시)
+_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'dashboard.css')
+# 파일 수정 시각을 쿼리로 붙여 CSS 변경 시 브라우저 캐시 무효화
+_CSS_LINK = '<link rel="stylesheet" href="app/static/dashboard.css?v=%d">' % int(os.path.getmtime(_CSS_PATH))
+# 정적 파일 서빙 비활성 시 인라인 대체 (모듈 로드 시 1회 생성)
+with open(_CSS_PATH, encoding='utf-8') as _css_file:
+    _CUSTOM_CSS = "<style>\n%s</style>\n" % _css_file.read()
 
 
 class EdgeComputerDashboard:
     """Edge Computer 대시보드 - HMI_V1 스타일"""
 
     def __init__(self):
-        """초기화"""
+        """초기화 (세션과 무관한 상태만 보관 - 인스턴스는 모든 세션이 공유)"""
+        # VFD 이상 패턴 한글 매핑
+        self.anomaly_pattern_names = _ANOMALY_PATTERN_NAMES
+
+    @property
+    def scenario_engine(self) -> SimulationScenarios:
+        """시나리오 엔진 (session state에서 가져오기)"""
+        return st.session_state.scenario_engine
+
+    @property
+    def integrated_controller(self) -> IntegratedController:
+        """IntegratedController (session state에서 가져오기)"""
+        return st.session_state.integrated_controller
+
+    def _prepare_session(self):
+        """매 실행마다 필요한 페이지 설정 / CSS / 세션 상태 준비"""
         # Streamlit 페이지 설정
         st.set_page_config(
             page_title="Edge Computer Dashboard",
@@ -58,687 +378,31 @@ class EdgeComputerDashboard:
             if not st.session_state.modbus_client.connected:
                 st.session_state.modbus_client.connect()
 
-        # 시나리오 엔진 (session state에서 가져오기)
-        self.scenario_engine = st.session_state.scenario_engine
-
         # IntegratedController 초기화
         if 'integrated_controller' not in st.session_state:
             st.session_state.integrated_controller = IntegratedController()
-        self.integrated_controller = st.session_state.integrated_controller
-
-        # VFD 이상 패턴 한글 매핑
-        self.anomaly_pattern_names = {
-            "MOTOR_OVERTEMP": "⚠️ 모터 과열 (80°C 초과)",
-            "MOTOR_TEMP_WARNING": "📊 모터 온도 주의 (예측: 70°C 이상)",
-            "HEATSINK_OVERTEMP": "⚠️ 히트싱크 과열",
-            "VOLTAGE_LOW": "⚡ 출력 전압 저하",
-            "VOLTAGE_HIGH": "⚡ 출력 전압 과다",
-            "DC_BUS_ABNORMAL": "🔌 DC 버스 전압 이상",
-            "CURRENT_HIGH": "⚡ 전류 과다",
-            "VIBRATION_HIGH": "📳 진동 과다",
-            "THERMAL_EXCEEDED": "🔥 열 보호 작동",
-            "VFD_TRIP": "🛑 VFD 트립",
-            "VFD_ERROR": "❌ VFD 오류",
-            "TEMP_RISING": "📈 온도 상승 추세 (예측)",
-            "CURRENT_UNSTABLE": "⚡ 전류 불안정 (예측)",
-        }
 
     def _apply_custom_css(self):
         """HMI_V1 스타일 CSS 적용"""
-        st.markdown("""
-        <style>
-        /* 전역 배경색 */
-        .stApp {
-            background-color: #0f172a;
-        }
-
-        /* 상단 헤더 영역 */
-        header[data-testid="stHeader"] {
-            background-color: #0f172a !important;
-        }
-
-        /* 상단 툴바 */
-        .stApp > header {
-            background-color: #0f172a !important;
-        }
-
-        /* 메인 컨텐츠 영역 */
-        .main .block-container {
-            padding-top: 1rem;
-            padding-bottom: 2rem;
-            background-color: #0f172a;
-        }
-
-        /* 메인 영역 전체 */
-        section[data-testid="stMain"] {
-            background-color: #0f172a;
-        }
-
-        /* 사이드바 */
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%) !important;
-        }
-
-        /* 사이드바 콘텐츠 */
-        [data-testid="stSidebar"] > div:first-child {
-            background-color: transparent !important;
-        }
-
-        /* 사이드바 내부 모든 텍스트 */
-        [data-testid="stSidebar"] * {
-            color: #e2e8f0 !important;
-        }
-
-        /* 사이드바 버튼 */
-        [data-testid="stSidebar"] button {
-            background-color: #3b82f6 !important;
-            color: white !important;
-            border: none !important;
-        }
-
-        /* 사이드바 버튼 호버 */
-        [data-testid="stSidebar"] button:hover {
-            background-color: #2563eb !important;
-        }
-
-        /* 사이드바 마크다운 */
-        [data-testid="stSidebar"] .stMarkdown {
-            color: #e2e8f0 !important;
-        }
-
-        /* 사이드바 라벨 */
-        [data-testid="stSidebar"] label {
-            color: #e2e8f0 !important;
-        }
-
-        /* Selectbox 드롭다운 메뉴 */
-        [data-baseweb="popover"] {
-            background-color: #1e293b !important;
-        }
-
-        [data-baseweb="select"] {
-            background-color: #1e293b !important;
-        }
-
-        /* Selectbox 옵션 리스트 */
-        [role="listbox"] {
-            background-color: #1e293b !important;
-        }
-
-        /* Selectbox 개별 옵션 */
-        [role="option"] {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [role="option"]:hover {
-            background-color: #334155 !important;
-            color: #ffffff !important;
-        }
-
-        /* Selectbox 선택된 옵션 */
-        [aria-selected="true"] {
-            background-color: #3b82f6 !important;
-            color: white !important;
-        }
-
-        /* Selectbox 입력 필드 */
-        [data-baseweb="select"] > div {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-            border-color: #334155 !important;
-        }
-
-        /* Selectbox 화살표 아이콘 */
-        [data-baseweb="select"] svg {
-            fill: #e2e8f0 !important;
-            cursor: pointer !important;
-        }
-
-        /* Selectbox 전체 컨테이너 */
-        .stSelectbox > div > div {
-            background-color: #1e293b !important;
-            border: 1px solid #334155 !important;
-            cursor: pointer !important;
-        }
-
-        /* Selectbox 텍스트 */
-        .stSelectbox > div > div > div {
-            color: #e2e8f0 !important;
-            cursor: pointer !important;
-        }
-
-        /* Selectbox 입력 영역 전체 */
-        [data-baseweb="select"] {
-            cursor: pointer !important;
-        }
-
-        [data-baseweb="select"] * {
-            cursor: pointer !important;
-        }
-
-        /* 데이터프레임 설정 아이콘 */
-        .stDataFrame button {
-            cursor: pointer !important;
-        }
-
-        .stDataFrame svg {
-            cursor: pointer !important;
-        }
-
-        /* 데이터프레임/테이블 스타일 */
-        .stDataFrame {
-            background-color: #1e293b !important;
-        }
-
-        /* 데이터프레임 테이블 */
-        .stDataFrame table {
-            background-color: #1e293b !important;
-            color: #ffffff !important;
-            font-size: 20px !important;
-            font-weight: 800 !important;
-        }
-
-        /* 데이터프레임 헤더 */
-        .stDataFrame thead tr th {
-            background-color: #0f172a !important;
-            color: #ffffff !important;
-            border-bottom: 2px solid #334155 !important;
-            font-size: 22px !important;
-            font-weight: 900 !important;
-            padding: 14px !important;
-        }
-
-        /* 데이터프레임 셀 */
-        .stDataFrame tbody tr td {
-            background-color: #1e293b !important;
-            color: #ffffff !important;
-            border-bottom: 1px solid #334155 !important;
-            font-size: 20px !important;
-            font-weight: 800 !important;
-            padding: 12px !important;
-        }
-
-        /* 데이터프레임 행 호버 */
-        .stDataFrame tbody tr:hover td {
-            background-color: #334155 !important;
-        }
-
-        /* 일반 테이블 */
-        table {
-            background-color: #1e293b !important;
-            color: #ffffff !important;
-            font-size: 20px !important;
-            font-weight: 800 !important;
-        }
-
-        thead {
-            background-color: #0f172a !important;
-            color: #ffffff !important;
-            font-size: 22px !important;
-            font-weight: 900 !important;
-        }
-
-        tbody {
-            background-color: #1e293b !important;
-            color: #ffffff !important;
-            font-size: 20px !important;
-            font-weight: 800 !important;
-        }
-
-        th {
-            background-color: #0f172a !important;
-            color: #ffffff !important;
-            border-bottom: 2px solid #334155 !important;
-            font-size: 22px !important;
-            font-weight: 900 !important;
-            padding: 14px !important;
-        }
-
-        td {
-            background-color: #1e293b !important;
-            color: #ffffff !important;
-            border-bottom: 1px solid #334155 !important;
-            font-size: 20px !important;
-            font-weight: 800 !important;
-            padding: 12px !important;
-        }
-
-        /* 데이터프레임 팝업 메뉴 */
-        [data-baseweb="menu"] {
-            background-color: #1e293b !important;
-        }
-
-        [data-baseweb="list"] {
-            background-color: #1e293b !important;
-        }
-
-        [data-baseweb="list-item"] {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [data-baseweb="list-item"]:hover {
-            background-color: #334155 !important;
-        }
-
-        /* 체크박스 */
-        [data-baseweb="checkbox"] {
-            background-color: #1e293b !important;
-        }
-
-        /* 팝업 전체 */
-        [role="menu"] {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [role="menuitem"] {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [role="menuitem"]:hover {
-            background-color: #334155 !important;
-        }
-
-        /* 모든 ul, li */
-        ul {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        li {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        li:hover {
-            background-color: #334155 !important;
-        }
-
-        /* 테이블 내부 모든 요소 강제 스타일 */
-        table * {
-            color: #ffffff !important;
-            font-size: 20px !important;
-            font-weight: 800 !important;
-        }
-
-        table th * {
-            color: #ffffff !important;
-            font-size: 22px !important;
-            font-weight: 900 !important;
-        }
-
-        table td * {
-            color: #ffffff !important;
-            font-size: 20px !important;
-            font-weight: 800 !important;
-        }
-
-        /* 배경 강제 스타일 */
-        div[data-baseweb] {
-            background-color: #1e293b !important;
-        }
-
-        /* 팝오버 모든 하위 요소 */
-        [data-baseweb="popover"] * {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [data-baseweb="menu"] * {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [data-baseweb="list"] * {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [data-baseweb="list-item"] * {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        /* 모든 svg 아이콘 */
-        svg {
-            fill: #e2e8f0 !important;
-        }
-
-        /* 헤더 텍스트 */
-        h1, h2, h3, h4, h5, h6 {
-            color: #e2e8f0 !important;
-        }
-
-        /* 일반 텍스트 */
-        p, span, div {
-            color: #e2e8f0;
-        }
-
-        /* 카드 스타일 */
-        div[data-testid="stMetricValue"] {
-            color: #3b82f6 !important;
-            font-size: 1.5rem !important;
-            font-weight: 700 !important;
-        }
-
-        div[data-testid="stMetricLabel"] {
-            color: #94a3b8 !important;
-        }
-
-        /* 탭 스타일 */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 0.5rem;
-            background-color: #1e293b;
-            padding: 0.5rem;
-            border-radius: 0.5rem;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            background-color: transparent;
-            color: #94a3b8;
-            border-radius: 0.5rem;
-            padding: 0.75rem 1.5rem;
-            font-weight: 500;
-        }
-
-        .stTabs [data-baseweb="tab"]:hover {
-            background-color: #334155;
-            color: #e2e8f0;
-        }
-
-        .stTabs [aria-selected="true"] {
-            background: #3b82f6 !important;
-            color: white !important;
-        }
-
-        /* 버튼 스타일 */
-        .stButton > button {
-            background: #3b82f6;
-            color: white;
-            border: none;
-            border-radius: 0.5rem;
-            padding: 0.75rem 1.5rem;
-            font-weight: 600;
-            transition: all 0.2s;
-        }
-
-        .stButton > button:hover {
-            background: #2563eb;
-            box-shadow: 0 4px 6px rgba(59, 130, 246, 0.3);
-        }
-
-        /* 테이블 스타일 */
-        .dataframe {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        .dataframe th {
-            background-color: #334155 !important;
-            color: #e2e8f0 !important;
-            font-weight: 600;
-        }
-
-        .dataframe td {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        /* 입력 필드 */
-        .stTextInput input, .stNumberInput input, .stSelectbox select, .stDateInput input {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-            border: 1px solid #334155 !important;
-        }
-
-        /* Date Input 커서 */
-        .stDateInput input {
-            cursor: pointer !important;
-        }
-
-        .stDateInput {
-            cursor: pointer !important;
-        }
-
-        .stDateInput * {
-            cursor: pointer !important;
-        }
-
-        /* Date Input 캘린더 아이콘 */
-        .stDateInput button {
-            background-color: #334155 !important;
-            color: #e2e8f0 !important;
-            cursor: pointer !important;
-        }
-
-        .stDateInput button svg {
-            fill: #e2e8f0 !important;
-            cursor: pointer !important;
-        }
-
-        /* Number Input 증감 버튼 */
-        .stNumberInput button {
-            background-color: #334155 !important;
-            color: #e2e8f0 !important;
-            border: 1px solid #475569 !important;
-        }
-
-        .stNumberInput button:hover {
-            background-color: #475569 !important;
-            color: #ffffff !important;
-        }
-
-        /* Number Input 증감 버튼 아이콘 (SVG) */
-        .stNumberInput button svg {
-            fill: #e2e8f0 !important;
-        }
-
-        .stNumberInput button:hover svg {
-            fill: #ffffff !important;
-        }
-
-        /* Expander 스타일 */
-        .streamlit-expanderHeader {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-            border-radius: 0.5rem !important;
-        }
-
-        .streamlit-expanderContent {
-            background-color: #0f172a !important;
-            color: #e2e8f0 !important;
-            border: 1px solid #334155 !important;
-        }
-
-        /* Info/Success/Warning/Error 메시지 */
-        .stAlert {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        [data-baseweb="notification"] {
-            background-color: #1e293b !important;
-            color: #e2e8f0 !important;
-        }
-
-        /* Info 메시지 */
-        .stInfo, [data-baseweb="notification"][kind="info"] {
-            background-color: rgba(59, 130, 246, 0.2) !important;
-            border-left: 4px solid #3b82f6 !important;
-            color: #e2e8f0 !important;
-        }
-
-        /* Success 메시지 */
-        .stSuccess, [data-baseweb="notification"][kind="positive"] {
-            background-color: rgba(16, 185, 129, 0.2) !important;
-            border-left: 4px solid #10b981 !important;
-            color: #e2e8f0 !important;
-        }
-
-        /* Warning 메시지 */
-        .stWarning, [data-baseweb="notification"][kind="warning"] {
-            background-color: rgba(251, 191, 36, 0.2) !important;
-            border-left: 4px solid #fbbf24 !important;
-            color: #e2e8f0 !important;
-        }
-
-        /* Error 메시지 */
-        .stError, [data-baseweb="notification"][kind="negative"] {
-            background-color: rgba(239, 68, 68, 0.2) !important;
-            border-left: 4px solid #ef4444 !important;
-            color: #e2e8f0 !important;
-        }
-
-        /* 성공/위험 색상 */
-        .success-text {
-            color: #10b981 !important;
-        }
-
-        .danger-text {
-            color: #ef4444 !important;
-        }
-
-        /* 카드 컨테이너 */
-        .card {
-            background: #1e293b;
-            border-radius: 0.75rem;
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-            margin-bottom: 1rem;
-        }
-
-        /* 그라디언트 헤더 */
-        .gradient-header {
-            background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);
-            padding: 1rem 2rem;
-            border-radius: 0.75rem;
-            color: white;
-            font-weight: 700;
-            font-size: 1.5rem;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-        }
-
-        /* 상태 표시 점 */
-        .status-dot {
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            display: inline-block;
-            margin-right: 0.5rem;
-            animation: pulse 2s infinite;
-        }
-
-        .status-dot.connected {
-            background: #10b981;
-        }
-
-        .status-dot.disconnected {
-            background: #ef4444;
-        }
-
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-
-        /* 경고 깜박임 */
-        @keyframes blink-warning {
-            0%, 100% { background: #ef4444; }
-            50% { background: #dc2626; }
-        }
-
-        .warning-blink {
-            animation: blink-warning 1s infinite;
-            color: white !important;
-            font-weight: 700;
-            padding: 0.5rem 1rem;
-            border-radius: 0.5rem;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        # .streamlit/config.toml 의 enableStaticServing 활성 시 <link> 만 전송
+        if st.get_option('server.enableStaticServing'):
+            st.markdown(_CSS_LINK, unsafe_allow_html=True)
+        else:
+            st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
     def _init_session_state(self):
         """세션 상태 초기화"""
-        if 'selected_tab' not in st.session_state:
-            st.session_state.selected_tab = 0
-
-        if 'plc_connected' not in st.session_state:
-            st.session_state.plc_connected = False
-
-        if 'sensor_history' not in st.session_state:
-            st.session_state.sensor_history = {
-                'TX1': [], 'TX4': [], 'TX5': [], 'TX6': [], 'TX7': [],
-                'PU1': [], 'timestamps': []
-            }
-
-        if 'energy_history' not in st.session_state:
-            st.session_state.energy_history = {
-                'total_savings': [],
-                'swp_savings': [],
-                'fwp_savings': [],
-                'fan_savings': [],
-                'timestamps': []
-            }
-
-        if 'alarm_log' not in st.session_state:
-            st.session_state.alarm_log = []
-
-        if 'event_log' not in st.session_state:
-            st.session_state.event_log = []
-
-        # 개발용: 학습 진행 데이터
-        if 'learning_progress' not in st.session_state:
-            st.session_state.learning_progress = {
-                'temperature_prediction_accuracy': 82.5,
-                'optimization_accuracy': 79.3,
-                'average_energy_savings': 49.8,
-                'total_learning_hours': 192.5,
-                'last_learning_time': datetime.now() - timedelta(hours=2),
-                'months_running': 8
-            }
-
-        # 개발용: 시나리오 테스트 (EDGE_AI_REAL 시나리오 엔진 사용)
-        if 'scenario_engine' not in st.session_state:
-            st.session_state.scenario_engine = SimulationScenarios()
-
-        if 'scenario_history' not in st.session_state:
-            st.session_state.scenario_history = {
-                'timestamps': [],
-                'T1': [], 'T2': [], 'T3': [], 'T4': [], 'T5': [], 'T6': [], 'T7': [],
-                'PX1': [], 'engine_load': [],
-                'swp_freq': [], 'fwp_freq': [], 'fan_freq': []
-            }
-
-        # 시나리오 모드 관련 세션 상태
-        if 'use_scenario_data' not in st.session_state:
-            st.session_state.use_scenario_data = False
-
-        if 'current_scenario_type' not in st.session_state:
-            st.session_state.current_scenario_type = ScenarioType.NORMAL_OPERATION
-
-        if 'current_frequencies' not in st.session_state:
-            st.session_state.current_frequencies = {
-                'sw_pump': 48.0,
-                'fw_pump': 48.0,
-                'er_fan': 48.0,
-                'er_fan_count': 3,
-                'time_at_max_freq': 0,
-                'time_at_min_freq': 0
-            }
-
-        if 'selected_scenario_label' not in st.session_state:
-            st.session_state.selected_scenario_label = "기본 제어 검증"
+        # 없는 키만 기본값 생성 (팩토리는 최초 1회만 호출)
+        session_state = st.session_state
+        for key, default in _SESSION_DEFAULTS.items():
+            if key not in session_state:
+                session_state[key] = default() if callable(default) else default
 
         # VFD 모니터 초기화 (이상 징후 관리)
-        # 모듈 reload하여 최신 코드 반영
-        import importlib
-        import src.diagnostics.vfd_monitor as vfd_monitor_module
-        importlib.reload(vfd_monitor_module)
-        from src.diagnostics.vfd_monitor import VFDMonitor
+        # 개발 모드에서만 모듈 reload하여 최신 코드 반영
+        if DEV_RELOAD:
+            importlib.reload(vfd_monitor_module)
+        VFDMonitor = vfd_monitor_module.VFDMonitor
 
         if 'vfd_monitor' not in st.session_state:
             st.session_state.vfd_monitor = VFDMonitor()
@@ -748,9 +412,9 @@ class EdgeComputerDashboard:
 
     def run(self):
         """메인 실행"""
-        # 자동 새로고침 (3초)
-        st_autorefresh(interval=3000, key="dashboard_refresh")
+        self._prepare_session()
 
+        # 자동 새로고침은 실시간 패널(@st.fragment)별로 수행 - 설정/로그 탭은 사용자 조작 시에만 재실행
         # 헤더
         self._render_header()
 
@@ -835,14 +499,12 @@ class EdgeComputerDashboard:
             st.markdown("#### PLC 연결")
             if st.button("🔄 재연결", use_container_width=True):
                 client = st.session_state.modbus_client
-                # 기존 연결 끊기
+                # 기존 연결 끊기 (close()는 동기 완료 - 대기 불필요)
                 if client.connected:
                     client.disconnect()
-                    time.sleep(0.3)
-                # 재연결 시도
+                # 재연결 시도 (토스트는 재실행 후에도 유지되므로 대기 없이 바로 새로고침)
                 if client.connect():
-                    st.success("✅ PLC 재연결 성공!")
-                    time.sleep(0.5)
+                    st.toast("✅ PLC 재연결 성공!")
                     st.rerun()
                 else:
                     st.error("❌ PLC 연결 실패! PLC Simulator가 실행 중인지 확인하세요.")
@@ -858,11 +520,18 @@ class EdgeComputerDashboard:
 
             st.markdown("---")
 
-            # 현재 시간
+            # 현재 시간 (시계만 갱신 주기마다 부분 재실행)
             st.markdown("#### ⏰ 현재 시간")
-            st.info(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self._render_clock()
+
+    @staticmethod
+    @st.fragment(run_every=LIVE_REFRESH_SECONDS)
+    def _render_clock():
+        """사이드바 현재 시간 표시"""
+        st.info(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
     # ==================== 탭 1: 실시간 모니터링 ====================
+    @st.fragment(run_every=LIVE_REFRESH_SECONDS)
     def _render_realtime_monitoring(self):
         """실시간 모니터링 탭"""
         st.markdown("## 📊 실시간 모니터링")
@@ -886,90 +555,58 @@ class EdgeComputerDashboard:
         # DataFrame 생성 및 Pandas Styler로 다크 테마 적용
         freq_df = self._create_frequency_comparison_table(plc_data)
 
-        # 그룹별 색상 정의
-        group_colors = {
-            'SWP': {'bg': '#0f4c5c', 'text': '#5eead4'},
-            'FWP': {'bg': '#4c1d95', 'text': '#c4b5fd'},
-            'FAN': {'bg': '#7c2d12', 'text': '#fdba74'},
-            'default': {'bg': '#1e293b', 'text': '#e2e8f0'}
+        # 상태 / 편차 부호별 강조 스타일 (배경, 글자, 굵기)
+        status_styles = {
+            "✅ 정상": ('#064e3b', '#10b981', 'bold'),
+            "⚠️ 편차 큼": ('#78350f', '#fbbf24', 'bold'),
+        }
+        deviation_styles = {
+            1: ('#7f1d1d', '#fca5a5', 'bold'),
+            -1: ('#1e3a5f', '#93c5fd', 'bold'),
         }
+        bold_columns = ('장비명', '목표 주파수 (Hz)')
 
-        # HTML 테이블 직접 생성
-        html_rows = []
-        for idx, row in freq_df.iterrows():
-            equipment_name = row['장비명']
-            # 그룹 색상 결정
-            if 'SWP' in equipment_name:
-                colors = group_colors['SWP']
-            elif 'FWP' in equipment_name:
-                colors = group_colors['FWP']
-            elif 'FAN' in equipment_name:
-                colors = group_colors['FAN']
-            else:
-                colors = group_colors['default']
+        columns = list(freq_df.columns)
 
-            bg = colors['bg']
-            txt = colors['text']
+        # 행별 그룹 색상과 편차 부호를 한 번에 계산
+        if freq_df.empty:
+            row_colors = []
+            dev_signs = []
+        else:
+            row_colors = freq_df['장비명'].str.extract(r'(SWP|FWP|FAN)')[0].map(_GROUP_COLORS).tolist()
+            dev_signs = np.sign(freq_df['편차 (Hz)'].to_numpy(dtype=float)).astype(int).tolist()
 
-            # 각 셀 생성
-            cells = []
-            for col in freq_df.columns:
-                val = row[col]
-                cell_bg = bg
-                cell_txt = txt
-                font_weight = 'normal'
+        # HTML 테이블 직접 생성 (행은 튜플로 순회, 셀은 리스트에 모아 join)
+        html_rows = []
+        for row, colors, dev_sign in zip(freq_df.itertuples(index=False, name=None), row_colors, dev_signs):
+            bg, txt = colors if isinstance(colors, tuple) else _DEFAULT_GROUP_COLORS
 
-                # 상태 컬럼 특별 처리
+            cells = []
+            for col, val in zip(columns, row):
                 if col == '상태':
-                    if "정상" in str(val):
-                        cell_bg = '#064e3b'
-                        cell_txt = '#10b981'
-                        font_weight = 'bold'
-                    elif "편차" in str(val):
-                        cell_bg = '#78350f'
-                        cell_txt = '#fbbf24'
-                        font_weight = 'bold'
-
-                # 편차 컬럼 특별 처리
+                    cell_bg, cell_txt, font_weight = status_styles.get(val, (bg, txt, 'normal'))
                 elif col == '편차 (Hz)':
-                    try:
-                        v = float(str(val).replace('+', ''))
-                        if v > 0:
-                            cell_bg = '#7f1d1d'
-                            cell_txt = '#fca5a5'
-                            font_weight = 'bold'
-                        elif v < 0:
-                            cell_bg = '#1e3a5f'
-                            cell_txt = '#93c5fd'
-                            font_weight = 'bold'
-                    except:
-                        pass
-
-                # 장비명/목표주파수 볼드
-                if col in ['장비명', '목표 주파수 (Hz)']:
-                    font_weight = 'bold'
-
-                cells.append(f'<td style="background-color:{cell_bg};color:{cell_txt};font-weight:{font_weight};text-align:center;padding:6px;font-size:11px;border-bottom:1px solid #334155">{val}</td>')
-
-            html_rows.append(f'<tr>{"".join(cells)}</tr>')
-
-        # 헤더 생성
-        header_cells = ''.join([f'<th style="background-color:#1e40af;color:white;font-weight:bold;text-align:center;padding:8px;font-size:11px;border-bottom:2px solid #3b82f6">{col}</th>' for col in freq_df.columns])
-
-        html_table = f'''
-        <table style="width:100%;border-collapse:collapse;margin-bottom:10px">
-            <thead><tr>{header_cells}</tr></thead>
-            <tbody>{"".join(html_rows)}</tbody>
-        </table>
-        '''
-
-        st.markdown(html_table, unsafe_allow_html=True)
+                    cell_bg, cell_txt, font_weight = deviation_styles.get(dev_sign, (bg, txt, 'normal'))
+                    val = f"{val:+.1f}"
+                else:
+                    cell_bg, cell_txt = bg, txt
+                    font_weight = 'bold' if col in bold_columns else 'normal'
+
+                cells.append(_TD_TMPL % (cell_bg, cell_txt, font_weight, val))
+
+            html_rows.append('<tr>' + ''.join(cells) + '</tr>')
+
+        # 고정 헤더/래퍼 + 데이터 행
+        st.markdown(
+            _FREQ_TABLE_OPEN + _FREQ_HEADER_HTML + '<tbody>' + ''.join(html_rows) + _FREQ_TABLE_CLOSE,
+            unsafe_allow_html=True
+        )
 
         st.markdown("---")
 
         # 2. 실시간 절감률 요약 카드
         st.markdown("### 💡 실시간 절감률 요약")
-        savings = self._calculate_realtime_savings(plc_data)
+        savings = self._calculate_realtime_savings(plc_data, _rated_capacity())
 
         col1, col2, col3, col4 = st.columns(4)
 
@@ -1036,8 +673,10 @@ class EdgeComputerDashboard:
                 else:
                     st.info(f"⚪ {fan['name']}: 정지")
 
-    def _create_frequency_comparison_table(self, plc_data: Dict) -> pd.DataFrame:
-        """주파수 비교 테이블 생성"""
+    @staticmethod
+    @st.cache_data(ttl=LIVE_REFRESH_SECONDS, max_entries=4, show_spinner=False)
+    def _create_frequency_comparison_table(plc_data: Dict) -> pd.DataFrame:
+        """주파수 비교 테이블 생성 (동일 PLC 데이터는 갱신 주기 내 캐시 재사용)"""
         equipment = plc_data.get('equipment', [])
         target_freq = plc_data.get('target_frequencies', [48.4] * 10)
 
@@ -1064,126 +703,45 @@ class EdgeComputerDashboard:
                 '장비명': name,
                 '목표 주파수 (Hz)': f"{target:.1f}",
                 '실제 주파수 (Hz)': f"{actual_freq:.1f}",
-                '편차 (Hz)': f"{deviation:+.1f}",
+                '편차 (Hz)': round(deviation, 1),  # 숫자 유지 (표시 시 포맷)
                 '전력 (kW)': f"{eq['power']:.1f}",
                 '상태': status
             })
 
-        return pd.DataFrame(data)
-
-    def _create_frequency_comparison_html(self, plc_data: Dict) -> str:
-        """주파수 비교 테이블 HTML 생성"""
-        equipment = plc_data.get('equipment', [])
-        target_freq = plc_data.get('target_frequencies', [48.4] * 10)
-
-        if equipment is None:
-            equipment = []
+        return pd.DataFrame(data, columns=list(_FREQ_COLUMNS))
 
-        # HTML 테이블 시작 (다크 테마)
-        html = """
-        <div style="background-color: #1e293b; border-radius: 12px; padding: 4px; margin-bottom: 20px; box-shadow: 0 4px 12px rgba(0,0,0,0.4);">
-        <table style="width: 100%; border-collapse: collapse; background-color: #1e293b;">
-            <thead>
-                <tr style="background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);">
-                    <th style="color: white; padding: 16px 12px; text-align: center; font-size: 1.1rem; font-weight: 700;">장비명</th>
-                    <th style="color: white; padding: 16px 12px; text-align: center; font-size: 1.1rem; font-weight: 700;">목표 주파수 (Hz)</th>
-                    <th style="color: white; padding: 16px 12px; text-align: center; font-size: 1.1rem; font-weight: 700;">실제 주파수 (Hz)</th>
-                    <th style="color: white; padding: 16px 12px; text-align: center; font-size: 1.1rem; font-weight: 700;">편차 (Hz)</th>
-                    <th style="color: white; padding: 16px 12px; text-align: center; font-size: 1.1rem; font-weight: 700;">전력 (kW)</th>
-                    <th style="color: white; padding: 16px 12px; text-align: center; font-size: 1.1rem; font-weight: 700;">상태</th>
-                </tr>
-            </thead>
-            <tbody>
+    @staticmethod
+    @st.cache_data(ttl=LIVE_REFRESH_SECONDS, max_entries=4, show_spinner=False)
+    def _calculate_realtime_savings(plc_data: Dict, rated_capacity: Tuple[float, float, float]) -> Dict:
         """
+        실시간 절감률 계산 (동일 PLC 데이터/정격 용량은 갱신 주기 내 캐시 재사용)
 
-        # 데이터 행 추가
-        for i, eq in enumerate(equipment):
-            name = eq['name']
-            actual_freq = eq['frequency']
-
-            # 작동하지 않는 장비(실제 주파수 0)는 목표 주파수도 0으로 표시
-            if actual_freq == 0.0:
-                target = 0.0
-                deviation = 0.0
-                status = "✅ 정상"
-                status_color = "#10b981"
-            else:
-                target = target_freq[i] if i < len(target_freq) else 48.4
-                deviation = actual_freq - target
-                if abs(deviation) < 2.0:
-                    status = "✅ 정상"
-                    status_color = "#10b981"
-                else:
-                    status = "⚠️ 편차 큼"
-                    status_color = "#f59e0b"
-
-            # 편차 색상 (양수: 빨강, 음수: 파랑, 0: 흰색)
-            if deviation > 0:
-                dev_color = "#ef4444"
-            elif deviation < 0:
-                dev_color = "#3b82f6"
-            else:
-                dev_color = "#94a3b8"
-
-            html += f"""
-                <tr style="border-bottom: 1px solid #334155;">
-                    <td style="background-color: #1e293b; color: #60a5fa; padding: 14px 12px; text-align: center; font-size: 1.05rem; font-weight: 600;">{name}</td>
-                    <td style="background-color: #1e293b; color: #fbbf24; padding: 14px 12px; text-align: center; font-size: 1.05rem; font-weight: 600;">{target:.1f}</td>
-                    <td style="background-color: #1e293b; color: #e2e8f0; padding: 14px 12px; text-align: center; font-size: 1.05rem; font-weight: 500;">{actual_freq:.1f}</td>
-                    <td style="background-color: #1e293b; color: {dev_color}; padding: 14px 12px; text-align: center; font-size: 1.05rem; font-weight: 600;">{deviation:+.1f}</td>
-                    <td style="background-color: #1e293b; color: #a78bfa; padding: 14px 12px; text-align: center; font-size: 1.05rem; font-weight: 500;">{eq['power']:.1f}</td>
-                    <td style="background-color: #1e293b; color: {status_color}; padding: 14px 12px; text-align: center; font-size: 1.05rem; font-weight: 600;">{status}</td>
-                </tr>
-            """
-
-        html += """
-            </tbody>
-        </table>
-        </div>
+        Args:
+            plc_data: PLC 데이터
+            rated_capacity: 정격 용량 (SWP, FWP, FAN) - 캐시 키에 포함되어 설정 변경 즉시 반영
         """
-
-        return html
-
-    def _calculate_realtime_savings(self, plc_data: Dict) -> Dict:
-        """실시간 절감률 계산"""
         equipment = plc_data.get('equipment', [])
         if equipment is None:
             equipment = []
 
-        # 그룹별 계산
-        swp_power_60hz = 0
-        swp_power_vfd = 0
-        fwp_power_60hz = 0
-        fwp_power_vfd = 0
-        fan_power_60hz = 0
-        fan_power_vfd = 0
-
-        for i, eq in enumerate(equipment):
-            freq = eq['frequency']
-            running = eq.get('running', False) or eq.get('running_fwd', False) or eq.get('running_bwd', False)
-
-            if not running:
-                continue
+        # 장비 배열 구성 (인덱스 0-2: SWP, 3-5: FWP, 6-: FAN)
+        count = len(equipment)
+        frequency = np.fromiter((eq['frequency'] for eq in equipment), dtype=np.float64, count=count)
+        running = np.fromiter(
+            (bool(eq.get('running', False) or eq.get('running_fwd', False) or eq.get('running_bwd', False))
+             for eq in equipment),
+            dtype=np.bool_, count=count
+        )
+        if count <= len(_EQUIPMENT_GROUP):
+            group = _EQUIPMENT_GROUP[:count]
+        else:
+            group = np.minimum(np.arange(count) // 3, GROUP_FAN)
+        rated = np.array(rated_capacity)[group]
 
-            # 큐빅 법칙 적용: P = P_rated × (f/60)³
-            if i < 3:  # SWP
-                rated = config.MOTOR_CAPACITY['SWP']
-                power_60hz = rated
-                power_vfd = rated * ((freq / 60) ** 3) if freq > 0 else 0
-                swp_power_60hz += power_60hz
-                swp_power_vfd += power_vfd
-            elif i < 6:  # FWP
-                rated = config.MOTOR_CAPACITY['FWP']
-                power_60hz = rated
-                power_vfd = rated * ((freq / 60) ** 3) if freq > 0 else 0
-                fwp_power_60hz += power_60hz
-                fwp_power_vfd += power_vfd
-            else:  # FAN
-                rated = config.MOTOR_CAPACITY['FAN']
-                power_60hz = rated
-                power_vfd = rated * ((freq / 60) ** 3) if freq > 0 else 0
-                fan_power_60hz += power_60hz
-                fan_power_vfd += power_vfd
+        # 큐빅 법칙 적용: P = P_rated × (f/60)³ (그룹별 합산 커널)
+        power_60hz, power_vfd = group_power_kernel(frequency, running, group, rated)
+        swp_power_60hz, fwp_power_60hz, fan_power_60hz = power_60hz.tolist()  # GROUP_SWP/FWP/FAN 순서
+        swp_power_vfd, fwp_power_vfd, fan_power_vfd = power_vfd.tolist()
 
         # 절감량 및 절감률 계산
         swp_savings = swp_power_60hz - swp_power_vfd
@@ -1205,89 +763,31 @@ class EdgeComputerDashboard:
             'fan_savings_kw': fan_savings,
         }
 
-    def _get_pump_status(self, plc_data: Dict) -> List[Dict]:
+    @staticmethod
+    def _get_pump_status(plc_data: Dict) -> List[Dict]:
         """펌프 상태 추출"""
         equipment = plc_data.get('equipment', [])
         if equipment is None:
             equipment = []
-        return [eq for eq in equipment if 'WP' in eq['name']]
+        return equipment[_PUMP_SLICE]
 
-    def _get_fan_status(self, plc_data: Dict) -> List[Dict]:
+    @staticmethod
+    def _get_fan_status(plc_data: Dict) -> List[Dict]:
         """팬 상태 추출"""
         equipment = plc_data.get('equipment', [])
         if equipment is None:
             equipment = []
-        return [eq for eq in equipment if 'FAN' in eq['name']]
+        return equipment[_FAN_SLICE]
 
     # ==================== 탭 2: 에너지 절감 분석 ====================
-    def _render_energy_savings_analysis(self):
-        """에너지 절감 분석 탭"""
-        st.markdown("## 💰 에너지 절감 분석")
-
-        # PLC 데이터 가져오기
-        plc_data = self._get_plc_data()
-
-        if plc_data is None:
-            st.error("⚠️ PLC 연결이 필요합니다.")
-            return
-
-        # 1. 상단 요약 카드 4개
-        st.markdown("### 📊 절감 요약")
-        savings = self._calculate_realtime_savings(plc_data)
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.markdown("""
-            <div class="card">
-                <h4 style="color: #94a3b8; margin-bottom: 0.5rem;">실시간 순간 절감률</h4>
-                <h2 style="color: #3b82f6; margin: 0;">{:.1f}%</h2>
-                <p style="color: #10b981; margin-top: 0.5rem;">{:.1f} kW</p>
-            </div>
-            """.format(savings['total_ratio'], savings['total_savings_kw']), unsafe_allow_html=True)
-
-        with col2:
-            today_kwh = savings['total_savings_kw'] * 0.5  # 임시 계산 (12시간 기준)
-            electricity_rate = st.session_state.get('electricity_rate', config.ELECTRICITY_RATE)
-            st.markdown("""
-            <div class="card">
-                <h4 style="color: #94a3b8; margin-bottom: 0.5rem;">오늘 절감량</h4>
-                <h2 style="color: #3b82f6; margin: 0;">{:.1f} kWh</h2>
-                <p style="color: #10b981; margin-top: 0.5rem;">약 {:.0f}원</p>
-            </div>
-            """.format(today_kwh, today_kwh * electricity_rate), unsafe_allow_html=True)
-
-        with col3:
-            month_kwh = today_kwh * 30  # 임시 계산
-            st.markdown("""
-            <div class="card">
-                <h4 style="color: #94a3b8; margin-bottom: 0.5rem;">이번 달 절감량</h4>
-                <h2 style="color: #3b82f6; margin: 0;">{:.1f} kWh</h2>
-                <p style="color: #10b981; margin-top: 0.5rem;">약 {:.0f}만원</p>
-            </div>
-            """.format(month_kwh, month_kwh * electricity_rate / 10000), unsafe_allow_html=True)
-
-        with col4:
-            year_kwh = month_kwh * 12
-            st.markdown("""
-            <div class="card">
-                <h4 style="color: #94a3b8; margin-bottom: 0.5rem;">예상 연간 절감량</h4>
-                <h2 style="color: #3b82f6; margin: 0;">{:.1f} MWh</h2>
-                <p style="color: #10b981; margin-top: 0.5rem;">약 {:.0f}백만원</p>
-            </div>
-            """.format(year_kwh / 1000, year_kwh * electricity_rate / 1000000), unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # 2. 기간별 그래프
-        st.markdown("### 📈 기간별 절감 추이")
-
-        period = st.selectbox("기간 선택", ["시간별 (24시간)", "일별 (30일)", "월별 (12개월)"])
-
+    @staticmethod
+    @st.cache_data(ttl=LIVE_REFRESH_SECONDS, max_entries=8, show_spinner=False)
+    def _create_savings_trend_figure(period: str, total_savings_kw: float) -> go.Figure:
+        """기간별 절감 추이 그래프 생성 (동일 기간/절감 전력은 캐시 재사용)"""
         if period == "시간별 (24시간)":
             # 임시 데이터 생성
-            hours = list(range(24))
-            savings_data = [savings['total_savings_kw'] * (0.8 + 0.4 * abs((h - 12) / 12)) for h in hours]
+            hours = _SAVINGS_HOURS
+            savings_data = total_savings_kw * _HOUR_SHAPE
 
             fig = go.Figure()
             fig.add_trace(go.Scatter(
@@ -1303,16 +803,12 @@ class EdgeComputerDashboard:
                 height=400,
                 xaxis_title="시간",
                 yaxis_title="절감 전력 (kW)",
-                template="plotly_dark",
-                paper_bgcolor='#1e293b',
-                plot_bgcolor='#1e293b'
+                **_CHART_THEME
             )
 
-            st.plotly_chart(fig, use_container_width=True)
-
         elif period == "일별 (30일)":
-            days = list(range(1, 31))
-            savings_data = [savings['total_savings_kw'] * 12 * (0.9 + 0.2 * (d % 7) / 7) for d in days]
+            days = _SAVINGS_DAYS
+            savings_data = total_savings_kw * 12 * _DAY_SHAPE
 
             fig = go.Figure()
             fig.add_trace(go.Bar(
@@ -1326,16 +822,12 @@ class EdgeComputerDashboard:
                 height=400,
                 xaxis_title="일",
                 yaxis_title="절감량 (kWh)",
-                template="plotly_dark",
-                paper_bgcolor='#1e293b',
-                plot_bgcolor='#1e293b'
+                **_CHART_THEME
             )
 
-            st.plotly_chart(fig, use_container_width=True)
-
         else:  # 월별
-            months = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
-            savings_data = [savings['total_savings_kw'] * 12 * 30 * (0.85 + 0.3 * (m % 4) / 4) for m in range(12)]
+            months = _SAVINGS_MONTHS
+            savings_data = total_savings_kw * 12 * 30 * _MONTH_SHAPE
 
             fig = go.Figure()
             fig.add_trace(go.Bar(
@@ -1349,12 +841,69 @@ class EdgeComputerDashboard:
                 height=400,
                 xaxis_title="월",
                 yaxis_title="절감량 (MWh)",
-                template="plotly_dark",
-                paper_bgcolor='#1e293b',
-                plot_bgcolor='#1e293b'
+                **_CHART_THEME
             )
 
-            st.plotly_chart(fig, use_container_width=True)
+        return fig
+
+    @staticmethod
+    @st.cache_resource(show_spinner=False)
+    def _get_zero_savings_figure(period: str) -> go.Figure:
+        """절감 전력 0 기간별 그래프 (읽기 전용으로 세션 간 공유)"""
+        return EdgeComputerDashboard._create_savings_trend_figure(period, 0.0)
+
+    @st.fragment(run_every=LIVE_REFRESH_SECONDS)
+    def _render_energy_savings_analysis(self):
+        """에너지 절감 분석 탭"""
+        st.markdown("## 💰 에너지 절감 분석")
+
+        # PLC 데이터 가져오기
+        plc_data = self._get_plc_data()
+
+        if plc_data is None:
+            st.error("⚠️ PLC 연결이 필요합니다.")
+            return
+
+        # 1. 상단 요약 카드 4개
+        st.markdown("### 📊 절감 요약")
+        savings = self._calculate_realtime_savings(plc_data, _rated_capacity())
+
+        today_kwh = savings['total_savings_kw'] * 0.5  # 임시 계산 (12시간 기준)
+        month_kwh = today_kwh * 30  # 임시 계산
+        year_kwh = month_kwh * 12
+        electricity_rate = st.session_state.get('electricity_rate', config.ELECTRICITY_RATE)
+
+        # 카드 4장을 4열 그리드 한 번의 markdown으로 출력
+        st.markdown(_SUMMARY_CARD_GRID_OPEN + ''.join([
+            _SUMMARY_CARD_TMPL % (
+                "실시간 순간 절감률", f"{savings['total_ratio']:.1f}%", f"{savings['total_savings_kw']:.1f} kW"
+            ),
+            _SUMMARY_CARD_TMPL % (
+                "오늘 절감량", f"{today_kwh:.1f} kWh", f"약 {today_kwh * electricity_rate:.0f}원"
+            ),
+            _SUMMARY_CARD_TMPL % (
+                "이번 달 절감량", f"{month_kwh:.1f} kWh", f"약 {month_kwh * electricity_rate / 10000:.0f}만원"
+            ),
+            _SUMMARY_CARD_TMPL % (
+                "예상 연간 절감량", f"{year_kwh / 1000:.1f} MWh", f"약 {year_kwh * electricity_rate / 1000000:.0f}백만원"
+            ),
+        ]) + '</div>', unsafe_allow_html=True)
+
+        st.markdown("---")
+
+        # 2. 기간별 그래프
+        st.markdown("### 📈 기간별 절감 추이")
+
+        period = st.selectbox("기간 선택", ["시간별 (24시간)", "일별 (30일)", "월별 (12개월)"])
+
+        # 표시 정밀도(소수 2자리)로 반올림해 키로 사용 - 절감 전력이 같으면 캐시된 Figure 재사용
+        total_savings_kw = round(savings['total_savings_kw'], 2)
+        if total_savings_kw == 0:
+            # 절감 없음 (전 장비 정지 등) - 고정 그래프를 만료 없이 공유
+            fig = self._get_zero_savings_figure(period)
+        else:
+            fig = self._create_savings_trend_figure(period, total_savings_kw)
+        st.plotly_chart(fig, use_container_width=True, config=_LIVE_PLOT_CONFIG)
 
         st.markdown("---")
 
@@ -1384,7 +933,12 @@ class EdgeComputerDashboard:
         st.markdown("### 📋 장비별 상세 분석")
 
         equipment = plc_data.get('equipment', [])
-        detail_data = []
+        # 행별 HTML 직접 생성 (그룹별 배경/글자 색상)
+        html_rows = []
+
+        # 정격 용량 (호출마다 1회 조회 - 설정 화면에서 변경 가능)
+        motor_capacity = config.MOTOR_CAPACITY
+        swp_rated, fwp_rated, fan_rated = motor_capacity['SWP'], motor_capacity['FWP'], motor_capacity['FAN']
 
         for i, eq in enumerate(equipment):
             name = eq['name']
@@ -1394,11 +948,11 @@ class EdgeComputerDashboard:
 
             # 정격 용량
             if 'SWP' in name:
-                rated = config.MOTOR_CAPACITY['SWP']
+                rated = swp_rated
             elif 'FWP' in name:
-                rated = config.MOTOR_CAPACITY['FWP']
+                rated = fwp_rated
             else:
-                rated = config.MOTOR_CAPACITY['FAN']
+                rated = fan_rated
 
             power_60hz = rated if running else 0
             # 큐빅 법칙 적용: P = P_rated × (f/60)³
@@ -1406,63 +960,25 @@ class EdgeComputerDashboard:
             savings_kw = power_60hz - power_vfd if running else 0
             savings_ratio = (savings_kw / power_60hz * 100) if power_60hz > 0 else 0
 
-            detail_data.append({
-                '장비명': name,
-                '운전 상태': '✅ 운전중' if running else '⚪ 정지',
-                '주파수 (Hz)': f"{freq:.1f}",
-                '실제 전력 (kW)': f"{power_vfd:.1f}",
-                '60Hz 전력 (kW)': f"{power_60hz:.1f}",
-                '절감 전력 (kW)': f"{savings_kw:.1f}",
-                '절감률 (%)': f"{savings_ratio:.1f}"
-            })
-
-        detail_df = pd.DataFrame(detail_data)
-
-        # 장비별 상세 분석 테이블 스타일 적용
-        def style_detail_row(row):
-            """장비별 테이블 행 스타일"""
-            equipment_name = row['장비명']
-            # SWP 그룹: 청록색 계열
-            if 'SWP' in equipment_name:
-                bg_color = '#0f4c5c'
-                text_color = '#5eead4'
-            # FWP 그룹: 보라색 계열
-            elif 'FWP' in equipment_name:
-                bg_color = '#4c1d95'
-                text_color = '#c4b5fd'
-            # FAN 그룹: 주황색 계열
-            elif 'FAN' in equipment_name:
-                bg_color = '#7c2d12'
-                text_color = '#fdba74'
-            else:
-                bg_color = '#1e293b'
-                text_color = '#e2e8f0'
-
-            return [f'background-color: {bg_color}; color: {text_color}; font-size: 11px'] * len(row)
-
-        styled_detail_df = detail_df.style.apply(
-            style_detail_row, axis=1
-        ).set_table_styles([
-            {'selector': 'th', 'props': [
-                ('background-color', '#1e40af'),
-                ('color', 'white'),
-                ('font-weight', 'bold'),
-                ('text-align', 'center'),
-                ('padding', '8px'),
-                ('font-size', '11px'),
-                ('border-bottom', '2px solid #3b82f6')
-            ]},
-            {'selector': 'td', 'props': [
-                ('text-align', 'center'),
-                ('padding', '6px'),
-                ('font-size', '11px'),
-                ('border-bottom', '1px solid #334155')
-            ]}
-        ])
+            bg, txt = _GROUP_COLORS.get(name[:3], _DEFAULT_GROUP_COLORS)
+            values = (
+                name,
+                '✅ 운전중' if running else '⚪ 정지',
+                f"{freq:.1f}",
+                f"{power_vfd:.1f}",
+                f"{power_60hz:.1f}",
+                f"{savings_kw:.1f}",
+                f"{savings_ratio:.1f}",
+            )
+            html_rows.append('<tr>' + ''.join(_TD_TMPL % (bg, txt, 'normal', val) for val in values) + '</tr>')
 
-        st.write(styled_detail_df.to_html(escape=False), unsafe_allow_html=True)
+        st.markdown(
+            _FREQ_TABLE_OPEN + _DETAIL_HEADER_HTML + '<tbody>' + ''.join(html_rows) + _FREQ_TABLE_CLOSE,
+            unsafe_allow_html=True
+        )
 
     # ==================== 탭 3: VFD 예방진단 ====================
+    @st.fragment(run_every=LIVE_REFRESH_SECONDS)
     def _render_vfd_diagnostics(self):
         """VFD 예방진단 탭 - 4단계 중증도 시스템"""
         st.markdown("## 🔧 VFD 예방진단")
@@ -1492,48 +1008,28 @@ class EdgeComputerDashboard:
         </div>
         """, unsafe_allow_html=True)
 
-        # 2행 5열로 배치
-        for row in range(2):
-            cols = st.columns(5)
-            for col_idx in range(5):
-                vfd_idx = row * 5 + col_idx
-                if vfd_idx < len(vfd_diagnostics):
-                    vfd = vfd_diagnostics[vfd_idx]
-                    with cols[col_idx]:
-                        # 4단계 중증도 레벨에 따른 색상
-                        severity_level = vfd.get('severity_level', 0)
-                        severity_name = vfd.get('severity_name', '정상')
-
-                        if severity_level == 0:
-                            color = "#10b981"  # 녹색 - 정상
-                            status = "정상"
-                            icon = "🟢"
-                        elif severity_level == 1:
-                            color = "#f59e0b"  # 노란색 - 주의
-                            status = "주의"
-                            icon = "🟡"
-                        elif severity_level == 2:
-                            color = "#ff9800"  # 주황색 - 경고
-                            status = "경고"
-                            icon = "🟠"
-                        else:
-                            color = "#f44336"  # 빨간색 - 위험
-                            status = "위험"
-                            icon = "🔴"
-
-                        # 진단 파라미터 요약 (모터/인버터 열부하)
-                        motor_thermal = vfd.get('motor_thermal', 0)
-                        heatsink_temp = vfd.get('heatsink_temp', 0)
-
-                        st.markdown(f"""
-                        <div class="card" style="border-left: 4px solid {color};">
-                            <h4 style="margin: 0; color: #e2e8f0;">{icon} {vfd['name']}</h4>
-                            <h2 style="margin: 0.5rem 0; color: {color};">{vfd['health_score']}</h2>
-                            <p style="margin: 0; color: #94a3b8; font-size: 0.8em;">건강도 점수</p>
-                            <p style="margin: 0.3rem 0; color: {color}; font-weight: 600;">{status} (Lv.{severity_level})</p>
-                            <p style="margin: 0; color: #64748b; font-size: 0.75em;">모터:{motor_thermal}% | 방열판:{heatsink_temp}°C</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+        # 2행 5열 그리드로 배치 (카드 10장을 한 번의 markdown으로 전송)
+        cards = []
+        for vfd in vfd_diagnostics[:10]:
+            # 4단계 중증도 레벨에 따른 색상
+            severity_level = vfd.get('severity_level', 0)
+            color, status, icon = _SEVERITY_CARD_STYLES.get(severity_level, _SEVERITY_CARD_CRITICAL)
+
+            # 진단 파라미터 요약 (모터/인버터 열부하)
+            motor_thermal = vfd.get('motor_thermal', 0)
+            heatsink_temp = vfd.get('heatsink_temp', 0)
+
+            cards.append(
+                f'<div class="card" style="border-left: 4px solid {color};">'
+                f'<h4 style="margin: 0; color: #e2e8f0;">{icon} {vfd["name"]}</h4>'
+                f'<h2 style="margin: 0.5rem 0; color: {color};">{vfd["health_score"]}</h2>'
+                f'<p style="margin: 0; color: #94a3b8; font-size: 0.8em;">건강도 점수</p>'
+                f'<p style="margin: 0.3rem 0; color: {color}; font-weight: 600;">{status} (Lv.{severity_level})</p>'
+                f'<p style="margin: 0; color: #64748b; font-size: 0.75em;">모터:{motor_thermal}% | 방열판:{heatsink_temp}°C</p>'
+                '</div>'
+            )
+
+        st.markdown(_VFD_CARD_GRID_OPEN + ''.join(cards) + '</div>', unsafe_allow_html=True)
 
         st.markdown("---")
 
@@ -1555,9 +1051,10 @@ class EdgeComputerDashboard:
         </style>
         """, unsafe_allow_html=True)
 
-        # health_score < 80 = severity_score > 20 (정상이 아닌 모든 것)
+        # health_score < 80 = severity_score > 20 (정상이 아닌 모든 것) - 예측 유지보수 목록과 공용
+        unhealthy = [vfd for vfd in vfd_diagnostics if vfd['health_score'] < 80]
         # is_cleared가 True인 VFD는 이상 징후 목록에서 제외 (건강도 카드에는 표시)
-        warnings = [vfd for vfd in vfd_diagnostics if vfd['health_score'] < 80 and not vfd.get('is_cleared', False)]
+        warnings = [vfd for vfd in unhealthy if not vfd.get('is_cleared', False)]
 
         if warnings:
             for vfd in warnings:
@@ -1575,52 +1072,18 @@ class EdgeComputerDashboard:
                 col1, col2 = st.columns([6, 1])
 
                 with col1:
-                    # health_score 기준: 80-100(정상), 50-79(주의), 25-49(경고), 0-24(위험)
-                    if vfd['health_score'] >= 50:
-                        st.markdown(f"<div style='padding: 10px; {color_style}'>⚠️ **{vfd['name']}**: 건강도 {vfd['health_score']} (주의) - {vfd['warning_message']}{ack_status}</div>", unsafe_allow_html=True)
-                    elif vfd['health_score'] >= 25:
-                        st.markdown(f"<div style='padding: 10px; {color_style}'>🟠 **{vfd['name']}**: 건강도 {vfd['health_score']} (경고) - {vfd['warning_message']}{ack_status}</div>", unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"<div style='padding: 10px; {color_style}'>🔴 **{vfd['name']}**: 건강도 {vfd['health_score']} (위험) - {vfd['warning_message']}{ack_status}</div>", unsafe_allow_html=True)
+                    icon, level = _HEALTH_WARNING_LEVELS[bisect.bisect_right(_HEALTH_WARNING_THRESHOLDS, vfd['health_score'])]
+                    st.markdown(f"<div style='padding: 10px; {color_style}'>{icon} **{vfd['name']}**: 건강도 {vfd['health_score']} ({level}) - {vfd['warning_message']}{ack_status}</div>", unsafe_allow_html=True)
 
                 with col2:
                     # 확인/해제 버튼을 같은 위치에 표시
                     if not is_acknowledged:
-                        if st.button("✓ 확인", key=f"ack_{vfd_id}", type="primary"):  # 파란색
-                            # VFD Monitor에서 확인 처리
-                            if hasattr(st.session_state, 'vfd_monitor') and st.session_state.vfd_monitor:
-                                monitor = st.session_state.vfd_monitor
-                                # active_anomalies에 없으면 먼저 등록
-                                if vfd_id not in monitor.active_anomalies:
-                                    from src.diagnostics.vfd_monitor import VFDDiagnostic, DanfossStatusBits, VFDStatus
-                                    from datetime import datetime
-                                    status_bits = DanfossStatusBits(
-                                        trip=False, error=False, warning=True,
-                                        voltage_exceeded=False, torque_exceeded=False, thermal_exceeded=False,
-                                        control_ready=True, drive_ready=True, in_operation=True, speed_equals_reference=True, bus_control=True
-                                    )
-                                    diag = VFDDiagnostic(
-                                        timestamp=datetime.now(), vfd_id=vfd_id, status_bits=status_bits,
-                                        current_frequency_hz=0, output_current_a=0, output_voltage_v=380,
-                                        dc_bus_voltage_v=540, motor_temperature_c=50, heatsink_temperature_c=45,
-                                        status_grade=VFDStatus.CAUTION, severity_score=30, anomaly_patterns=["이상 징후"],
-                                        recommendation="점검 필요", cumulative_runtime_hours=0, trip_count=0, error_count=0, warning_count=0
-                                    )
-                                    monitor.active_anomalies[vfd_id] = diag
-                                monitor.acknowledge_anomaly(vfd_id)
-                                st.rerun()
+                        # 클릭 콜백은 재실행 전에 처리되므로 별도 st.rerun() 불필요
+                        st.button("✓ 확인", key=f"ack_{vfd_id}", type="primary",  # 파란색
+                                  on_click=self._acknowledge_vfd_anomaly, args=(vfd_id,))
                     else:
-                        if st.button("✕ 해제", key=f"clear_{vfd_id}", type="secondary"):  # 회색
-                            # VFD Monitor에서 해제 처리
-                            if hasattr(st.session_state, 'vfd_monitor') and st.session_state.vfd_monitor:
-                                monitor = st.session_state.vfd_monitor
-                                # active_anomalies에 있어야 해제 가능
-                                if vfd_id in monitor.active_anomalies:
-                                    monitor.clear_anomaly(vfd_id)
-                                else:
-                                    # active_anomalies에 없어도 cleared_anomalies에 추가
-                                    monitor.cleared_anomalies.add(vfd_id)
-                                st.rerun()
+                        st.button("✕ 해제", key=f"clear_{vfd_id}", type="secondary",  # 회색
+                                  on_click=self._clear_vfd_anomaly, args=(vfd_id,))
         else:
             st.success("✅ 모든 VFD가 정상 상태입니다.")
 
@@ -1630,15 +1093,14 @@ class EdgeComputerDashboard:
         st.markdown("### 🔮 예측 유지보수")
 
         maintenance_data = []
-        for vfd in vfd_diagnostics:
-            if vfd['health_score'] < 80:
-                maintenance_data.append({
-                    '장비명': vfd['name'],
-                    '건강도': vfd['health_score'],
-                    '예상 정비 시기': vfd['next_maintenance'],
-                    '권장 조치': vfd['recommended_action'],
-                    '우선순위': vfd['priority']
-                })
+        for vfd in unhealthy:
+            maintenance_data.append({
+                '장비명': vfd['name'],
+                '건강도': vfd['health_score'],
+                '예상 정비 시기': vfd['next_maintenance'],
+                '권장 조치': vfd['recommended_action'],
+                '우선순위': vfd['priority']
+            })
 
         if maintenance_data:
             maintenance_df = pd.DataFrame(maintenance_data)
@@ -1742,36 +1204,27 @@ class EdgeComputerDashboard:
 
             # 실시간 운전 데이터
             st.markdown("#### 🔧 실시간 운전 데이터")
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                st.metric("주파수", f"{vfd_detail.get('frequency', 0):.1f} Hz")
-                st.metric("모터 전류", f"{vfd_detail.get('motor_current', 0):.1f} A")
-
-            with col2:
-                st.metric("모터 열부하", f"{vfd_detail.get('motor_thermal', 0)} %")
-                st.metric("방열판 온도", f"{vfd_detail.get('heatsink_temp', 0)} °C")
-
-            with col3:
-                st.metric("인버터 열부하", f"{vfd_detail.get('inverter_thermal', 0)} %")
-                st.metric("DC 링크 전압", f"{vfd_detail.get('dc_link_voltage', 0)} V")
-
-            with col4:
-                st.metric("운전 시간", f"{vfd_detail.get('run_hours', 0)} h")
-                st.metric("기동 횟수", f"{vfd_detail.get('num_starts', 0)} 회")
+            # 4열 그리드 (행 우선 배치: 위/아래 줄이 기존 열별 상/하 지표)
+            st.markdown(_metric_grid_html((
+                ("주파수", f"{vfd_detail.get('frequency', 0):.1f} Hz"),
+                ("모터 열부하", f"{vfd_detail.get('motor_thermal', 0)} %"),
+                ("인버터 열부하", f"{vfd_detail.get('inverter_thermal', 0)} %"),
+                ("운전 시간", f"{vfd_detail.get('run_hours', 0)} h"),
+                ("모터 전류", f"{vfd_detail.get('motor_current', 0):.1f} A"),
+                ("방열판 온도", f"{vfd_detail.get('heatsink_temp', 0)} °C"),
+                ("DC 링크 전압", f"{vfd_detail.get('dc_link_voltage', 0)} V"),
+                ("기동 횟수", f"{vfd_detail.get('num_starts', 0)} 회"),
+            )), unsafe_allow_html=True)
 
             # 3상 전류
             st.markdown("#### ⚡ 3상 전류 상태")
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("U상 전류", f"{vfd_detail.get('phase_u_current', 0):.1f} A")
-            with col2:
-                st.metric("V상 전류", f"{vfd_detail.get('phase_v_current', 0):.1f} A")
-            with col3:
-                st.metric("W상 전류", f"{vfd_detail.get('phase_w_current', 0):.1f} A")
-            with col4:
-                imbalance = params.get('current_imbalance', {}).get('value', 0)
-                st.metric("불평형률", f"{imbalance:.1f} %")
+            imbalance = params.get('current_imbalance', {}).get('value', 0)
+            st.markdown(_metric_grid_html((
+                ("U상 전류", f"{vfd_detail.get('phase_u_current', 0):.1f} A"),
+                ("V상 전류", f"{vfd_detail.get('phase_v_current', 0):.1f} A"),
+                ("W상 전류", f"{vfd_detail.get('phase_w_current', 0):.1f} A"),
+                ("불평형률", f"{imbalance:.1f} %"),
+            )), unsafe_allow_html=True)
 
             # 이상 패턴 표시
             anomaly_patterns = vfd_detail.get('anomaly_patterns', [])
@@ -1798,61 +1251,9 @@ class EdgeComputerDashboard:
             predicted_temp = vfd_detail.get('predicted_temp_30min', current_temp)
             temp_rise_rate = vfd_detail.get('temp_rise_rate', 0)
 
-            # 현재부터 30분 후까지 선형 예측
-            minutes = list(range(0, 35, 5))  # 0, 5, 10, 15, 20, 25, 30분
-            predicted_temps = [current_temp + (temp_rise_rate * m) for m in minutes]
-
-            fig = go.Figure()
-
-            # 예측 온도 라인
-            fig.add_trace(go.Scatter(
-                x=minutes,
-                y=predicted_temps,
-                mode='lines+markers',
-                name='예측 온도',
-                line=dict(color='#3b82f6', width=3),
-                marker=dict(size=8)
-            ))
-
-            # 현재 온도 강조
-            fig.add_trace(go.Scatter(
-                x=[0],
-                y=[current_temp],
-                mode='markers',
-                name='현재 온도',
-                marker=dict(size=15, color='#10b981', symbol='star')
-            ))
-
-            # 30분 후 예측 온도 강조
-            fig.add_trace(go.Scatter(
-                x=[30],
-                y=[predicted_temp],
-                mode='markers',
-                name='30분 후 예측',
-                marker=dict(size=15, color='#ef4444', symbol='diamond')
-            ))
-
-            fig.add_hline(y=80, line_dash="dash", line_color="#f59e0b", annotation_text="경고 온도 (80°C)")
-            fig.add_hline(y=90, line_dash="dash", line_color="#ef4444", annotation_text="위험 온도 (90°C)")
-
-            fig.update_layout(
-                height=350,
-                xaxis_title="시간 (분)",
-                yaxis_title="온도 (°C)",
-                template="plotly_dark",
-                paper_bgcolor='#1e293b',
-                plot_bgcolor='#1e293b',
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                )
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            # 동일 온도 값은 캐시된 그래프 재사용
+            fig = self._create_temp_prediction_figure(current_temp, predicted_temp, temp_rise_rate)
+            st.plotly_chart(fig, use_container_width=True, config=_LIVE_PLOT_CONFIG)
 
             # 권장 조치 (AI 알고리즘 기반)
             st.markdown("---")
@@ -1878,73 +1279,116 @@ class EdgeComputerDashboard:
         st.markdown("### 📜 이상 징후 히스토리")
 
         try:
-            from src.database.db_manager import DatabaseManager
-            db = DatabaseManager(db_dir="data")
+            # 싱글톤 사용 (디렉토리 생성/테이블 초기화는 최초 1회만)
+            from src.database.db_manager import get_db_manager
+            db = get_db_manager(db_dir="data")
             history = db.get_vfd_anomaly_history(limit=50)
 
             if history:
-                history_data = []
-                for item in history:
-                    eq_name = item.get('equipment_id', '').replace("SW_PUMP_", "SWP").replace("FW_PUMP_", "FWP").replace("ER_FAN_", "FAN")
-
-                    status_text = item.get('severity_name', '정상')
-                    status_value = item.get('status', 'ACTIVE')
-
-                    ack_text = "✓" if status_value in ['ACKNOWLEDGED', 'CLEARED', 'AUTO_CLEARED'] else "✗"
-                    cleared_text = "자동해제" if status_value == 'AUTO_CLEARED' else \
-                                   "해제됨" if status_value == 'CLEARED' else \
-                                   "확인됨" if status_value == 'ACKNOWLEDGED' else "활성"
-
-                    occurred_at = item.get('occurred_at', '')
-                    if occurred_at:
-                        try:
-                            from datetime import datetime
-                            if isinstance(occurred_at, str):
-                                occurred_at = datetime.fromisoformat(occurred_at).strftime("%Y-%m-%d %H:%M:%S")
-                        except:
-                            pass
-
-                    duration = item.get('duration_minutes')
-                    duration_text = f"{duration}분" if duration else "-"
-
-                    history_data.append({
-                        "시간": occurred_at,
-                        "장비": eq_name,
-                        "중증도": f"Lv.{item.get('severity_level', 0)} ({status_text})",
-                        "건강도": item.get('health_score', 100),
-                        "상태": cleared_text,
-                        "지속시간": duration_text,
-                        "권고사항": item.get('recommendations', '-') or '-'
-                    })
-
-                df_history = pd.DataFrame(history_data)
+                # 동일 이력은 캐시된 DataFrame 재사용
+                df_history = self._build_anomaly_history_df(history)
                 st.dataframe(df_history, use_container_width=True, height=400)
             else:
                 st.info("📋 이상 징후 히스토리가 없습니다.")
         except Exception as e:
             st.warning(f"⚠️ 이상 징후 히스토리 로드 실패: {e}")
 
+    @staticmethod
+    @st.cache_data(max_entries=4, show_spinner=False)
+    def _build_anomaly_history_df(history: List[Dict]) -> pd.DataFrame:
+        """이상 징후 히스토리 표시용 DataFrame 생성 (건강도 int16, 상태 범주형)"""
+        # 한 번의 순회로 컬럼별 리스트에 누적 (행별 dict 생성 없음)
+        n = len(history)
+        equipment_ids, occurred_at, severity_text = [None] * n, [None] * n, [None] * n
+        health_scores, statuses, durations, recommendations = [None] * n, [None] * n, [None] * n, [None] * n
+        for i, item in enumerate(history):
+            equipment_ids[i] = item.get('equipment_id', '')
+            # 발생 시각 (ISO 문자열 → 초 단위 표기, 변환 불가 값은 원본 유지)
+            occurred = item.get('occurred_at', '')
+            if occurred and isinstance(occurred, str):
+                try:
+                    occurred = datetime.fromisoformat(occurred).strftime("%Y-%m-%d %H:%M:%S")
+                except ValueError:
+                    pass
+            occurred_at[i] = occurred
+            severity_text[i] = f"Lv.{item.get('severity_level', 0)} ({item.get('severity_name', '정상')})"
+            health_scores[i] = item.get('health_score', 100)
+            statuses[i] = _ANOMALY_STATUS_LABELS.get(item.get('status', 'ACTIVE'), "활성")
+            duration = item.get('duration_minutes')
+            durations[i] = f"{duration}분" if duration else "-"
+            recommendations[i] = item.get('recommendations', '-') or '-'
+
+        # VFD ID → 장비명 (SW_PUMP_1 → SWP1)
+        equipment_names = pd.Series(equipment_ids, dtype=object) \
+            .str.replace(_VFD_ID_PREFIX_RE, lambda m: _VFD_ID_PREFIXES[m.group(0)], regex=True)
+
+        return pd.DataFrame({
+            "시간": occurred_at,
+            "장비": equipment_names,
+            "중증도": severity_text,
+            "건강도": np.array(health_scores, dtype=np.int16),
+            "상태": pd.Categorical(statuses),
+            "지속시간": durations,
+            "권고사항": recommendations,
+        }, copy=False)
+
+    @staticmethod
+    def _acknowledge_vfd_anomaly(vfd_id: str):
+        """이상 징후 확인 버튼 콜백"""
+        # VFD Monitor에서 확인 처리
+        monitor = getattr(st.session_state, 'vfd_monitor', None)
+        if monitor:
+            # active_anomalies에 없으면 먼저 등록
+            if vfd_id not in monitor.active_anomalies:
+                monitor.active_anomalies[vfd_id] = _build_auto_diag(vfd_id)
+            monitor.acknowledge_anomaly(vfd_id)
+
+    @staticmethod
+    def _clear_vfd_anomaly(vfd_id: str):
+        """이상 징후 해제 버튼 콜백"""
+        # VFD Monitor에서 해제 처리
+        monitor = getattr(st.session_state, 'vfd_monitor', None)
+        if monitor:
+            # active_anomalies에 있어야 해제 가능
+            if vfd_id in monitor.active_anomalies:
+                monitor.clear_anomaly(vfd_id)
+            else:
+                # active_anomalies에 없어도 cleared_anomalies에 추가
+                monitor.cleared_anomalies.add(vfd_id)
+
     def _get_vfd_diagnostics_data(self, plc_data: Dict) -> List[Dict]:
-        """VFD 진단 데이터 조회 (Edge Computer가 계산한 결과 사용)"""
-        # PLC에서 읽은 장비 데이터 (VFD raw 데이터)
-        equipment = plc_data.get('equipment', [])
-        diagnostics = []
+        """
+        VFD 진단 데이터 조회 (Edge Computer가 계산한 결과 사용)
 
+        PLC/Edge 진단 스냅샷이 재사용되는 동안 같은 입력이면 직전 결과를 그대로 반환
+        """
         # Edge Computer가 계산한 VFD 진단 결과 읽기 (레지스터 5200-5219)
-        vfd_diagnosis_result = None
-        if hasattr(st.session_state, 'modbus_client') and st.session_state.modbus_client:
-            vfd_diagnosis_result = st.session_state.modbus_client.read_vfd_diagnosis()
+        vfd_diagnosis_result = self._get_vfd_diagnosis()
 
         # Edge 결과가 있으면 사용, 없으면 기본값
         health_scores = vfd_diagnosis_result.get('health_scores', [100] * 10) if vfd_diagnosis_result else [100] * 10
         severity_levels = vfd_diagnosis_result.get('severity_levels', [0] * 10) if vfd_diagnosis_result else [0] * 10
 
-        # 중증도 레벨 → 이름 매핑
-        severity_names = {0: "정상", 1: "주의", 2: "경고", 3: "위험"}
-        status_grades = {0: "normal", 1: "caution", 2: "warning", 3: "critical"}
+        # 이상 징후 관리 모니터 (세션 상태 조회 1회)
+        vfd_monitor = getattr(st.session_state, 'vfd_monitor', None)
+        # 해제 VFD 집합 / 활성 이상 징후 dict (루프 밖에서 1회 참조, 멤버십 O(1))
+        cleared_anomalies = vfd_monitor.cleared_anomalies if vfd_monitor else frozenset()
+        active_anomalies = vfd_monitor.active_anomalies if vfd_monitor else {}
+
+        # 입력(PLC/Edge 스냅샷 객체, 확인/해제 상태)이 직전과 같으면 이전 결과 재사용
+        session_state = st.session_state
+        anomaly_state = (
+            frozenset(cleared_anomalies),
+            tuple((anomaly_id, anomaly.is_acknowledged) for anomaly_id, anomaly in active_anomalies.items()),
+        )
+        cached = session_state.get('_vfd_diagnostics_snapshot')
+        if (cached is not None and cached[0] is plc_data and cached[1] is vfd_diagnosis_result
+                and cached[2] == anomaly_state):
+            return cached[3]
 
-        # 장비별 정격 전류 (A) - 파라미터 표시용
-        rated_currents = {'SWP': 300.0, 'FWP': 370.0, 'FAN': 70.0}
+        # PLC에서 읽은 장비 데이터 (VFD raw 데이터)
+        equipment = plc_data.get('equipment', [])
+        diagnostics = []
 
         for i, eq in enumerate(equipment):
             eq_name = eq.get('name', '')
@@ -1952,13 +1396,13 @@ class EdgeComputerDashboard:
             # VFD ID 생성
             if "SWP" in eq_name:
                 vfd_id = eq_name.replace("SWP", "SW_PUMP_")
-                rated_current = rated_currents['SWP']
+                rated_current = _VFD_RATED_CURRENTS['SWP']
             elif "FWP" in eq_name:
                 vfd_id = eq_name.replace("FWP", "FW_PUMP_")
-                rated_current = rated_currents['FWP']
+                rated_current = _VFD_RATED_CURRENTS['FWP']
             elif "FAN" in eq_name:
                 vfd_id = eq_name.replace("FAN", "ER_FAN_")
-                rated_current = rated_currents['FAN']
+                rated_current = _VFD_RATED_CURRENTS['FAN']
             else:
                 vfd_id = eq_name
                 rated_current = 100.0
@@ -1966,24 +1410,12 @@ class EdgeComputerDashboard:
             # Edge Computer가 계산한 결과 사용
             health_score = health_scores[i] if i < len(health_scores) else 100
             severity_level = severity_levels[i] if i < len(severity_levels) else 0
-            severity_name = severity_names.get(severity_level, "정상")
-            status_grade = status_grades.get(severity_level, "normal")
-
-            # VFD 진단 데이터 추출 (PLC에서 읽은 20개 레지스터 - 표시용)
-            motor_thermal = eq.get('motor_thermal', 0)
-            heatsink_temp = eq.get('heatsink_temp', 0)
-            inverter_thermal = eq.get('inverter_thermal', 0)
-            motor_current = eq.get('motor_current', 0)
-            warning_word = eq.get('warning_word', 0)
-            over_temps = eq.get('over_temps', 0)
-            phase_u = eq.get('phase_u_current', 0)
-            phase_v = eq.get('phase_v_current', 0)
-            phase_w = eq.get('phase_w_current', 0)
-            frequency = eq.get('frequency', 0)
-            dc_link_voltage = eq.get('dc_link_voltage', 0)
-            run_hours = eq.get('run_hours', 0)
-            num_starts = eq.get('num_starts', 0)
-            kwh_counter = eq.get('kwh_counter', 0)
+            severity_name, status_grade = _SEVERITY_LABELS.get(severity_level, _SEVERITY_LABELS[0])
+
+            # VFD 진단 데이터 추출 (PLC에서 읽은 20개 레지스터 - 표시용, 없는 항목은 0)
+            (motor_thermal, heatsink_temp, inverter_thermal, motor_current, warning_word, over_temps,
+             phase_u, phase_v, phase_w, frequency, dc_link_voltage, run_hours, num_starts,
+             kwh_counter) = _get_vfd_raw_fields({**_VFD_RAW_DEFAULTS, **eq})
 
             # 전류 정격 대비 비율 (%) - 표시용
             current_ratio = (motor_current / rated_current * 100) if rated_current > 0 else 0
@@ -2031,30 +1463,17 @@ class EdgeComputerDashboard:
                 recommendations.append("정상 운전 중.")
 
             # 정비 우선순위에 따른 메시지
-            if severity_level >= 3:
-                warning = "즉시 점검 필요"
-                priority = "높음"
-            elif severity_level >= 2:
-                warning = "정비 계획 수립"
-                priority = "중간"
-            elif severity_level >= 1:
-                warning = "모니터링 강화"
-                priority = "낮음"
-            else:
-                warning = "정상 운전 중"
-                priority = "낮음"
+            warning, priority = _SEVERITY_MAINTENANCE[min(max(severity_level, 0), 3)]
 
             # 활성 이상 징후 확인 및 관리
             is_acknowledged = False
             is_cleared = False
-            if hasattr(st.session_state, 'vfd_monitor') and st.session_state.vfd_monitor:
-                vfd_monitor = st.session_state.vfd_monitor
-                if vfd_id in vfd_monitor.cleared_anomalies:
-                    is_cleared = True
-                else:
-                    anomaly_status = vfd_monitor.get_anomaly_status(vfd_id)
-                    if anomaly_status:
-                        is_acknowledged = anomaly_status.is_acknowledged
+            if vfd_id in cleared_anomalies:
+                is_cleared = True
+            else:
+                anomaly_status = active_anomalies.get(vfd_id)
+                if anomaly_status:
+                    is_acknowledged = anomaly_status.is_acknowledged
 
             # 7개 파라미터 상세 정보 (표시용 - 점수는 임계값 기반 계산)
             def get_param_score(value, thresholds):
@@ -2114,34 +1533,74 @@ class EdgeComputerDashboard:
                 'is_cleared': is_cleared,
             })
 
+        session_state['_vfd_diagnostics_snapshot'] = (plc_data, vfd_diagnosis_result, anomaly_state, diagnostics)
         return diagnostics
 
-    # ==================== 탭 4: 센서 & 장비 상태 ====================
-    def _render_sensor_equipment_status(self):
-        """센서 & 장비 상태 탭"""
-        st.markdown("## 📈 센서 & 장비 상태")
+    @staticmethod
+    @st.cache_data(max_entries=16, show_spinner=False)
+    def _create_temp_prediction_figure(current_temp: float, predicted_temp: float, temp_rise_rate: float) -> go.Figure:
+        """온도 예측 그래프 생성 (현재 → 30분 후, 동일 온도 값은 캐시 재사용)"""
+        # 현재부터 30분 후까지 선형 예측
+        minutes = list(range(0, 35, 5))  # 0, 5, 10, 15, 20, 25, 30분
+        predicted_temps = [current_temp + (temp_rise_rate * m) for m in minutes]
 
-        # PLC 데이터 가져오기
-        plc_data = self._get_plc_data()
+        fig = go.Figure()
 
-        if plc_data is None:
-            st.error("⚠️ PLC 연결이 필요합니다.")
-            return
+        # 예측 온도 라인
+        fig.add_trace(go.Scatter(
+            x=minutes,
+            y=predicted_temps,
+            mode='lines+markers',
+            name='예측 온도',
+            line=dict(color='#3b82f6', width=3),
+            marker=dict(size=8)
+        ))
 
-        # 1. 전체 센서 테이블
-        st.markdown("### 🌡️ 전체 센서 현황")
+        # 현재 온도 강조
+        fig.add_trace(go.Scatter(
+            x=[0],
+            y=[current_temp],
+            mode='markers',
+            name='현재 온도',
+            marker=dict(size=15, color='#10b981', symbol='star')
+        ))
 
-        sensors = plc_data.get('sensors', {})
+        # 30분 후 예측 온도 강조
+        fig.add_trace(go.Scatter(
+            x=[30],
+            y=[predicted_temp],
+            mode='markers',
+            name='30분 후 예측',
+            marker=dict(size=15, color='#ef4444', symbol='diamond')
+        ))
+
+        fig.add_hline(y=80, line_dash="dash", line_color="#f59e0b", annotation_text="경고 온도 (80°C)")
+        fig.add_hline(y=90, line_dash="dash", line_color="#ef4444", annotation_text="위험 온도 (90°C)")
+
+        fig.update_layout(
+            height=350,
+            xaxis_title="시간 (분)",
+            yaxis_title="온도 (°C)",
+            **_CHART_THEME,
+            showlegend=True,
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
+        )
+
+        return fig
+
+    @staticmethod
+    @st.cache_data(max_entries=8, show_spinner=False)
+    def _build_sensor_table_html(sensor_values: Tuple) -> str:
+        """전체 센서 테이블 HTML 생성 (동일 센서 값은 캐시 재사용)"""
         sensor_data = [
-            {'센서': 'TX1', '설명': 'CSW PP Disc Temp', '값': f"{sensors.get('TX1', 0):.1f} °C", '상태': '✅ 정상'},
-            {'센서': 'TX2', '설명': 'No.1 CLR SW Out Temp', '값': f"{sensors.get('TX2', 0):.1f} °C", '상태': '✅ 정상'},
-            {'센서': 'TX3', '설명': 'No.2 CLR SW Out Temp', '값': f"{sensors.get('TX3', 0):.1f} °C", '상태': '✅ 정상'},
-            {'센서': 'TX4', '설명': 'CLR FW In Temp', '값': f"{sensors.get('TX4', 0):.1f} °C", '상태': '✅ 정상'},
-            {'센서': 'TX5', '설명': 'CLR FW Out Temp', '값': f"{sensors.get('TX5', 0):.1f} °C", '상태': '✅ 정상'},
-            {'센서': 'TX6', '설명': 'E/R Inside Temp', '값': f"{sensors.get('TX6', 0):.1f} °C", '상태': '✅ 정상'},
-            {'센서': 'TX7', '설명': 'E/R Outside Temp', '값': f"{sensors.get('TX7', 0):.1f} °C", '상태': '✅ 정상'},
-            {'센서': 'PX1', '설명': 'CSW PP Disc Press', '값': f"{sensors.get('PX1', 0):.2f} kg/cm²", '상태': '✅ 정상'},
-            {'센서': 'PU1', '설명': 'M/E Load', '값': f"{sensors.get('PU1', 0):.1f} %", '상태': '✅ 정상'},
+            {'센서': key, '설명': description, '값': value_format % value, '상태': '✅ 정상'}
+            for (key, description, value_format), value in zip(_SENSOR_TABLE_ROWS, sensor_values)
         ]
 
         sensor_df = pd.DataFrame(sensor_data)
@@ -2188,7 +1647,57 @@ class EdgeComputerDashboard:
             ]}
         ])
 
-        st.write(styled_sensor_df.to_html(escape=False), unsafe_allow_html=True)
+        return styled_sensor_df.to_html(escape=False)
+
+    @staticmethod
+    @st.cache_data(ttl=LIVE_REFRESH_SECONDS, max_entries=8, show_spinner=False)
+    def _create_sensor_trend_figure(selected_sensors: Tuple, base_values: Tuple) -> go.Figure:
+        """센서 트렌드 그래프 생성 (동일 센서/값은 갱신 주기 내 캐시 재사용)"""
+        # 임시 트렌드 데이터 생성
+        timestamps = [datetime.now() - timedelta(minutes=60-i*5) for i in range(12)]
+
+        fig = go.Figure()
+
+        for sensor, base_value in zip(selected_sensors, base_values):
+            fig.add_trace(go.Scatter(
+                x=timestamps,
+                y=base_value + _SENSOR_TREND_OFFSETS,
+                mode='lines+markers',
+                name=sensor,
+                line=dict(width=2),
+                marker=dict(size=6)
+            ))
+
+        fig.update_layout(
+            height=400,
+            xaxis_title="시간",
+            yaxis_title="값",
+            **_CHART_THEME,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        )
+
+        return fig
+
+    # ==================== 탭 4: 센서 & 장비 상태 ====================
+    @st.fragment(run_every=LIVE_REFRESH_SECONDS)
+    def _render_sensor_equipment_status(self):
+        """센서 & 장비 상태 탭"""
+        st.markdown("## 📈 센서 & 장비 상태")
+
+        # PLC 데이터 가져오기
+        plc_data = self._get_plc_data()
+
+        if plc_data is None:
+            st.error("⚠️ PLC 연결이 필요합니다.")
+            return
+
+        # 1. 전체 센서 테이블
+        st.markdown("### 🌡️ 전체 센서 현황")
+
+        sensors = plc_data.get('sensors', {})
+        # 센서 값이 같으면 Styler/HTML 생성 생략 (캐시된 HTML 재사용)
+        sensor_values = tuple(sensors.get(key, 0) for key, _, _ in _SENSOR_TABLE_ROWS)
+        st.write(self._build_sensor_table_html(sensor_values), unsafe_allow_html=True)
 
         st.markdown("---")
 
@@ -2202,35 +1711,10 @@ class EdgeComputerDashboard:
         )
 
         if selected_sensors:
-            # 임시 트렌드 데이터 생성
-            timestamps = [datetime.now() - timedelta(minutes=60-i*5) for i in range(12)]
-
-            fig = go.Figure()
-
-            for sensor in selected_sensors:
-                base_value = sensors.get(sensor, 50)
-                trend_data = [base_value + (i % 4 - 2) * 2 for i in range(12)]
-
-                fig.add_trace(go.Scatter(
-                    x=timestamps,
-                    y=trend_data,
-                    mode='lines+markers',
-                    name=sensor,
-                    line=dict(width=2),
-                    marker=dict(size=6)
-                ))
-
-            fig.update_layout(
-                height=400,
-                xaxis_title="시간",
-                yaxis_title="값",
-                template="plotly_dark",
-                paper_bgcolor='#1e293b',
-                plot_bgcolor='#1e293b',
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            # 선택 센서/값이 같으면 갱신 주기 내 캐시된 그래프 재사용
+            base_values = tuple(sensors.get(sensor, 50) for sensor in selected_sensors)
+            fig = self._create_sensor_trend_figure(tuple(selected_sensors), base_values)
+            st.plotly_chart(fig, use_container_width=True, config=_LIVE_PLOT_CONFIG)
 
         st.markdown("---")
 
@@ -2239,29 +1723,58 @@ class EdgeComputerDashboard:
 
         equipment = plc_data.get('equipment', [])
 
+        # 장비 목록은 하나의 표로 렌더링 (장비별 expander/metric 위젯 생성 없음)
+        names, freqs, powers, avg_powers, run_hours, statuses, directions = [], [], [], [], [], [], []
         for eq in equipment:
-            freq = eq.get('frequency', 0.0)
             power = eq.get('power', 0.0)
-            avg_power = eq.get('avg_power', power)  # avg_power가 없으면 power 사용
-            run_hours = eq.get('run_hours', 0)
-            with st.expander(f"**{eq['name']}** - {freq:.1f} Hz, {power:.1f} kW"):
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.metric("주파수", f"{freq:.1f} Hz")
-                    st.metric("전력", f"{power:.1f} kW")
-
-                with col2:
-                    st.metric("평균 전력", f"{avg_power:.1f} kW")
-                    st.metric("운전 시간", f"{run_hours:,} h")
-
-                with col3:
-                    running = eq.get('running', False) or eq.get('running_fwd', False) or eq.get('running_bwd', False)
-                    st.metric("상태", "✅ 운전중" if running else "⚪ 정지")
+            running_fwd = eq.get('running_fwd', False)
+            running_bwd = eq.get('running_bwd', False)
+            names.append(eq['name'])
+            freqs.append(eq.get('frequency', 0.0))
+            powers.append(power)
+            avg_powers.append(eq.get('avg_power', power))  # avg_power가 없으면 power 사용
+            run_hours.append(eq.get('run_hours', 0))
+            statuses.append("✅ 운전중" if (eq.get('running', False) or running_fwd or running_bwd) else "⚪ 정지")
+            if 'FAN' in eq['name']:
+                directions.append("정방향" if running_fwd else ("역방향" if running_bwd else "정지"))
+            else:
+                directions.append("-")
+
+        eq_df = pd.DataFrame({
+            "장비": names,
+            "주파수 (Hz)": np.array(freqs, dtype=np.float32),
+            "전력 (kW)": np.array(powers, dtype=np.float32),
+            "평균 전력 (kW)": np.array(avg_powers, dtype=np.float32),
+            "운전 시간 (h)": np.array(run_hours, dtype=np.int64),
+            "상태": pd.Categorical(statuses),
+            "방향": pd.Categorical(directions),
+        }, copy=False)
+        st.dataframe(
+            eq_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "주파수 (Hz)": st.column_config.NumberColumn(format="%.1f"),
+                "전력 (kW)": st.column_config.NumberColumn(format="%.1f"),
+                "평균 전력 (kW)": st.column_config.NumberColumn(format="%.1f"),
+                "운전 시간 (h)": st.column_config.NumberColumn(format="%d"),
+            },
+        )
 
-                    if 'FAN' in eq['name']:
-                        direction = "정방향" if eq.get('running_fwd', False) else ("역방향" if eq.get('running_bwd', False) else "정지")
-                        st.metric("방향", direction)
+        # 선택 장비 상세 (지표 그리드 1회 렌더링)
+        if names:
+            selected_eq = st.selectbox("장비 선택", names, key="sensor_equipment_select")
+            i = names.index(selected_eq)
+            metrics = [
+                ("주파수", f"{freqs[i]:.1f} Hz"),
+                ("전력", f"{powers[i]:.1f} kW"),
+                ("평균 전력", f"{avg_powers[i]:.1f} kW"),
+                ("운전 시간", f"{run_hours[i]:,} h"),
+                ("상태", statuses[i]),
+            ]
+            if directions[i] != "-":
+                metrics.append(("방향", directions[i]))
+            st.markdown(_metric_grid_html(metrics), unsafe_allow_html=True)
 
         st.markdown("---")
 
@@ -2364,15 +1877,14 @@ class EdgeComputerDashboard:
 
             col1, col2, col3 = st.columns(3)
 
-            # session_state 초기화
-            if 'motor_capacity' not in st.session_state:
-                st.session_state.motor_capacity = config.MOTOR_CAPACITY.copy()
+            # session_state 초기화 (조회 1회)
+            motor_capacity = st.session_state.setdefault('motor_capacity', config.MOTOR_CAPACITY.copy())
 
             with col1:
                 st.markdown("#### 💧 SWP 모터 용량")
                 new_swp_capacity = st.number_input(
                     "Sea Water Pump (kW)",
-                    value=st.session_state.motor_capacity.get("SWP", 132.0),
+                    value=motor_capacity["SWP"],
                     min_value=10.0,
                     max_value=500.0,
                     step=1.0,
@@ -2383,7 +1895,7 @@ class EdgeComputerDashboard:
                 st.markdown("#### 💦 FWP 모터 용량")
                 new_fwp_capacity = st.number_input(
                     "Fresh Water Pump (kW)",
-                    value=st.session_state.motor_capacity.get("FWP", 75.0),
+                    value=motor_capacity["FWP"],
                     min_value=10.0,
                     max_value=500.0,
                     step=1.0,
@@ -2394,7 +1906,7 @@ class EdgeComputerDashboard:
                 st.markdown("#### 🌪️ FAN 모터 용량")
                 new_fan_capacity = st.number_input(
                     "E/R Fan (kW)",
-                    value=st.session_state.motor_capacity.get("FAN", 54.3),
+                    value=motor_capacity["FAN"],
                     min_value=10.0,
                     max_value=500.0,
                     step=0.1,
@@ -2408,13 +1920,10 @@ class EdgeComputerDashboard:
                     "FAN": new_fan_capacity,
                 }
 
-                # config 파일에 저장
+                # config 파일에 저장 (config.MOTOR_CAPACITY도 함께 갱신 - 모듈 reload 불필요)
                 if config.save_motor_capacity(new_capacity):
                     st.session_state.motor_capacity = new_capacity.copy()
 
-                    # config 모듈 reload
-                    importlib.reload(config)
-
                     st.success(f"""
                     ✅ 모터 용량이 저장되었습니다!
                     - SWP: {new_swp_capacity:.1f} kW
@@ -2447,13 +1956,12 @@ class EdgeComputerDashboard:
             col1, col2 = st.columns([2, 1])
 
             with col1:
-                # session_state 초기화
-                if 'electricity_rate' not in st.session_state:
-                    st.session_state.electricity_rate = config.ELECTRICITY_RATE
+                # session_state 초기화 (조회 1회)
+                electricity_rate = st.session_state.setdefault('electricity_rate', config.ELECTRICITY_RATE)
 
                 new_rate = st.number_input(
                     "전기요금 단가 (원/kWh)",
-                    value=st.session_state.electricity_rate,
+                    value=electricity_rate,
                     min_value=50.0,
                     max_value=500.0,
                     step=1.0,
@@ -2473,23 +1981,8 @@ class EdgeComputerDashboard:
         # 5. 알람 임계값 설정
         st.markdown("### 🚨 알람 임계값 설정")
 
-        # session_state 초기화
-        if 'alarm_thresholds' not in st.session_state:
-            st.session_state.alarm_thresholds = {
-                # 온도 센서 (°C)
-                'TX1_high': 30.0,   # CSW PP Disc Temp
-                'TX2_high': 50.0,   # No.1 COOLER SW Out Temp
-                'TX3_high': 50.0,   # No.2 COOLER SW Out Temp
-                'TX4_high': 50.0,   # COOLER FW In Temp
-                'TX5_high': 40.0,   # COOLER FW Out Temp
-                'TX6_high': 50.0,   # E/R Inside Temp
-                'TX7_high': 40.0,   # E/R Outside Temp
-                # 압력 센서
-                'PX1_low': 1.5,     # CSW PP Disc Press 하한 (kg/cm²)
-                'PX1_high': 4.0,    # CSW PP Disc Press 상한 (kg/cm²)
-                # 부하
-                'PU1_high': 85.0,   # M/E Load 상한 (%)
-            }
+        # session_state 초기화 (조회 1회)
+        alarm_thresholds = st.session_state.setdefault('alarm_thresholds', dict(_DEFAULT_ALARM_THRESHOLDS))
 
         _, center_col5, _ = st.columns([0.1, 0.8, 0.1])
 
@@ -2515,112 +2008,37 @@ class EdgeComputerDashboard:
             </style>
             """, unsafe_allow_html=True)
 
-            col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
-
-            with col1:
-                tx1_high = st.number_input(
-                    "TX1 (°C)",
-                    value=st.session_state.alarm_thresholds['TX1_high'],
-                    min_value=20.0, max_value=60.0, step=1.0,
-                    key="tx1_alarm"
-                )
-
-            with col2:
-                tx2_high = st.number_input(
-                    "TX2 (°C)",
-                    value=st.session_state.alarm_thresholds['TX2_high'],
-                    min_value=30.0, max_value=70.0, step=1.0,
-                    key="tx2_alarm"
-                )
-
-            with col3:
-                tx3_high = st.number_input(
-                    "TX3 (°C)",
-                    value=st.session_state.alarm_thresholds['TX3_high'],
-                    min_value=30.0, max_value=70.0, step=1.0,
-                    key="tx3_alarm"
-                )
-
-            with col4:
-                tx4_high = st.number_input(
-                    "TX4 (°C)",
-                    value=st.session_state.alarm_thresholds['TX4_high'],
-                    min_value=30.0, max_value=70.0, step=1.0,
-                    key="tx4_alarm"
-                )
-
-            with col5:
-                tx5_high = st.number_input(
-                    "TX5 (°C)",
-                    value=st.session_state.alarm_thresholds['TX5_high'],
-                    min_value=30.0, max_value=60.0, step=1.0,
-                    key="tx5_alarm"
-                )
-
-            with col6:
-                tx6_high = st.number_input(
-                    "TX6 (°C)",
-                    value=st.session_state.alarm_thresholds['TX6_high'],
-                    min_value=30.0, max_value=80.0, step=1.0,
-                    key="tx6_alarm"
-                )
-
-            with col7:
-                tx7_high = st.number_input(
-                    "TX7 (°C)",
-                    value=st.session_state.alarm_thresholds['TX7_high'],
-                    min_value=20.0, max_value=60.0, step=1.0,
-                    key="tx7_alarm"
-                )
+            # 임계값 입력 위젯 (사양 테이블 기반 생성)
+            new_thresholds = {}
+            for col, (key, label, min_value, max_value, step, widget_key, _, _) in zip(st.columns(7), _TEMP_ALARM_SPECS):
+                with col:
+                    new_thresholds[key] = st.number_input(
+                        label,
+                        value=alarm_thresholds[key],
+                        min_value=min_value, max_value=max_value, step=step,
+                        key=widget_key
+                    )
 
             st.markdown("---")
 
             st.markdown("#### 💧 압력 & ⚙️ 부하 알람 임계값")
 
-            col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
-
-            with col1:
-                px1_low = st.number_input(
-                    "PX1 하한 (kg/cm²)",
-                    value=st.session_state.alarm_thresholds['PX1_low'],
-                    min_value=0.0, max_value=5.0, step=0.1,
-                    key="px1_low_alarm"
-                )
-
-            with col2:
-                px1_high = st.number_input(
-                    "PX1 상한 (kg/cm²)",
-                    value=st.session_state.alarm_thresholds['PX1_high'],
-                    min_value=0.0, max_value=10.0, step=0.1,
-                    key="px1_high_alarm"
-                )
-
-            with col3:
-                pu1_high = st.number_input(
-                    "PU1 상한 (%)",
-                    value=st.session_state.alarm_thresholds['PU1_high'],
-                    min_value=50.0, max_value=100.0, step=1.0,
-                    key="pu1_alarm"
-                )
+            for col, (key, label, min_value, max_value, step, widget_key, _, _) in zip(st.columns(7), _PROCESS_ALARM_SPECS):
+                with col:
+                    new_thresholds[key] = st.number_input(
+                        label,
+                        value=alarm_thresholds[key],
+                        min_value=min_value, max_value=max_value, step=step,
+                        key=widget_key
+                    )
 
             st.markdown("---")
 
             if st.button("💾 알람 임계값 PLC로 전송"):
                 # PLC에 쓰기 (레지스터 7000-7009)
                 try:
-                    # 임계값을 PLC 포맷으로 변환
-                    threshold_values = [
-                        int(tx1_high * 10),    # TX1: °C × 10
-                        int(tx2_high * 10),    # TX2: °C × 10
-                        int(tx3_high * 10),    # TX3: °C × 10
-                        int(tx4_high * 10),    # TX4: °C × 10
-                        int(tx5_high * 10),    # TX5: °C × 10
-                        int(tx6_high * 10),    # TX6: °C × 10
-                        int(tx7_high * 10),    # TX7: °C × 10
-                        int(px1_low * 100),    # PX1 하한: kg/cm² × 100
-                        int(px1_high * 100),   # PX1 상한: kg/cm² × 100
-                        int(pu1_high * 10),    # PU1: % × 10
-                    ]
+                    # 임계값을 PLC 포맷으로 변환 (사양 순서 = 레지스터 순서, 값 × 배율)
+                    threshold_values = [int(new_thresholds[spec[0]] * spec[6]) for spec in _ALARM_THRESHOLD_SPECS]
 
                     # PLC 쓰기
                     client = st.session_state.modbus_client
@@ -2628,32 +2046,11 @@ class EdgeComputerDashboard:
 
                     if success:
                         # session_state에도 저장
-                        st.session_state.alarm_thresholds = {
-                            'TX1_high': tx1_high,
-                            'TX2_high': tx2_high,
-                            'TX3_high': tx3_high,
-                            'TX4_high': tx4_high,
-                            'TX5_high': tx5_high,
-                            'TX6_high': tx6_high,
-                            'TX7_high': tx7_high,
-                            'PX1_low': px1_low,
-                            'PX1_high': px1_high,
-                            'PU1_high': pu1_high,
-                        }
+                        st.session_state.alarm_thresholds = new_thresholds
                         st.success("✅ 알람 임계값이 PLC로 전송되었습니다!")
-                        st.info(f"""
-                **전송된 임계값:**
-                - TX1 상한: {tx1_high}°C
-                - TX2 상한: {tx2_high}°C
-                - TX3 상한: {tx3_high}°C
-                - TX4 상한: {tx4_high}°C
-                - TX5 상한: {tx5_high}°C
-                - TX6 상한: {tx6_high}°C
-                - TX7 상한: {tx7_high}°C
-                - PX1 하한: {px1_low} kg/cm²
-                - PX1 상한: {px1_high} kg/cm²
-                - PU1 상한: {pu1_high}%
-                """)
+                        st.info("**전송된 임계값:**\n" + "\n".join(
+                            spec[7] % new_thresholds[spec[0]] for spec in _ALARM_THRESHOLD_SPECS
+                        ))
                     else:
                         st.error("❌ PLC로 임계값 전송 실패! PLC 연결을 확인하세요.")
 
@@ -2718,7 +2115,7 @@ class EdgeComputerDashboard:
 
         # 2. CSV 파일에서 알람 데이터 읽기
         logs_dir = "../../logs"  # dashboard.py 기준 상대 경로
-        all_alarms = []
+        alarm_frames = []
 
         # 날짜 범위의 모든 CSV 파일 읽기
         current_date = datetime.combine(start_date, datetime.min.time())
@@ -2730,34 +2127,47 @@ class EdgeComputerDashboard:
 
             if os.path.exists(csv_file):
                 try:
-                    with open(csv_file, 'r', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            all_alarms.append(row)
+                    # 파일 수정 시각/크기가 같으면 캐시된 내용 사용 (지난 날짜 파일은 재파싱 없음)
+                    file_stat = os.stat(csv_file)
+                    alarm_frames.append(self._load_alarm_csv(csv_file, file_stat.st_mtime, file_stat.st_size))
                 except Exception as e:
                     st.error(f"CSV 읽기 오류 ({csv_file}): {e}")
 
             current_date += timedelta(days=1)
 
-        # 3. 필터링
-        filtered_alarms = all_alarms
+        # 일별 DataFrame을 한 번에 결합 (센서/타입/상태는 범주형)
+        if alarm_frames:
+            all_alarms = pd.concat(alarm_frames, ignore_index=True)
+            all_alarms = all_alarms.astype({
+                column: 'category' for column in _ALARM_CATEGORY_COLUMNS if column in all_alarms.columns
+            })
+        else:
+            all_alarms = pd.DataFrame(columns=_ALARM_CSV_COLUMNS)
+
+        # 3. 필터링 (조건을 하나의 마스크로 결합해 한 번에 선택)
+        mask = pd.Series(True, index=all_alarms.index)
 
         if sensor_filter != "전체":
-            filtered_alarms = [a for a in filtered_alarms if a.get('sensor_id') == sensor_filter]
+            mask &= all_alarms['sensor_id'] == sensor_filter
 
         if alarm_type_filter != "전체":
-            filtered_alarms = [a for a in filtered_alarms if a.get('alarm_type') == alarm_type_filter]
+            mask &= all_alarms['alarm_type'] == alarm_type_filter
+
+        filtered_alarms = all_alarms[mask].reset_index(drop=True)
+
+        # 상태 마스크 / 건수 (실시간 알람과 통계에서 공용)
+        unack_mask = filtered_alarms['status'] == '미확인'
+        unack_count = int(unack_mask.sum())
+        ack_count = int((filtered_alarms['status'] == '확인됨').sum())
 
         # 4. 실시간 알람 (미확인 알람)
         st.markdown("### 🚨 실시간 알람 (미확인)")
 
-        unack_alarms = [a for a in filtered_alarms if a.get('status') == '미확인']
-
-        if unack_alarms:
-            st.warning(f"⚠️ 미확인 알람: {len(unack_alarms)}개")
+        if unack_count:
+            st.warning(f"⚠️ 미확인 알람: {unack_count}개")
 
             # 최근 5개만 표시
-            for alarm in unack_alarms[:5]:
+            for alarm in filtered_alarms[unack_mask].head(5).to_dict('records'):
                 sensor_id = alarm.get('sensor_id', 'N/A')
                 alarm_type = alarm.get('alarm_type', 'N/A')
                 sensor_value = alarm.get('sensor_value', 'N/A')
@@ -2773,13 +2183,10 @@ class EdgeComputerDashboard:
         # 5. 알람 로그 테이블
         st.markdown("### 📋 알람 로그")
 
-        if filtered_alarms:
-            # DataFrame 생성
-            alarm_df = pd.DataFrame(filtered_alarms)
-
+        if len(filtered_alarms):
             # 컬럼 순서 및 이름 정리
             column_order = ['timestamp', 'sensor_id', 'alarm_type', 'sensor_value', 'threshold', 'status']
-            alarm_df = alarm_df[column_order]
+            alarm_df = filtered_alarms[column_order]
 
             # 컬럼명 한글화
             alarm_df.columns = ['시간', '센서', '타입', '센서값', '임계값', '상태']
@@ -2800,31 +2207,26 @@ class EdgeComputerDashboard:
         # 6. 알람 통계
         st.markdown("### 📊 알람 통계")
 
-        if filtered_alarms:
+        if len(filtered_alarms):
             col1, col2, col3 = st.columns(3)
 
             with col1:
                 st.metric("전체 알람", len(filtered_alarms))
 
             with col2:
-                unack_count = len([a for a in filtered_alarms if a.get('status') == '미확인'])
                 st.metric("미확인 알람", unack_count)
 
             with col3:
-                ack_count = len([a for a in filtered_alarms if a.get('status') == '확인됨'])
                 st.metric("확인된 알람", ack_count)
 
-            # 센서별 통계
+            # 센서별 통계 (첫 등장 순서로 집계 후 횟수 내림차순)
             st.markdown("#### 센서별 알람 발생 횟수")
-            sensor_counts = {}
-            for alarm in filtered_alarms:
-                sensor = alarm.get('sensor_id', 'UNKNOWN')
-                sensor_counts[sensor] = sensor_counts.get(sensor, 0) + 1
+            sensor_counts = filtered_alarms.groupby('sensor_id', sort=False, observed=True).size()
 
-            sensor_stats_df = pd.DataFrame(
-                list(sensor_counts.items()),
-                columns=['센서', '발생 횟수']
-            ).sort_values('발생 횟수', ascending=False)
+            sensor_stats_df = pd.DataFrame({
+                '센서': sensor_counts.index.astype(object),
+                '발생 횟수': sensor_counts.to_numpy(),
+            }).sort_values('발생 횟수', ascending=False)
 
             st.dataframe(sensor_stats_df, use_container_width=True, height=200)
 
@@ -2835,16 +2237,13 @@ class EdgeComputerDashboard:
 
         with col1:
             if st.button("📥 조회된 알람 CSV 다운로드"):
-                if filtered_alarms:
-                    csv_output = io.StringIO()
-                    fieldnames = ['timestamp', 'sensor_id', 'alarm_type', 'sensor_value', 'threshold', 'status', 'ack_timestamp']
-                    writer = csv.DictWriter(csv_output, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(filtered_alarms)
+                if len(filtered_alarms):
+                    # 없는 컬럼은 빈 값으로 출력 (csv 모듈과 같은 CRLF 줄바꿈)
+                    csv_output = filtered_alarms.reindex(columns=_ALARM_CSV_COLUMNS).to_csv(index=False, lineterminator='\r\n')
 
                     st.download_button(
                         label="다운로드",
-                        data=csv_output.getvalue(),
+                        data=csv_output,
                         file_name=f"alarm_export_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv",
                         mime="text/csv"
                     )
@@ -2855,6 +2254,16 @@ class EdgeComputerDashboard:
             if st.button("🔄 새로고침"):
                 st.rerun()
 
+    @staticmethod
+    @st.cache_data(max_entries=64, show_spinner=False)
+    def _load_alarm_csv(path: str, mtime: float, size: int) -> pd.DataFrame:
+        """일별 알람 CSV 읽기 (경로 + 수정 시각 + 크기 기준 캐시, 값은 원문 문자열 유지)"""
+        try:
+            return pd.read_csv(path, encoding='utf-8', dtype=str, keep_default_na=False)
+        except pd.errors.EmptyDataError:
+            # 빈 파일 (헤더 없음)
+            return pd.DataFrame(columns=_ALARM_CSV_COLUMNS)
+
     # ==================== 탭 7: 학습 진행 (개발용) ====================
     def _render_learning_progress(self):
         """학습 진행 탭 (EDGE_AI_REAL 참조)"""
@@ -2922,9 +2331,7 @@ class EdgeComputerDashboard:
                 overlaying='y',
                 side='right'
             ),
-            template="plotly_dark",
-            paper_bgcolor='#1e293b',
-            plot_bgcolor='#1e293b',
+            **_CHART_THEME,
             legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5)
         )
 
@@ -2988,10 +2395,14 @@ class EdgeComputerDashboard:
         """)
 
     # ==================== 탭 8: 시나리오 테스트 (개발용) ====================
+    @st.fragment(run_every=LIVE_REFRESH_SECONDS)
     def _render_scenario_testing(self):
         """시나리오 테스트 렌더링"""
         st.header("🎬 시나리오 테스트")
 
+        # 세션 상태 프록시는 1회만 조회하고 로컬 변수로 재사용
+        session_state = st.session_state
+
         st.info("""
         **시나리오 모드**에서는 다양한 운항 조건을 시뮬레이션할 수 있습니다.
         시나리오를 활성화하면 **메인 대시보드의 센서 값이 시나리오 데이터로 변경**되며,
@@ -3004,16 +2415,16 @@ class EdgeComputerDashboard:
         with col1:
             use_scenario = st.checkbox(
                 "시나리오 모드 활성화",
-                value=st.session_state.use_scenario_data,
+                value=session_state.use_scenario_data,
                 key="scenario_mode_toggle"
             )
 
-            if use_scenario != st.session_state.use_scenario_data:
-                st.session_state.use_scenario_data = use_scenario
+            if use_scenario != session_state.use_scenario_data:
+                session_state.use_scenario_data = use_scenario
                 st.rerun()
 
         with col2:
-            if st.session_state.use_scenario_data:
+            if session_state.use_scenario_data:
                 st.success("✅ 시나리오 모드 활성화됨 - 메인 대시보드에서 실시간 변화를 확인하세요!")
             else:
                 st.warning("⚪ 시나리오 모드 비활성화됨 - 고정 시뮬레이션 데이터 사용 중")
@@ -3039,9 +2450,9 @@ class EdgeComputerDashboard:
             }
 
             # 최초 렌더링 시 기본값을 10배속으로 설정
-            if "speed_selector" not in st.session_state:
-                st.session_state.speed_selector = "10배속 (빠름)"
-                st.session_state.speed_multiplier = 10.0
+            if "speed_selector" not in session_state:
+                session_state.speed_selector = "10배속 (빠름)"
+                session_state.speed_multiplier = 10.0
                 self.scenario_engine.set_time_multiplier(10.0)
 
             selected_speed = st.selectbox(
@@ -3052,14 +2463,14 @@ class EdgeComputerDashboard:
             )
 
             new_speed = speed_options[selected_speed]
-            previous_speed = st.session_state.get("speed_multiplier", new_speed)
+            previous_speed = session_state.get("speed_multiplier", new_speed)
             if abs(new_speed - previous_speed) > 0.001:
                 self.scenario_engine.set_time_multiplier(new_speed)
-                st.session_state.speed_multiplier = new_speed
+                session_state.speed_multiplier = new_speed
                 st.rerun()  # 즉시 화면 새로고침
 
         with col_speed3:
-            display_speed = st.session_state.get("speed_multiplier", speed_options[selected_speed])
+            display_speed = session_state.get("speed_multiplier", speed_options[selected_speed])
             if display_speed > 1.0:
                 st.info(f"⏩ {display_speed:.1f}배 빠른 속도로 진행 중")
             elif display_speed < 1.0:
@@ -3070,7 +2481,7 @@ class EdgeComputerDashboard:
         st.markdown("---")
 
         # 현재 선택된 시나리오 타입
-        current = st.session_state.current_scenario_type
+        current = session_state.current_scenario_type
 
         # 라디오 버튼으로 변경 (한 줄 표시 보장)
         scenario_options = {
@@ -3089,11 +2500,11 @@ class EdgeComputerDashboard:
                 break
 
         # 세션 상태 초기화 또는 유효성 검증
-        if 'selected_scenario_label' not in st.session_state or st.session_state.selected_scenario_label not in scenario_options:
-            st.session_state.selected_scenario_label = current_label
+        if 'selected_scenario_label' not in session_state or session_state.selected_scenario_label not in scenario_options:
+            session_state.selected_scenario_label = current_label
 
         # 라디오 버튼으로 시나리오 선택
-        selected_index = list(scenario_options.keys()).index(st.session_state.selected_scenario_label) if st.session_state.selected_scenario_label in scenario_options else 0
+        selected_index = list(scenario_options.keys()).index(session_state.selected_scenario_label) if session_state.selected_scenario_label in scenario_options else 0
 
         col_radio, col_button = st.columns([4, 1])
 
@@ -3111,23 +2522,16 @@ class EdgeComputerDashboard:
             start_button = st.button("🚀 시작", type="primary", use_container_width=True)
 
         # 선택이 변경되면 선택만 업데이트 (시작 버튼으로 실행)
-        if selected != st.session_state.selected_scenario_label:
-            st.session_state.selected_scenario_label = selected
+        if selected != session_state.selected_scenario_label:
+            session_state.selected_scenario_label = selected
 
         # 시작 버튼 클릭 시 시나리오 시작
         if start_button:
             self.scenario_engine.start_scenario(scenario_options[selected])
-            st.session_state.use_scenario_data = True
-            st.session_state.current_scenario_type = scenario_options[selected]
+            session_state.use_scenario_data = True
+            session_state.current_scenario_type = scenario_options[selected]
             # 주파수 및 대수 초기화
-            st.session_state.current_frequencies = {
-                'sw_pump': 48.0,
-                'fw_pump': 48.0,
-                'er_fan': 48.0,  # 47.0 → 48.0 (일관성)
-                'er_fan_count': 3,  # 2 → 3 (E/R 팬 기본 3대)
-                'time_at_max_freq': 0,  # 60Hz 유지 시간 (초)
-                'time_at_min_freq': 0   # 40Hz 유지 시간 (초)
-            }
+            session_state.current_frequencies = dict(_DEFAULT_FREQS)
             # RuleBasedController 리셋
             self.integrated_controller.rule_controller.reset()
             st.rerun()
@@ -3178,7 +2582,7 @@ class EdgeComputerDashboard:
         st.markdown("---")
 
         # 현재 센서 값 (시나리오 활성화 시)
-        if st.session_state.use_scenario_data:
+        if session_state.use_scenario_data:
             st.subheader("🌡️ 현재 센서 값 & AI 판단")
 
             values = self.scenario_engine.get_current_values()
@@ -3188,8 +2592,8 @@ class EdgeComputerDashboard:
 
             # 현재 주파수 및 대수 (세션 상태에 저장하여 추적)
             # 강제로 er_fan_count를 3대로 리셋 (기존 2대 세션 상태 무시)
-            if 'current_frequencies' not in st.session_state:
-                st.session_state.current_frequencies = {
+            if 'current_frequencies' not in session_state:
+                session_state.current_frequencies = {
                     'sw_pump': 48.0,
                     'fw_pump': 48.0,
                     'er_fan': 47.0,
@@ -3199,10 +2603,9 @@ class EdgeComputerDashboard:
                 }
 
             # 기존 세션에서 er_fan_count가 2대로 설정되어 있으면 3대로 강제 변경
-            if st.session_state.current_frequencies.get('er_fan_count', 3) == 2:
-                st.session_state.current_frequencies['er_fan_count'] = 3
-
-            current_freqs = st.session_state.current_frequencies
+            current_freqs = session_state.current_frequencies
+            if current_freqs.get('er_fan_count', 3) == 2:
+                current_freqs['er_fan_count'] = 3
 
             # AI 판단 실행
             temperatures = {
@@ -3246,10 +2649,10 @@ class EdgeComputerDashboard:
                     st.write(f"Debug - T4 type: {type(pred.t4_pred_10min)}, value: {pred.t4_pred_10min}")
 
             # AI 판단을 현재 주파수 및 대수에 반영
-            st.session_state.current_frequencies['sw_pump'] = decision.sw_pump_freq
-            st.session_state.current_frequencies['fw_pump'] = decision.fw_pump_freq
-            st.session_state.current_frequencies['er_fan'] = decision.er_fan_freq
-            st.session_state.current_frequencies['er_fan_count'] = getattr(decision, 'er_fan_count', 3)
+            current_freqs['sw_pump'] = decision.sw_pump_freq
+            current_freqs['fw_pump'] = decision.fw_pump_freq
+            current_freqs['er_fan'] = decision.er_fan_freq
+            current_freqs['er_fan_count'] = getattr(decision, 'er_fan_count', 3)
             # 타이머는 integrated_controller가 current_freqs에 직접 업데이트했으므로 이미 반영됨
 
             # 디버깅: 타이머 상태 표시
@@ -3258,10 +2661,11 @@ class EdgeComputerDashboard:
             st.info(f"🕐 타이머 상태: 최대={timer_max}s, 최소={timer_min}s")
 
             # 시나리오별 강조 표시 플래그
-            is_er_scenario = (st.session_state.current_scenario_type == ScenarioType.ER_VENTILATION)
-            is_sw_scenario = (st.session_state.current_scenario_type == ScenarioType.HIGH_LOAD)
-            is_fw_scenario = (st.session_state.current_scenario_type == ScenarioType.COOLING_FAILURE)
-            is_pressure_scenario = (st.session_state.current_scenario_type == ScenarioType.PRESSURE_DROP)
+            scenario_type = session_state.current_scenario_type
+            is_er_scenario = (scenario_type == ScenarioType.ER_VENTILATION)
+            is_sw_scenario = (scenario_type == ScenarioType.HIGH_LOAD)
+            is_fw_scenario = (scenario_type == ScenarioType.COOLING_FAILURE)
+            is_pressure_scenario = (scenario_type == ScenarioType.PRESSURE_DROP)
 
             col1, col2, col3, col4, col5 = st.columns(5)
 
@@ -3657,6 +3061,38 @@ class EdgeComputerDashboard:
 
     # ==================== 헬퍼 함수들 ====================
     def _get_plc_data(self) -> Optional[Dict]:
+        """PLC 데이터 조회 (PLC_SNAPSHOT_MAX_AGE 이내 재호출은 세션별 직전 스냅샷 반환)"""
+        session_state = st.session_state
+        now = time.monotonic()
+        cached = session_state.get('_plc_snapshot')
+        if cached is not None and now - cached[0] < PLC_SNAPSHOT_MAX_AGE:
+            return cached[1]
+
+        plc_data = self._read_plc_data()
+        # 읽기 실패(None)는 저장하지 않음 - 다음 호출에서 재시도
+        if plc_data is not None:
+            session_state['_plc_snapshot'] = (now, plc_data)
+        return plc_data
+
+    def _get_vfd_diagnosis(self) -> Optional[Dict]:
+        """Edge VFD 진단 결과 조회 (PLC_SNAPSHOT_MAX_AGE 이내 재호출은 세션별 직전 결과 반환)"""
+        session_state = st.session_state
+        client = session_state.get('modbus_client')
+        if not client:
+            return None
+
+        now = time.monotonic()
+        cached = session_state.get('_vfd_diagnosis_snapshot')
+        if cached is not None and now - cached[0] < PLC_SNAPSHOT_MAX_AGE:
+            return cached[1]
+
+        result = client.read_vfd_diagnosis()
+        # 읽기 실패(None)는 저장하지 않음 - 다음 호출에서 재시도
+        if result is not None:
+            session_state['_vfd_diagnosis_snapshot'] = (now, result)
+        return result
+
+    def _read_plc_data(self) -> Optional[Dict]:
         """PLC에서 모든 데이터 가져오기"""
         client = st.session_state.modbus_client
 
@@ -3664,13 +3100,16 @@ class EdgeComputerDashboard:
             return None
 
         try:
-            # 센서 데이터 읽기
-            sensors = client.read_sensors()
+            # 센서 / 장비 상태 / VFD / AI 목표 주파수를 연속 구간 묶음 요청으로 읽기
+            snapshot = client.read_plc_snapshot()
+            if snapshot is None:
+                return None
+
+            sensors = snapshot['sensors']
             if sensors is None:
                 sensors = {}
 
-            # 장비 상태 읽기
-            equipment = client.read_equipment_status()
+            equipment = snapshot['equipment']
             if equipment is None:
                 # 기본 장비 데이터 생성
                 equipment = []
@@ -3708,11 +3147,8 @@ class EdgeComputerDashboard:
                         'run_hours': 0
                     })
 
-            # AI 목표 주파수 읽기 (레지스터 5000-5009)
-            target_freq_raw = client.read_holding_registers(
-                config.MODBUS_REGISTERS["AI_TARGET_FREQ_START"],
-                10
-            )
+            # AI 목표 주파수 (레지스터 5000-5009)
+            target_freq_raw = snapshot['target_frequencies_raw']
             target_frequencies = [f / 10.0 for f in target_freq_raw] if target_freq_raw else [48.4] * 10
 
             return {
@@ -3727,9 +3163,20 @@ class EdgeComputerDashboard:
 
 
 # ==================== 메인 실행 ====================
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_dashboard(source_mtime: float) -> EdgeComputerDashboard:
+    """
+    대시보드 인스턴스 (모든 세션/재실행 공유)
+
+    Args:
+        source_mtime: 이 파일의 수정 시각 - 코드 변경 시 새 인스턴스 생성용 캐시 키
+    """
+    return EdgeComputerDashboard()
+
+
 def main():
     """메인 함수"""
-    dashboard = EdgeComputerDashboard()
+    dashboard = get_dashboard(os.path.getmtime(__file__))
     dashboard.run()
 
 
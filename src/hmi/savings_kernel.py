@@ -0,0 +1,58 @@
+"""
+실시간 에너지 절감 수치 연산 커널
+큐빅 법칙(P = P_rated × (f/60)³) 기반 그룹별 전력 합산
+"""
+import numpy as np
+
+# numba (선택) - 설치 시 커널을 JIT 컴파일
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 장비 그룹 인덱스
+GROUP_SWP = 0
+GROUP_FWP = 1
+GROUP_FAN = 2
+GROUP_COUNT = 3
+
+
+def group_power_kernel(frequency, running, group, rated):
+    """
+    그룹별 60Hz 기준 전력 / VFD 운전 전력 합산
+
+    순수 수치 연산만 사용 (numba 설치 시 njit 컴파일)
+
+    Args:
+        frequency: 장비별 운전 주파수 (Hz, float64 배열)
+        running: 장비별 운전 여부 (bool 배열)
+        group: 장비별 그룹 인덱스 (int64 배열, GROUP_*)
+        rated: 장비별 정격 용량 (kW, float64 배열)
+
+    Returns:
+        (power_60hz, power_vfd) - 그룹별 합계 (길이 GROUP_COUNT)
+    """
+    power_60hz = np.zeros(GROUP_COUNT)
+    power_vfd = np.zeros(GROUP_COUNT)
+
+    for i in range(frequency.shape[0]):
+        if not running[i]:
+            continue
+
+        g = group[i]
+        power_60hz[g] += rated[i]
+        if frequency[i] > 0:
+            power_vfd[g] += rated[i] * ((frequency[i] / 60) ** 3)
+
+    return power_60hz, power_vfd
+
+
+if NUMBA_AVAILABLE:
+    # 0 주파수/정지 분기를 그대로 유지하기 위해 fastmath 미사용
+    group_power_kernel = njit(cache=True)(group_power_kernel)
+
+    # 임포트 시 1회 컴파일 (첫 화면 지연 방지)
+    group_power_kernel(
+        np.zeros(1), np.zeros(1, dtype=np.bool_), np.zeros(1, dtype=np.int64), np.zeros(1)
+    )
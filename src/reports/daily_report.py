@@ -8,6 +8,8 @@ from typing import Dict, List, Any
 import sys
 import os
 
+import numpy as np
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
@@ -66,9 +68,14 @@ class DailyReportGenerator:
         end_time: datetime
     ) -> Dict[str, Any]:
         """핵심 지표 계산"""
-        sensor_data = self.db.get_sensor_data(start_time, end_time, limit=1440)  # 1분 단위 24시간
-
-        if not sensor_data:
+        sensor_data = self.db.get_sensor_data_columns(
+            start_time, end_time, limit=1440, columns=('T5', 'T6')
+        )  # 1분 단위 24시간
+        t5 = sensor_data['T5']
+        t6 = sensor_data['T6']
+        data_points = len(t5)
+
+        if data_points == 0:
             return {
                 "energy_savings_avg": 0.0,
                 "t5_accuracy": 0.0,
@@ -76,13 +83,13 @@ class DailyReportGenerator:
                 "data_points": 0
             }
 
-        # T5 목표 달성률 (34-36°C)
-        t5_in_range = sum(1 for d in sensor_data if d.get('T5') and 34.0 <= d['T5'] <= 36.0)
-        t5_accuracy = (t5_in_range / len(sensor_data)) * 100 if sensor_data else 0.0
+        # T5 목표 달성률 (34-36°C) - NaN(NULL)은 비교 결과 False
+        t5_in_range = int(np.count_nonzero((t5 >= 34.0) & (t5 <= 36.0)))
+        t5_accuracy = (t5_in_range / data_points) * 100
 
         # T6 목표 달성률 (42-44°C)
-        t6_in_range = sum(1 for d in sensor_data if d.get('T6') and 42.0 <= d['T6'] <= 44.0)
-        t6_accuracy = (t6_in_range / len(sensor_data)) * 100 if sensor_data else 0.0
+        t6_in_range = int(np.count_nonzero((t6 >= 42.0) & (t6 <= 44.0)))
+        t6_accuracy = (t6_in_range / data_points) * 100
 
         # 평균 에너지 절약률 (임시: 성과 지표 테이블에서 조회)
         performance = self.db.get_performance_metrics("DAILY", start_time, end_time)
@@ -96,7 +103,7 @@ class DailyReportGenerator:
             "energy_savings_avg": round(energy_savings_avg, 2),
             "t5_accuracy": round(t5_accuracy, 2),
             "t6_accuracy": round(t6_accuracy, 2),
-            "data_points": len(sensor_data)
+            "data_points": data_points
         }
 
     def _calculate_safety_status(
@@ -274,7 +281,8 @@ class DailyReportGenerator:
         sensor_data = self.db.get_sensor_data(
             today_start,
             today_start + timedelta(days=1),
-            limit=100
+            limit=100,
+            columns=('latitude',)
         )
 
         if sensor_data and sensor_data[0].get('latitude'):
@@ -89,7 +89,7 @@ class WeeklyReportGenerator:
     def _analyze_environmental_adaptation(self, start: datetime, end: datetime) -> Dict[str, Any]:
         """환경 적응 분석"""
         # GPS 데이터에서 해역 분석 (간단한 버전)
-        sensor_data = self.db.get_sensor_data(start, end, limit=1000)
+        sensor_data = self.db.get_sensor_data(start, end, limit=1000, columns=('latitude',))
 
         tropical_count = 0
         temperate_count = 0
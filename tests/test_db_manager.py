@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Edge Computer 데이터베이스 관리자 테스트
+- VFD 이상 징후 해제 시 지속 시간/해제 시각 기록 검증
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """임시 디렉토리 데이터베이스"""
+    return DatabaseManager(db_dir=str(tmp_path))
+
+
+def _fetch_anomaly(db: DatabaseManager, anomaly_id: str) -> dict:
+    """해제 관련 컬럼 조회"""
+    with db.get_connection() as conn:
+        row = conn.execute("""
+            SELECT status, cleared_at, cleared_by, duration_minutes
+            FROM vfd_anomaly_history WHERE anomaly_id = ?
+        """, (anomaly_id,)).fetchone()
+    return dict(row)
+
+
+@pytest.mark.parametrize('auto_clear', [False, True])
+def test_clear_vfd_anomaly_records_duration(db, auto_clear):
+    """해제 시 발생 시각 기준 지속 시간(분, 버림)과 해제 시각이 저장되어야 함"""
+    anomaly_id = db.insert_vfd_anomaly(
+        anomaly_id='ANO_SWP1_TEST', equipment_id='SW_PUMP_1',
+        severity_level=2, severity_name='경고', health_score=40
+    )
+
+    # 발생 시각을 알려진 값으로 고정 (insert_vfd_anomaly는 현재 시각으로 기록)
+    occurred_at = (datetime.now() - timedelta(minutes=90, seconds=30)).replace(microsecond=0)
+    with db.get_connection() as conn:
+        conn.execute(
+            "UPDATE vfd_anomaly_history SET occurred_at = ? WHERE anomaly_id = ?",
+            (occurred_at.isoformat(sep=' '), anomaly_id)
+        )
+
+    before = datetime.now()
+    if auto_clear:
+        db.auto_clear_vfd_anomaly(anomaly_id)
+    else:
+        db.clear_vfd_anomaly(anomaly_id, user='tester')
+    after = datetime.now()
+
+    row = _fetch_anomaly(db, anomaly_id)
+    assert row['status'] == ('AUTO_CLEARED' if auto_clear else 'CLEARED')
+    assert row['cleared_by'] == ('System' if auto_clear else 'tester')
+    assert row['duration_minutes'] == 90
+    assert before <= datetime.fromisoformat(row['cleared_at']) <= after
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 데이터베이스 스키마 테스트
+- 원본 센서 데이터 시간 단위 롤업 및 보관 기간 경과 데이터 삭제 검증
+- VFD 이상 징후 해제 시 지속 시간/해제 시각 기록 검증
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_schema import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """임시 파일 데이터베이스"""
+    return DatabaseManager(str(tmp_path / "test.db"))
+
+
+def _insert_sensor_rows(db: DatabaseManager, rows):
+    """(timestamp, T5, PX1) 원본 행 추가"""
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO sensor_data (timestamp, T5, PX1) VALUES (?, ?, ?)",
+        [(ts.strftime("%Y-%m-%d %H:%M:%S"), t5, px1) for ts, t5, px1 in rows]
+    )
+    conn.commit()
+    conn.close()
+
+
+def _fetch_hourly(db: DatabaseManager):
+    """시간 단위 롤업 결과 {hour: (T5 avg/min/max, PX1 avg/min/max, sample_count)}"""
+    conn = db.get_connection()
+    rows = conn.execute("""
+    SELECT hour, T5_avg, T5_min, T5_max, PX1_avg, PX1_min, PX1_max, sample_count
+    FROM sensor_data_hourly ORDER BY hour
+    """).fetchall()
+    conn.close()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def test_cleanup_old_data_rolls_up_before_deleting_raw_rows(db):
+    """보관 기간이 지난 원본 행은 시간 단위 AVG/MIN/MAX로 롤업된 뒤 삭제되어야 함"""
+    old_hour = (datetime.now() - timedelta(days=DatabaseManager.RAW_SENSOR_RETENTION_DAYS + 2)) \
+        .replace(minute=0, second=0, microsecond=0)
+    recent = (datetime.now() - timedelta(days=1)).replace(minute=30, second=0, microsecond=0)
+
+    _insert_sensor_rows(db, [
+        (old_hour, 10.0, 1.0),
+        (old_hour + timedelta(minutes=20), 20.0, 3.0),
+        (old_hour + timedelta(minutes=40), 30.0, 2.0),
+        (old_hour + timedelta(hours=1, minutes=5), 40.0, 4.0),
+        (recent, 25.0, 2.5),
+    ])
+
+    rolled_up, deleted_raw = db.cleanup_old_data()
+
+    assert rolled_up == 3
+    assert deleted_raw == 4
+
+    hourly = _fetch_hourly(db)
+    first_hour = old_hour.strftime("%Y-%m-%d %H:00:00")
+    second_hour = (old_hour + timedelta(hours=1)).strftime("%Y-%m-%d %H:00:00")
+    assert hourly[first_hour] == pytest.approx((20.0, 10.0, 30.0, 2.0, 1.0, 3.0, 3))
+    assert hourly[second_hour] == pytest.approx((40.0, 40.0, 40.0, 4.0, 4.0, 4.0, 1))
+    assert hourly[recent.strftime("%Y-%m-%d %H:00:00")] == pytest.approx((25.0, 25.0, 25.0, 2.5, 2.5, 2.5, 1))
+
+    # 보관 기간 내 원본 행은 유지
+    assert db.get_table_row_count('sensor_data') == 1
+
+
+def test_rollup_includes_late_rows_for_rolled_up_hours(db):
+    """이미 집계된 시간 구간에 늦게 도착한 행도 재집계에 반영되어야 함"""
+    hour = (datetime.now() - timedelta(hours=3)).replace(minute=0, second=0, microsecond=0)
+    _insert_sensor_rows(db, [(hour + timedelta(minutes=10), 10.0, 1.0)])
+    db.rollup_sensor_data_hourly()
+
+    _insert_sensor_rows(db, [(hour + timedelta(minutes=50), 30.0, 3.0)])
+    db.rollup_sensor_data_hourly()
+
+    assert _fetch_hourly(db)[hour.strftime("%Y-%m-%d %H:00:00")] == \
+        pytest.approx((20.0, 10.0, 30.0, 2.0, 1.0, 3.0, 2))
+
+
+@pytest.mark.parametrize('auto_clear', [False, True])
+def test_clear_vfd_anomaly_records_duration(db, auto_clear):
+    """해제 시 발생 시각 기준 지속 시간(분, 버림)과 해제 시각이 저장되어야 함"""
+    occurred_at = (datetime.now() - timedelta(minutes=90, seconds=30)).replace(microsecond=0)
+    assert db.insert_vfd_anomaly({
+        'anomaly_id': 'ANO_SWP1_TEST',
+        'equipment_id': 'SWP1',
+        'occurred_at': occurred_at,
+        'severity_level': 2,
+        'severity_name': '경고',
+        'health_score': 40,
+    })
+
+    before = datetime.now()
+    if auto_clear:
+        assert db.auto_clear_vfd_anomaly('SWP1')
+    else:
+        assert db.clear_vfd_anomaly('ANO_SWP1_TEST', user='tester')
+    after = datetime.now()
+
+    row = db.get_vfd_anomaly_history(
+        columns=('status', 'cleared_by', 'cleared_at', 'duration_minutes')
+    )[0]
+    assert row['status'] == ('AUTO_CLEARED' if auto_clear else 'CLEARED')
+    assert row['cleared_by'] == ('SYSTEM' if auto_clear else 'tester')
+    assert row['duration_minutes'] == 90
+    assert before <= datetime.fromisoformat(row['cleared_at']) <= after
+
+    # 이미 해제된 이상 징후는 다시 해제되지 않음
+    assert not db.clear_vfd_anomaly('ANO_SWP1_TEST')
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+공유 데이터 파일 Writer 테스트
+- 실제 VFD 진단/예측 결과(numpy 값 포함)의 JSON 저장 검증
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import src.adapter.shared_data_writer as shared_data_writer
+from src.adapter.shared_data_writer import SharedDataWriter
+from src.diagnostics.vfd_monitor import VFDMonitor, DanfossStatusBits
+from src.diagnostics.vfd_predictive_diagnosis import VFDPredictiveDiagnosis
+
+
+def _build_prediction(vfd_id: str = 'SW_PUMP_1', samples: int = 12):
+    """진단을 samples회 누적한 뒤 실제 예측 생성 (10회 이상이면 polyfit 기반 np.float64 값)"""
+    monitor = VFDMonitor()
+    predictive = VFDPredictiveDiagnosis()
+    status_bits = DanfossStatusBits(
+        trip=False, error=False, warning=False, voltage_exceeded=False,
+        torque_exceeded=False, thermal_exceeded=False, control_ready=True,
+        drive_ready=True, in_operation=True, speed_equals_reference=True, bus_control=True
+    )
+    start = datetime(2026, 10, 16, 12, 0, 0)
+
+    for i in range(samples):
+        diagnostic = monitor.diagnose_vfd(
+            vfd_id, status_bits,
+            frequency_hz=45.0, output_current_a=100.0 + i, output_voltage_v=400.0,
+            dc_bus_voltage_v=540.0, motor_temp_c=50.0 + i * 0.5, heatsink_temp_c=45.0 + i * 0.5,
+            now=start + timedelta(minutes=i)
+        )
+        prediction = predictive.predict(diagnostic)
+
+    return diagnostic, prediction
+
+
+@pytest.mark.parametrize('use_orjson', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(
+        not shared_data_writer.ORJSON_AVAILABLE, reason="orjson 미설치"
+    )),
+])
+def test_write_vfd_diagnostics_with_real_prediction(tmp_path, monkeypatch, use_orjson):
+    """numpy 예측값이 포함된 진단 결과도 저장되고 숫자로 읽혀야 함"""
+    monkeypatch.setattr(shared_data_writer, 'ORJSON_AVAILABLE', use_orjson)
+    diagnostic, prediction = _build_prediction()
+    assert isinstance(prediction.temp_rise_rate, float)
+
+    writer = SharedDataWriter(shared_dir=str(tmp_path))
+    writer.write_vfd_diagnostics({'SW_PUMP_1': diagnostic}, {'SW_PUMP_1': prediction})
+
+    with open(tmp_path / "vfd_diagnostics.json", encoding='utf-8') as f:
+        saved = json.load(f)
+
+    vfd_data = saved['vfd_diagnostics']['SW_PUMP_1']
+    assert saved['vfd_count'] == 1
+    assert vfd_data['temp_rise_rate'] == pytest.approx(float(prediction.temp_rise_rate))
+    assert vfd_data['predicted_temp_30min'] == pytest.approx(float(prediction.predicted_temp_30min))
+    assert vfd_data['temp_trend'] == prediction.temp_trend